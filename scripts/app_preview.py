@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Animated App Store App Preview / Play promo video.
+
+Each scene is one of the frames with motion added on top: CSS keyframes
+for reveals (badge grid, chat bubbles, headline) and count-ups for the
+hero numbers. Nothing plays in real time. The page's animations are
+paused and every video frame seeks them to t = n / fps through the Web
+Animations API (window.__vantagSeek), then the viewport is captured and
+written straight into an ffmpeg process's stdin. No frame touches the
+disk, and the output depends only on the frame rate, not on how fast
+the host renders; x264 runs with a fixed X264_THREADS, since its frame
+threading (sized from the CPU count by default) changes encoder
+decisions and so the bytes. The screencast stream was not used: it delivers
+frames when the compositor produces them, so both the timing and the
+number of frames change with machine load.
+
+The timeline is cut into fixed SEGMENT_SECONDS segments, which are
+rendered in parallel on pooled pages, each into its own H.264 segment.
+The segments are then joined without re-encoding and a silent stereo
+AAC track is added, as App Store Connect expects. Segment boundaries do
+not depend on --concurrency, so neither does the result.
+
+Requires ffmpeg (with libx264) on PATH.
+
+Usage:
+    python3 scripts/app_preview.py                          # iphone_6_9, base locale
+    python3 scripts/app_preview.py --slot play_phone --locale en
+    python3 scripts/app_preview.py 'appstore_[26]*' --fps 30 --lossless
+
+Output: docs/screenshots/previews/<locale>/<slot>.mp4
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+
+import frames
+import launch_tuner
+import render_trace
+from generate_screenshots import (
+    CACHE_DIR, LOCALE, OUT_DIR, W,
+    add_pool_arguments, available_locales, enable_page_features, frame_html, load_backend,
+    pool_options, settle_fonts,
+)
+
+# App Preview / promo video sizes (portrait).
+PREVIEW_SIZES = {
+    "iphone_6_9": (886, 1920),
+    "iphone_6_5": (886, 1920),
+    "ipad_13":    (1200, 1600),
+    "play_phone": (1080, 1920),
+}
+DEFAULT_FPS = 30
+SEGMENT_SECONDS = 2.0
+JPEG_QUALITY = 95
+FADE_MS = 300
+X264_THREADS = 4                # fixed, so the encode is the same on every host
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SCENES
+# ═══════════════════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class Scene:
+    """A frame plus its motion: `css` keyframes/animations appended to the
+    frame's stylesheet, `stagger` (selector, first ms, step ms) gives the
+    matched elements increasing --delay values, and `counters`
+    (selector, delay ms, duration ms) count numbers up from zero."""
+    frame: str
+    seconds: float
+    css: str = ""
+    stagger: tuple = ()
+    counters: tuple = ()
+
+
+MOTION_CSS = f"""
+html {{ background: #000; }}
+body {{ animation: scene-in {FADE_MS}ms ease-out both, scene-out {FADE_MS}ms ease-in
+        calc(var(--scene-ms) - {FADE_MS}ms) forwards; }}
+@keyframes scene-in {{ from {{ opacity: 0; }} }}
+@keyframes scene-out {{ to {{ opacity: 0; }} }}
+@keyframes rise {{ from {{ opacity: 0; transform: translateY(60px); }} }}
+@keyframes pop {{ 0% {{ opacity: 0; transform: scale(0.6); }} 70% {{ transform: scale(1.06); }} }}
+"""
+
+SCENES = [
+    Scene("appstore_1_hook", 3.0, css="""
+        .hook-emoji, .hook-line, .hook-equals, .hook-tagline, .logo-section {
+            animation: rise 600ms cubic-bezier(.2,.8,.2,1) var(--delay) both; }
+    """, stagger=((".hook-emoji, .hook-line, .hook-equals, .hook-tagline, .logo-section",
+                   150, 220),)),
+    Scene("appstore_2_home", 4.0, css="""
+        .hero-card { animation: pop 700ms cubic-bezier(.2,.8,.2,1) 300ms both; }
+        .expense-item { animation: rise 500ms ease-out var(--delay) both; }
+    """, stagger=((".expense-item", 1600, 150),),
+        counters=((".hero-num", 600, 1400),)),
+    Scene("appstore_5_badges", 4.0, css="""
+        .badge-card { animation: pop 450ms cubic-bezier(.2,.8,.2,1) var(--delay) both; }
+    """, stagger=((".badge-card", 400, 90),),
+        counters=((".badge-count span", 400, 1500),)),
+    Scene("appstore_6_ai_chat", 5.0, css="""
+        .msg { animation: rise 450ms cubic-bezier(.2,.8,.2,1) var(--delay) both; }
+    """, stagger=((".msg", 400, 900),)),
+]
+
+SETUP_JS = """(cfg) => {
+    for (const [selector, first, step] of cfg.stagger) {
+        document.querySelectorAll(selector).forEach(
+            (el, i) => el.style.setProperty('--delay', `${first + i * step}ms`));
+    }
+    const counters = [];
+    for (const [selector, delay, duration] of cfg.counters) {
+        for (const el of document.querySelectorAll(selector)) {
+            const m = el.textContent.match(/^(\\D*)(\\d+)([.,]\\d+)?([\\s\\S]*)$/);
+            if (!m) continue;
+            const [, pre, whole, frac, post] = m;
+            const decimals = frac ? frac.length - 1 : 0;
+            const target = parseFloat(whole + (frac ? '.' + frac.slice(1) : ''));
+            counters.push({el, pre, post, decimals, target, delay, duration,
+                           sep: frac ? frac[0] : '.'});
+        }
+    }
+    document.documentElement.style.setProperty('--scene-ms', `${cfg.sceneMs}ms`);
+    window.__vantagSeek = (ms) => {
+        for (const a of document.getAnimations()) { a.pause(); a.currentTime = ms; }
+        for (const c of counters) {
+            const t = Math.min(1, Math.max(0, (ms - c.delay) / c.duration));
+            const v = c.target * (1 - Math.pow(1 - t, 3));
+            c.el.textContent = c.pre + v.toFixed(c.decimals).replace('.', c.sep) + c.post;
+        }
+    };
+    return counters.length;
+}"""
+
+
+def scene_html(scene: Scene, locale: str) -> str:
+    return frame_html(frames.load(scene.frame), locale=locale, extra_css=MOTION_CSS + scene.css)
+
+
+def segments(scenes: list, fps: int) -> list:
+    """(scene index, first frame, end frame) in timeline order."""
+    step = max(1, round(SEGMENT_SECONDS * fps))
+    out = []
+    for i, scene in enumerate(scenes):
+        count = round(scene.seconds * fps)
+        out.extend((i, start, min(start + step, count)) for start in range(0, count, step))
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# ENCODING
+# ═══════════════════════════════════════════════════════════════════════════
+
+def find_ffmpeg() -> str:
+    path = shutil.which("ffmpeg")
+    if not path:
+        print("ERROR: ffmpeg not found on PATH.")
+        print("  apt install ffmpeg    # or: brew install ffmpeg")
+        sys.exit(1)
+    return path
+
+
+def segment_command(ffmpeg: str, fps: int, lossless: bool, crf: int, path: str) -> list:
+    return [
+        ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "image2pipe", "-framerate", str(fps),
+        "-c:v", "png" if lossless else "mjpeg", "-i", "-",
+        "-c:v", "libx264", "-threads", str(X264_THREADS),
+        "-preset", "medium", "-crf", str(crf),
+        "-pix_fmt", "yuv420p", "-profile:v", "high", "-level", "4.0",
+        "-r", str(fps), "-fflags", "+bitexact", "-flags:v", "+bitexact",
+        "-an", path,
+    ]
+
+
+def concat_command(ffmpeg: str, list_path: str, path: str) -> list:
+    return [
+        ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "concat", "-safe", "0", "-i", list_path,
+        "-f", "lavfi", "-i", "anullsrc=channel_layout=stereo:sample_rate=48000",
+        "-map", "0:v", "-map", "1:a", "-c:v", "copy",
+        "-c:a", "aac", "-b:a", "256k", "-shortest",
+        "-movflags", "+faststart", "-fflags", "+bitexact", path,
+    ]
+
+
+async def _finish(proc, what: str):
+    _, stderr = await proc.communicate()
+    if proc.returncode:
+        raise RuntimeError(f"ffmpeg failed on {what}: "
+                           f"{stderr.decode('utf-8', 'replace').strip()[-400:]}")
+
+
+async def render_segment(pool, scene: Scene, html: str, viewport: dict, scale: float,
+                         first: int, end: int, path: str, args) -> float:
+    """Seek-and-capture frames [first, end) of a scene into an encoder;
+    returns the seconds spent capturing."""
+    trace = render_trace.tracer
+    attrs = {"frame": scene.frame, "segment": first}
+    kind, quality = ("png", None) if args.lossless else ("jpeg", JPEG_QUALITY)
+    cmd = segment_command(args.ffmpeg, args.fps, args.lossless, args.crf, path)
+    capturing = 0.0
+    async with pool.page(viewport, scale) as page:
+        with trace.span("preview.load", **attrs):
+            await page.set_content(html, wait_until="domcontentloaded")
+            await page.evaluate(SETUP_JS, {
+                "stagger": [list(s) for s in scene.stagger],
+                "counters": [list(c) for c in scene.counters],
+                "sceneMs": round(scene.seconds * 1000),
+            })
+            await settle_fonts(page)                 # same settle as render_png
+        # The encoder starts once a page is free, so at most one ffmpeg
+        # runs per pooled page.
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE)
+        try:
+            for n in range(first, end):
+                started = time.perf_counter()
+                with trace.span("preview.frame", n=n, **attrs):
+                    await page.evaluate(f"window.__vantagSeek({n * 1000 / args.fps})")
+                    image = await launch_tuner.screenshot(page, kind, quality)
+                capturing += time.perf_counter() - started
+                proc.stdin.write(image)
+                await proc.stdin.drain()
+        except BaseException:
+            proc.kill()
+            await proc.wait()
+            raise
+    proc.stdin.close()
+    await _finish(proc, os.path.basename(path))
+    return capturing
+
+
+async def render_preview(scenes: list, locale: str, slot: str, args) -> str:
+    from browser_pool import BrowserPool
+
+    width, height = PREVIEW_SIZES[slot]
+    scale = width / W
+    viewport = {"width": W, "height": round(height / scale)}
+    pages = [scene_html(scene, locale) for scene in scenes]
+    plan = segments(scenes, args.fps)
+    out_path = os.path.join(OUT_DIR, "previews", locale, f"{slot}.mp4")
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="preview-", dir=CACHE_DIR) as work:
+        paths = [os.path.join(work, f"{k:04d}.mp4") for k in range(len(plan))]
+        async with load_backend(args)() as p:
+            async with BrowserPool(p, **pool_options(args)) as pool:
+                capture = await asyncio.gather(*(
+                    render_segment(pool, scenes[i], pages[i], viewport, scale,
+                                   first, end, path, args)
+                    for (i, first, end), path in zip(plan, paths)))
+                print(f"  {pool.format_metrics()}")
+        list_path = os.path.join(work, "segments.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            f.writelines(f"file '{path}'\n" for path in paths)
+        proc = await asyncio.create_subprocess_exec(
+            *concat_command(args.ffmpeg, list_path, out_path),
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE)
+        await _finish(proc, "concat")
+    elapsed = time.perf_counter() - started
+
+    count = sum(end - first for _, first, end in plan)
+    seconds = count / args.fps
+    print(f"  {locale:<4} {slot:<12} {width} × {height}  {seconds:.1f}s @ {args.fps} fps  "
+          f"{len(plan)} segments  {elapsed:.1f}s wall ({seconds / elapsed:.2f}× real time, "
+          f"{count / elapsed:.1f} fps; capture {1000 * sum(capture) / count:.0f} ms/frame)")
+    print(f"        MP4 → {os.path.relpath(out_path, OUT_DIR)}  "
+          f"({os.path.getsize(out_path) / (1024 * 1024):.1f} MB)")
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render animated App Preview videos.")
+    parser.add_argument("frames", nargs="*", help="frame name globs selecting scenes (default: all)")
+    parser.add_argument("--slot", nargs="*", choices=sorted(PREVIEW_SIZES), default=["iphone_6_9"])
+    parser.add_argument("--locale", nargs="*", default=[LOCALE],
+                        help=f"locales (default: {LOCALE}; 'all' for every locale)")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS)
+    parser.add_argument("--crf", type=int, default=18, help="x264 quality (lower is better)")
+    parser.add_argument("--lossless", action="store_true",
+                        help="pipe PNG instead of JPEG frames into the encoder")
+    add_pool_arguments(parser)
+    args = parser.parse_args()
+    if args.trace:
+        render_trace.enable(args.trace)
+    else:
+        render_trace.enable_from_env()
+
+    selected = frames.match([s.frame for s in SCENES], args.frames) if args.frames else None
+    scenes = [s for s in SCENES if selected is None or s.frame in selected]
+    if not scenes:
+        print(f"ERROR: no scene matches {', '.join(args.frames)}")
+        print(f"  available: {', '.join(s.frame for s in SCENES)}")
+        sys.exit(1)
+    args.ffmpeg = find_ffmpeg()
+    asyncio.run(enable_page_features(args))
+    locales = available_locales() if args.locale == ["all"] else args.locale
+
+    print("Vantag App Preview")
+    print(f"{'=' * 52}")
+    print(f"  Scenes : {', '.join(f'{s.frame} ({s.seconds:g}s)' for s in scenes)}")
+    for locale in locales:
+        for slot in args.slot:
+            asyncio.run(render_preview(scenes, locale, slot, args))
+    if render_trace.tracer.enabled:
+        render_trace.tracer.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+Adaptive Playwright browser pool for the screenshot renderer.
+
+Sizes render concurrency from the cores and memory actually available to
+this process (CPU affinity, cgroup limits, MemAvailable), hands out
+ready-to-use pages and recycles pages, contexts and whole browsers after a
+number of renders or once Chromium's resident memory crosses a threshold.
+This keeps peak memory flat on long runs (thousands of 1320×2868 pages)
+without over-subscribing small CI runners.
+
+With `user_data_dir` the browser starts from a persistent profile (see
+warm_profile.py); slots then share its one context and are sized per page.
+The profile is locked by its one browser process, so recycling it drains
+every slot first and then relaunches on the same profile.
+
+Usage (from an async Playwright session):
+
+    async with BrowserPool(p, viewport={"width": W, "height": H}) as pool:
+        async with pool.page() as page:
+            await page.set_content(html)
+            await page.screenshot(path=...)
+        print(pool.format_metrics())
+"""
+
+import asyncio
+import contextlib
+import os
+import time
+
+# Rough per-page budget for a 1320×2868 page at device_scale_factor=1:
+# renderer process + compositor tiles + screenshot buffers.
+PAGE_MEMORY_BUDGET_MB = 320
+# Memory kept free for Python, the Playwright driver and the browser process.
+RESERVED_MEMORY_MB = 768
+
+DEFAULT_PAGE_RENDERS = 50
+DEFAULT_CONTEXT_RENDERS = 200
+DEFAULT_BROWSER_RENDERS = 1000
+DEFAULT_MAX_RSS_MB = 4096
+RSS_CHECK_EVERY = 10
+
+CHROMIUM_PROCESS_NAMES = ("chrome", "chromium", "headless_shell")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# HOST RESOURCES
+# ═══════════════════════════════════════════════════════════════════════════
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects affinity and cgroup quota)."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    # cgroup v2 CPU quota, e.g. "200000 100000" → 2 CPUs
+    try:
+        with open("/sys/fs/cgroup/cpu.max", encoding="ascii") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return max(1, cpus)
+
+
+def available_memory_mb():
+    """Memory available for new work in MB, or None if it cannot be read."""
+    available = None
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    available = int(line.split()[1]) // 1024
+                    break
+    except OSError:
+        pass
+
+    if available is None:
+        try:
+            import psutil
+            available = psutil.virtual_memory().available // (1024 * 1024)
+        except ImportError:
+            pass
+
+    # Containers: the cgroup limit is what actually triggers the OOM killer.
+    try:
+        with open("/sys/fs/cgroup/memory.max", encoding="ascii") as f:
+            limit = f.read().strip()
+        with open("/sys/fs/cgroup/memory.current", encoding="ascii") as f:
+            current = int(f.read().strip())
+        if limit != "max":
+            headroom = (int(limit) - current) // (1024 * 1024)
+            available = headroom if available is None else min(available, headroom)
+    except (OSError, ValueError):
+        pass
+
+    return available
+
+
+def total_memory_mb():
+    """Installed memory in MB, capped by the cgroup limit; None if unknown.
+    Unlike available_memory_mb() it does not move between runs."""
+    total = None
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemTotal:"):
+                    total = int(line.split()[1]) // 1024
+                    break
+    except OSError:
+        pass
+
+    if total is None:
+        try:
+            import psutil
+            total = psutil.virtual_memory().total // (1024 * 1024)
+        except ImportError:
+            pass
+
+    try:
+        with open("/sys/fs/cgroup/memory.max", encoding="ascii") as f:
+            limit = f.read().strip()
+        if limit != "max":
+            limit = int(limit) // (1024 * 1024)
+            total = limit if total is None else min(total, limit)
+    except (OSError, ValueError):
+        pass
+
+    return total
+
+
+def recommended_concurrency(page_budget_mb: int = PAGE_MEMORY_BUDGET_MB) -> int:
+    """Number of pages to render in parallel on this host."""
+    cpus = available_cpus()
+    memory = available_memory_mb()
+    if memory is None:
+        return cpus
+    by_memory = max(1, (memory - RESERVED_MEMORY_MB) // page_budget_mb)
+    return max(1, min(cpus, by_memory))
+
+
+def chromium_rss_by_browser():
+    """Resident memory of Chromium processes spawned by us, in MB, keyed by
+    the pid of the browser process each one belongs to.
+
+    Walks /proc for descendants of this process (Playwright driver →
+    Chromium); a process is charged to its topmost Chromium ancestor.
+    Returns None where /proc is unavailable and psutil is not installed.
+    """
+    root = os.getpid()
+    parents, names, rss = {}, {}, {}
+    if os.path.isdir("/proc"):
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", encoding="ascii", errors="replace") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            pid = int(entry)
+            # comm may contain spaces; it is wrapped in parentheses
+            comm = stat[stat.find("(") + 1:stat.rfind(")")]
+            fields = stat[stat.rfind(")") + 2:].split()
+            parents[pid] = int(fields[1])
+            names[pid] = comm
+            rss[pid] = int(fields[21]) * os.sysconf("SC_PAGE_SIZE")
+    else:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        for child in psutil.Process(root).children(recursive=True):
+            with contextlib.suppress(psutil.Error):
+                parents[child.pid] = child.ppid()
+                names[child.pid] = child.name()
+                rss[child.pid] = child.memory_info().rss
+
+    def is_chromium(pid):
+        return any(n in names.get(pid, "").lower() for n in CHROMIUM_PROCESS_NAMES)
+
+    totals = {}
+    for pid in names:
+        if not is_chromium(pid):
+            continue
+        browser, ancestor = pid, parents.get(pid)
+        while ancestor and ancestor != root:
+            if is_chromium(ancestor):
+                browser = ancestor
+            ancestor = parents.get(ancestor)
+        if ancestor == root:
+            totals[browser] = totals.get(browser, 0.0) + rss[pid] / (1024 * 1024)
+    return totals
+
+
+def chromium_rss_mb():
+    """Total resident memory of Chromium processes spawned by us, in MB;
+    None where it cannot be measured."""
+    by_browser = chromium_rss_by_browser()
+    return None if by_browser is None else sum(by_browser.values())
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# POOL
+# ═══════════════════════════════════════════════════════════════════════════
+
+class _ProfileContext:
+    """A slot's view of the shared persistent context: its own pages, sized
+    per page through CDP emulation, closed without closing the profile."""
+
+    def __init__(self, shared, viewport, device_scale_factor):
+        self.shared = shared
+        self.viewport = viewport
+        self.device_scale_factor = device_scale_factor
+        self.pages = []
+
+    async def route(self, pattern, handler):
+        if pattern not in self.shared.routes:
+            self.shared.routes.add(pattern)
+            await self.shared.context.route(pattern, handler)
+
+    async def new_page(self):
+        page = await self.shared.context.new_page()
+        cdp = await self.shared.context.new_cdp_session(page)
+        await cdp.send("Emulation.setDeviceMetricsOverride", {
+            "width": self.viewport["width"], "height": self.viewport["height"],
+            "deviceScaleFactor": self.device_scale_factor, "mobile": False,
+        })
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        for page in self.pages:
+            with contextlib.suppress(Exception):
+                await page.close()
+        self.pages.clear()
+
+
+class _PersistentBrowser:
+    """Browser-shaped wrapper around launch_persistent_context(): every
+    slot shares the on-disk profile (and its caches) in one context."""
+
+    def __init__(self, context):
+        self.context = context
+        self.routes = set()
+        browser = getattr(context, "browser", None)
+        self.version = getattr(browser, "version", "") if browser else ""
+
+    async def new_context(self, viewport: dict, device_scale_factor: float = 1):
+        return _ProfileContext(self, viewport, device_scale_factor)
+
+    async def close(self):
+        await self.context.close()
+
+
+class _BrowserHandle:
+    """A launched browser plus its render count, live slot count and the
+    pids of its browser processes."""
+
+    def __init__(self, browser, pids=()):
+        self.browser = browser
+        self.pids = set(pids)
+        self.renders = 0
+        self.slots = 0
+        self.retired = False
+        self.closed = asyncio.Event()
+
+
+class _Slot:
+    """One context with one page, owned by a single render at a time."""
+
+    def __init__(self, key, handle, context, page):
+        self.key = key
+        self.handle = handle
+        self.context = context
+        self.page = page
+        self.page_renders = 0
+        self.context_renders = 0
+
+
+class BrowserPool:
+    """Bounded pool of Chromium pages with render/RSS based recycling."""
+
+    def __init__(
+        self,
+        playwright,
+        viewport: dict,
+        device_scale_factor: float = 1,
+        concurrency: int = 0,
+        page_renders: int = DEFAULT_PAGE_RENDERS,
+        context_renders: int = DEFAULT_CONTEXT_RENDERS,
+        browser_renders: int = DEFAULT_BROWSER_RENDERS,
+        max_rss_mb: int = DEFAULT_MAX_RSS_MB,
+        launch_options: dict = None,
+        context_setup=None,
+        user_data_dir: str = None,
+    ):
+        self.playwright = playwright
+        self.viewport = viewport
+        self.device_scale_factor = device_scale_factor
+        self.size = concurrency or recommended_concurrency()
+        self.page_renders = page_renders
+        self.context_renders = context_renders
+        self.browser_renders = browser_renders
+        self.max_rss_mb = max_rss_mb
+        self.launch_options = launch_options or {}
+        self.context_setup = context_setup
+        self.user_data_dir = user_data_dir
+
+        self._semaphore = asyncio.Semaphore(self.size)
+        self._launch_lock = asyncio.Lock()
+        self._idle = {}
+        self._current = None
+        self._handles = []
+
+        self._started = time.perf_counter()
+        self._busy_seconds = 0.0
+        self._wait_seconds = 0.0
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._renders = 0
+        self._recycled = {"page": 0, "context": 0, "browser": 0}
+        self._rss_mb = None
+        self._peak_rss_mb = None
+        self._launch_ms = None
+        self._first_frame_ms = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ── Public API ──
+
+    @contextlib.asynccontextmanager
+    async def page(self, viewport: dict = None, device_scale_factor: float = None):
+        """Borrow a page for one render; recycles it afterwards as needed.
+
+        Pages are pooled per viewport/scale profile, defaulting to the
+        pool's own.
+        """
+        key = (
+            tuple(sorted((viewport or self.viewport).items())),
+            device_scale_factor or self.device_scale_factor,
+        )
+        waited = time.perf_counter()
+        async with self._semaphore:
+            acquired = time.perf_counter()
+            self._wait_seconds += acquired - waited
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+
+            slot = await self._acquire_slot(key)
+            failed = False
+            try:
+                yield slot.page
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                self._in_use -= 1
+                self._busy_seconds += time.perf_counter() - acquired
+                await self._release_slot(slot, failed)
+
+    def metrics(self) -> dict:
+        """Pool utilization and recycling counters."""
+        elapsed = time.perf_counter() - self._started
+        capacity = self.size * elapsed
+        return {
+            "size": self.size,
+            "in_use": self._in_use,
+            "peak_in_use": self._peak_in_use,
+            "renders": self._renders,
+            "utilization": self._busy_seconds / capacity if capacity else 0.0,
+            "avg_wait_ms": 1000 * self._wait_seconds / self._renders if self._renders else 0.0,
+            "browsers_live": sum(1 for h in self._handles if h.slots or h is self._current),
+            "recycled": dict(self._recycled),
+            "rss_mb": self._rss_mb,
+            "peak_rss_mb": self._peak_rss_mb,
+            "launch_ms": self._launch_ms,
+            "first_frame_ms": self._first_frame_ms,
+            "elapsed_s": elapsed,
+        }
+
+    def format_metrics(self) -> str:
+        m = self.metrics()
+        rss = "n/a" if m["peak_rss_mb"] is None else f"{m['peak_rss_mb']:.0f} MB"
+        return (
+            f"pool {m['size']} pages · {m['renders']} renders · "
+            f"util {m['utilization']:.0%} · peak in use {m['peak_in_use']} · "
+            f"avg wait {m['avg_wait_ms']:.0f} ms · peak RSS {rss} · "
+            f"recycled {m['recycled']['page']}p/{m['recycled']['context']}c/"
+            f"{m['recycled']['browser']}b"
+        )
+
+    async def close(self):
+        for slots in self._idle.values():
+            for slot in slots:
+                await self._close_slot(slot)
+        self._idle.clear()
+        for handle in self._handles:
+            with contextlib.suppress(Exception):
+                await handle.browser.close()
+            handle.closed.set()
+        self._handles.clear()
+        self._current = None
+
+    # ── Internals ──
+
+    async def _launch(self) -> _BrowserHandle:
+        started = time.perf_counter()
+        before = chromium_rss_by_browser() or {}
+        if self.user_data_dir:
+            browser = _PersistentBrowser(await self.playwright.chromium.launch_persistent_context(
+                self.user_data_dir, no_viewport=True, **self.launch_options))
+        else:
+            browser = await self.playwright.chromium.launch(**self.launch_options)
+        if self._launch_ms is None:
+            self._launch_ms = 1000 * (time.perf_counter() - started)
+        handle = _BrowserHandle(browser, set(chromium_rss_by_browser() or {}) - set(before))
+        self._handles.append(handle)
+        return handle
+
+    async def _current_browser(self) -> _BrowserHandle:
+        async with self._launch_lock:
+            if self._current is None or self._current.retired:
+                if self.user_data_dir and self._current is not None:
+                    await self._drain(self._current)
+                self._current = await self._launch()
+            return self._current
+
+    async def _drain(self, handle: _BrowserHandle):
+        """Wait until a retired browser has closed: its idle slots are
+        closed now, busy ones as their renders release them."""
+        for key, slots in list(self._idle.items()):
+            mine = [s for s in slots if s.handle is handle]
+            self._idle[key] = [s for s in slots if s.handle is not handle]
+            for slot in mine:
+                await self._close_slot(slot)
+        if handle.slots == 0 and handle in self._handles:
+            await self._close_browser(handle)
+        await handle.closed.wait()
+
+    async def _new_slot(self, key) -> _Slot:
+        handle = await self._current_browser()
+        # Counted up front so a concurrent release cannot close the browser
+        # under us; given back if the slot cannot be built.
+        handle.slots += 1
+        viewport, scale = key
+        context = None
+        try:
+            context = await handle.browser.new_context(
+                viewport=dict(viewport),
+                device_scale_factor=scale,
+            )
+            if self.context_setup:
+                await self.context_setup(context)
+            page = await context.new_page()
+        except BaseException:
+            if context is not None:
+                with contextlib.suppress(Exception):
+                    await context.close()
+            await self._drop_slot(handle)
+            raise
+        return _Slot(key, handle, context, page)
+
+    async def _acquire_slot(self, key) -> _Slot:
+        idle = self._idle.get(key, [])
+        while idle:
+            slot = idle.pop()
+            if not slot.handle.retired:
+                return slot
+            await self._close_slot(slot)
+        # Keep total open pages bounded: drop an idle slot of another profile.
+        others = [k for k, slots in self._idle.items() if slots]
+        if others and sum(len(s) for s in self._idle.values()) >= self.size:
+            await self._close_slot(self._idle[others[0]].pop())
+        return await self._new_slot(key)
+
+    async def _release_slot(self, slot: _Slot, failed: bool):
+        if self._first_frame_ms is None and not failed:
+            self._first_frame_ms = 1000 * (time.perf_counter() - self._started)
+        self._renders += 1
+        slot.page_renders += 1
+        slot.context_renders += 1
+        slot.handle.renders += 1
+
+        if slot.handle.renders >= self.browser_renders:
+            self._retire(slot.handle)
+        elif self._renders % RSS_CHECK_EVERY == 0:
+            self._check_rss()
+
+        if failed or slot.handle.retired or slot.context_renders >= self.context_renders:
+            if not slot.handle.retired:
+                self._recycled["context"] += 1
+            await self._close_slot(slot)
+            return
+
+        if slot.page_renders >= self.page_renders:
+            self._recycled["page"] += 1
+            with contextlib.suppress(Exception):
+                await slot.page.close()
+            try:
+                slot.page = await slot.context.new_page()
+            except Exception:
+                # No page to hand out: drop the slot so its browser's
+                # count (and the profile, once drained) is given back.
+                await self._close_slot(slot)
+                return
+            slot.page_renders = 0
+
+        self._idle.setdefault(slot.key, []).append(slot)
+
+    def _retire(self, handle: _BrowserHandle):
+        if not handle.retired:
+            handle.retired = True
+            self._recycled["browser"] += 1
+
+    def _check_rss(self):
+        by_browser = chromium_rss_by_browser()
+        if by_browser is None:
+            return
+        rss = sum(by_browser.values())
+        self._rss_mb = rss
+        self._peak_rss_mb = max(self._peak_rss_mb or 0.0, rss)
+        # Retired browsers are already draining; only what is still taking
+        # new work counts against the limit.
+        draining = sum(by_browser.get(pid, 0.0)
+                       for h in self._handles if h.retired for pid in h.pids)
+        if rss - draining > self.max_rss_mb and self._current is not None:
+            # Retire the browser new work is going to; its slots drain and
+            # the process exits once the last one is released.
+            self._retire(self._current)
+
+    async def _close_slot(self, slot: _Slot):
+        with contextlib.suppress(Exception):
+            await slot.context.close()
+        await self._drop_slot(slot.handle)
+
+    async def _drop_slot(self, handle: _BrowserHandle):
+        handle.slots -= 1
+        if handle.retired and handle.slots == 0:
+            await self._close_browser(handle)
+
+    async def _close_browser(self, handle: _BrowserHandle):
+        self._handles.remove(handle)
+        with contextlib.suppress(Exception):
+            await handle.browser.close()
+        handle.closed.set()
@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Build graph for the render → optimize → package pipeline.
+
+Every artifact is a node with declared inputs and a content-hash key:
+
+    html      (frame, locale)          page source
+    png       (frame, locale, device)  Chromium (or native) render
+    optimize  (frame, locale, device)  lossless re-encode → store output
+    jpeg      (frame, locale, device)  sRGB JPEG alongside the PNG
+    resize    (frame, locale, target)  marketing / thumbnail sizes
+    validate                           store-spec check of the outputs
+    bundle                             store upload ZIP
+    social    (page)                   1200 × 630 Open Graph card of a docs page
+
+A node's key hashes its kind, version, parameters and its inputs' keys;
+the html key hashes the page itself. Outputs live in a content-addressed
+store (.screenshot_cache/build/objects/) and are copied to their usual
+paths only when those differ. Nodes run in topological order on a
+bounded worker pool; a node whose key is already in the store is not
+rebuilt, so an unchanged subgraph costs a hash and a stat. Editing one
+locale's headline changes that locale's html keys and rebuilds only
+that locale's chain (plus the aggregate validate/bundle nodes).
+Chromium is started only if some png node is stale.
+
+Usage:
+    python3 scripts/generate_screenshots.py --build
+    python3 scripts/generate_screenshots.py --build --targets optimize jpeg resize bundle --locale '*'
+    python3 scripts/generate_screenshots.py --build --plan       # stale/fresh per node, no browser
+    python3 scripts/generate_screenshots.py --build --targets social     # docs/og/ cards only
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass, field
+
+import design_tokens
+import frames
+import render_trace
+from generate_screenshots import (
+    CACHE_DIR, DEVICE, enable_page_features, frame_html, html_source_path,
+    load_backend, output_path, pool_options, render_png, tag_srgb,
+)
+
+BUILD_DIR = os.path.join(CACHE_DIR, "build")
+OBJECTS_DIR = os.path.join(BUILD_DIR, "objects")
+STATE_PATH = os.path.join(BUILD_DIR, "state.json")
+REPORT_PATH = os.path.join(CACHE_DIR, "asset_report.json")
+
+TARGETS = ("png", "optimize", "jpeg", "resize", "validate", "bundle", "social")
+DEFAULT_TARGETS = ("optimize", "validate")
+
+# Bump a kind's version when its builder changes output for the same inputs.
+VERSIONS = {"html": 1, "png": 1, "optimize": 1, "jpeg": 1, "resize": 1,
+            "validate": 1, "bundle": 1, "social": 1}
+
+JPEG_QUALITY = 92
+# Same names (and paths) as vector_masters' raster targets, so either
+# producer fills them; resized from the base device's render.
+RESIZE_TARGETS = {"marketing_1080": 1080, "thumbnail_400": 400}
+
+
+class BuildError(Exception):
+    """A node failed in a way that should fail the build (not a crash)."""
+
+
+@dataclass(eq=False)
+class Node:
+    id: str
+    kind: str
+    inputs: tuple = ()
+    params: dict = field(default_factory=dict)
+    dest: str = None            # where the output is materialized, if anywhere
+    ext: str = "bin"
+    extra_key: object = None    # callable → str, evaluated when the key is needed
+    key: str = None
+    status: str = "pending"     # built | cached | failed | blocked
+    seconds: float = 0.0
+
+    @property
+    def object_path(self) -> str:
+        return os.path.join(OBJECTS_DIR, self.key[:2], f"{self.key}.{self.ext}")
+
+
+def load_pillow():
+    try:
+        from PIL import Image, ImageCms
+    except ImportError:
+        print("ERROR: Pillow is required for the optimize/jpeg/resize steps.")
+        print("  pip install pillow --break-system-packages")
+        sys.exit(1)
+    return Image, ImageCms
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GRAPH
+# ═══════════════════════════════════════════════════════════════════════════
+
+class BuildGraph:
+    def __init__(self):
+        self.nodes = {}
+
+    def add(self, node: Node) -> Node:
+        return self.nodes.setdefault(node.id, node)
+
+    def order(self) -> list:
+        """Nodes in topological order (inputs before dependents)."""
+        seen, out = set(), []
+
+        def visit(node_id, path=()):
+            if node_id in seen:
+                return
+            if node_id in path:
+                raise BuildError(f"cycle: {' → '.join(path + (node_id,))}")
+            for dep in self.nodes[node_id].inputs:
+                visit(dep, path + (node_id,))
+            seen.add(node_id)
+            out.append(self.nodes[node_id])
+
+        for node_id in self.nodes:
+            visit(node_id)
+        return out
+
+    def compute_key(self, node: Node) -> str:
+        h = hashlib.sha256()
+        h.update(json.dumps([node.kind, VERSIONS[node.kind], node.params],
+                            sort_keys=True, ensure_ascii=False).encode("utf-8"))
+        for dep in node.inputs:
+            h.update(self.nodes[dep].key.encode("ascii"))
+        if node.extra_key:
+            h.update(node.extra_key().encode("utf-8"))
+        node.key = h.hexdigest()[:32]
+        return node.key
+
+
+def plan_graph(cells, targets, ctx) -> BuildGraph:
+    """Nodes for the selected (frame, locale, device) cells and targets."""
+    graph = BuildGraph()
+    outputs = []
+
+    # Social cards are per docs page, not per cell.
+    for name, locale, device in (cells if targets - {"social"} else ()):
+        html = graph.add(Node(f"html:{locale}/{name}", "html", ext="html",
+                              params={"frame": name, "locale": locale},
+                              dest=html_source_path(name, locale)))
+        if html.extra_key is None:
+            html.extra_key = lambda n=name, l=locale: ctx.html_digest(n, l)
+
+        cell = f"{locale}/{device}/{name}"
+        png = graph.add(Node(f"png:{cell}", "png", (html.id,), ext="png", params={
+            "device": device, "native": ctx.is_native(name)}))
+        if png.params["native"] and png.extra_key is None:
+            png.extra_key = lambda: design_tokens.load_table().digest
+        if targets == {"png"}:
+            png.dest = output_path(name, locale, device)
+            outputs.append(png)
+            continue
+
+        opt = graph.add(Node(f"optimize:{cell}", "optimize", (png.id,), ext="png",
+                             dest=output_path(name, locale, device)))
+        outputs.append(opt)
+        if "jpeg" in targets:
+            outputs.append(graph.add(Node(
+                f"jpeg:{cell}", "jpeg", (opt.id,), ext="jpg",
+                params={"quality": JPEG_QUALITY},
+                dest=output_path(name, locale, device, "jpg"))))
+        if "resize" in targets and device == DEVICE:
+            for target, width in RESIZE_TARGETS.items():
+                graph.add(Node(f"resize:{locale}/{target}/{name}", "resize", (opt.id,),
+                               ext="png", params={"width": width},
+                               dest=output_path(name, locale, target)))
+
+    store_outputs = tuple(n.id for n in outputs)
+    if "validate" in targets:
+        graph.add(Node("validate", "validate", store_outputs, ext="json", dest=REPORT_PATH,
+                       params={"paths": [n.dest for n in outputs]}))
+    if "bundle" in targets:
+        import package_bundle
+        bundle = graph.add(Node("bundle", "bundle", store_outputs, ext="zip",
+                                dest=package_bundle.DEFAULT_ZIP,
+                                params={"stores": sorted(package_bundle.STORE_SLOTS)}))
+        # The bundle also packages cells outside this selection that are
+        # already on disk, so their stats are part of its key.
+        bundle.extra_key = ctx.bundle_fingerprint
+    if "social" in targets:
+        import social_cards
+        for card in social_cards.discover():
+            graph.add(Node(f"social:{card.name}", "social", ext="png",
+                           params={"page": card.page, "size": list(social_cards.SOCIAL_SIZE)},
+                           dest=social_cards.card_path(card),
+                           extra_key=lambda c=card: ctx.card_digest(c)))
+    return graph
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BUILDERS  (node, input object paths, output path)
+# ═══════════════════════════════════════════════════════════════════════════
+
+async def build_html(node, inputs, out, ctx):
+    with open(out, "w", encoding="utf-8") as f:
+        f.write(ctx.html(node.params["frame"], node.params["locale"]))
+
+
+async def build_png(node, inputs, out, ctx):
+    html_node = ctx.graph.nodes[node.inputs[0]]
+    name, locale = html_node.params["frame"], html_node.params["locale"]
+    device = node.params["device"]
+    attrs = {"frame": name, "locale": locale, "device": device}
+    if node.params["native"]:
+        import native_compositor
+        sizes = ctx.fitted_sizes(name, locale)
+        png = await asyncio.to_thread(native_compositor.render_native,
+                                      frames.load(name), locale, device, sizes=sizes)
+    else:
+        png = await render_png(await ctx.pool(), ctx.html(name, locale), attrs, device)
+    with open(out, "wb") as f:
+        f.write(png)
+
+
+def _optimize(src, out):
+    with open(src, "rb") as f:
+        _optimize_bytes(f.read(), out)
+
+
+def _optimize_bytes(original, out):
+    Image, _ = load_pillow()
+    buf = io.BytesIO()
+    Image.open(io.BytesIO(original)).save(buf, "PNG", optimize=True)
+    optimized = tag_srgb(buf.getvalue())
+    with open(out, "wb") as f:
+        f.write(optimized if len(optimized) < len(original) else original)
+
+
+def _srgb_icc() -> bytes:
+    _, ImageCms = load_pillow()
+    return ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+
+
+def _jpeg(src, out, quality):
+    Image, _ = load_pillow()
+    Image.open(src).convert("RGB").save(out, "JPEG", quality=quality, optimize=True,
+                                        progressive=True, icc_profile=_srgb_icc())
+
+
+def _resize(src, out, width):
+    Image, _ = load_pillow()
+    img = Image.open(src).convert("RGB")
+    height = round(img.height * width / img.width)
+    buf = io.BytesIO()
+    img.resize((width, height), Image.LANCZOS).save(buf, "PNG", optimize=True)
+    with open(out, "wb") as f:
+        f.write(tag_srgb(buf.getvalue()))
+
+
+async def build_social(node, inputs, out, ctx):
+    import social_cards
+    card = ctx.card(node.params["page"])
+    png = await render_png(await ctx.pool(), social_cards.card_html(card),
+                           {"page": card.page, "locale": card.locale},
+                           profile=social_cards.card_profile())
+    await asyncio.to_thread(_optimize_bytes, png, out)
+
+
+async def build_optimize(node, inputs, out, ctx):
+    await asyncio.to_thread(_optimize, inputs[0], out)
+
+
+async def build_jpeg(node, inputs, out, ctx):
+    await asyncio.to_thread(_jpeg, inputs[0], out, node.params["quality"])
+
+
+async def build_resize(node, inputs, out, ctx):
+    await asyncio.to_thread(_resize, inputs[0], out, node.params["width"])
+
+
+async def build_validate(node, inputs, out, ctx):
+    import validate_assets
+    report = await asyncio.to_thread(validate_assets.validate, node.params["paths"])
+    if not report["ok"]:
+        with open(REPORT_PATH, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        raise BuildError(f"{report['failed']}/{report['checked']} assets fail store "
+                         f"specs → {REPORT_PATH}")
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+async def build_bundle(node, inputs, out, ctx):
+    import package_bundle
+
+    def write():
+        entries = package_bundle.plan_entries(node.params["stores"], ctx.all_locales)
+        package_bundle.assign_digests(entries)
+        package_bundle.write_zip(entries, out)
+
+    await asyncio.to_thread(write)
+
+
+BUILDERS = {
+    "html": build_html,
+    "png": build_png,
+    "optimize": build_optimize,
+    "jpeg": build_jpeg,
+    "resize": build_resize,
+    "validate": build_validate,
+    "bundle": build_bundle,
+    "social": build_social,
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════
+
+class BuildContext:
+    """Shared, lazily created state: HTML, text fitting, the browser pool."""
+
+    def __init__(self, args, cells):
+        self.args = args
+        self.cells = cells
+        self.graph = None
+        self._html = {}
+        self._fit = None
+        self._cards = None
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+        self._stack = None
+        from generate_screenshots import available_locales
+        self.all_locales = available_locales()
+
+    def is_native(self, name: str) -> bool:
+        native = self.args.native
+        if native is None:
+            return False
+        import native_compositor
+        return native_compositor.supports(frames.load(name)) and (not native or name in native)
+
+    def _fit_inputs(self):
+        locales = sorted({l for _, l, _ in self.cells})
+        specs = [frames.load(n) for n in dict.fromkeys(n for n, _, _ in self.cells)]
+        return locales, specs
+
+    async def prepare(self):
+        """Enable the page-level flags and fit text before any key is
+        computed; missing glyphs are measured on the pool (started only if
+        some glyph is missing)."""
+        await enable_page_features(self.args)
+        if self.args.fit_text and self._fit is None:
+            import text_fit
+            locales, specs = self._fit_inputs()
+            self._fit = await text_fit.fit_all_async(locales, specs=specs, pool=self.pool)
+
+    def _fit_results(self) -> list:
+        return self._fit or []
+
+    def fitted_sizes(self, name, locale) -> dict:
+        import text_fit
+        return text_fit.fitted_sizes(self._fit_results(), name, locale)
+
+    def html(self, name: str, locale: str) -> str:
+        if (name, locale) not in self._html:
+            extra = ""
+            if self.args.fit_text:
+                import text_fit
+                extra = text_fit.fit_css(self._fit_results(), name, locale)
+            self._html[name, locale] = frame_html(frames.load(name), locale=locale,
+                                                  extra_css=extra)
+        return self._html[name, locale]
+
+    def html_digest(self, name: str, locale: str) -> str:
+        return hashlib.sha256(self.html(name, locale).encode("utf-8")).hexdigest()
+
+    def card(self, page: str):
+        import social_cards
+        if self._cards is None:
+            self._cards = {c.page: c for c in social_cards.discover()}
+        return self._cards[page]
+
+    def card_digest(self, card) -> str:
+        import social_cards
+        return hashlib.sha256(social_cards.card_html(card).encode("utf-8")).hexdigest()
+
+    def bundle_fingerprint(self) -> str:
+        import package_bundle
+        entries = package_bundle.plan_entries(sorted(package_bundle.STORE_SLOTS),
+                                              self.all_locales)
+        h = hashlib.sha256()
+        for e in entries:
+            st = os.stat(e.path)
+            h.update(f"{e.arcname}|{st.st_size}|{st.st_mtime_ns}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    async def pool(self):
+        """The browser pool, started on first use (never for cached runs)."""
+        async with self._pool_lock:
+            if self._pool is None:
+                import contextlib
+                from browser_pool import BrowserPool
+                async_playwright = load_backend(self.args)
+                self._stack = contextlib.AsyncExitStack()
+                p = await self._stack.enter_async_context(async_playwright())
+                self._pool = await self._stack.enter_async_context(
+                    BrowserPool(p, **pool_options(self.args)))
+            return self._pool
+
+    async def close(self):
+        if self._stack is not None:
+            print(f"  {self._pool.format_metrics()}")
+            if self.args.warm_profile:
+                import warm_profile
+                warm_profile.report(self._pool)
+            await self._stack.aclose()
+
+
+def _load_state() -> dict:
+    try:
+        with open(STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def materialize(node: Node, state: dict):
+    """Copy a node's object to its destination unless it is already there."""
+    if not node.dest:
+        return
+    recorded = state.get(node.dest)
+    if recorded and recorded[0] == node.key and os.path.exists(node.dest):
+        st = os.stat(node.dest)
+        if [st.st_size, st.st_mtime_ns] == recorded[1:]:
+            return
+    os.makedirs(os.path.dirname(node.dest), exist_ok=True)
+    tmp = f"{node.dest}.tmp"
+    shutil.copyfile(node.object_path, tmp)
+    os.replace(tmp, node.dest)
+    st = os.stat(node.dest)
+    state[node.dest] = [node.key, st.st_size, st.st_mtime_ns]
+
+
+async def execute(graph: BuildGraph, ctx: BuildContext, jobs: int) -> dict:
+    """Run every stale node, inputs first, at most `jobs` at a time."""
+    trace = render_trace.tracer
+    state = _load_state()
+    semaphore = asyncio.Semaphore(jobs)
+    futures = {}
+
+    async def run(node):
+        await asyncio.gather(*(futures[dep] for dep in node.inputs))
+        if any(graph.nodes[dep].status in ("failed", "blocked") for dep in node.inputs):
+            node.status = "blocked"
+            return
+        graph.compute_key(node)
+        if os.path.exists(node.object_path):
+            node.status = "cached"
+            materialize(node, state)
+            return
+        async with semaphore:
+            started = time.perf_counter()
+            tmp = f"{node.object_path}.{os.getpid()}.tmp"
+            os.makedirs(os.path.dirname(tmp), exist_ok=True)
+            try:
+                with trace.span(f"build.{node.kind}", node=node.id):
+                    await BUILDERS[node.kind](
+                        node, [graph.nodes[d].object_path for d in node.inputs], tmp, ctx)
+                os.replace(tmp, node.object_path)
+            except BuildError as e:
+                node.status = "failed"
+                print(f"  ✗ {node.id}: {e}")
+                return
+            except Exception as e:
+                node.status = "failed"
+                print(f"  ✗ {node.id}: {type(e).__name__}: {e}")
+                return
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            node.seconds = time.perf_counter() - started
+            node.status = "built"
+            materialize(node, state)
+            print(f"  ✓ {node.id:<44} {node.seconds:6.2f}s")
+
+    ctx.graph = graph
+    try:
+        await ctx.prepare()
+        for node in graph.order():
+            futures[node.id] = asyncio.ensure_future(run(node))
+        await asyncio.gather(*futures.values())
+    except BaseException:
+        for future in futures.values():
+            future.cancel()
+        await asyncio.gather(*futures.values(), return_exceptions=True)
+        raise
+    finally:
+        await ctx.close()
+        os.makedirs(BUILD_DIR, exist_ok=True)
+        with open(STATE_PATH, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=1)
+
+    counts = {}
+    for node in graph.nodes.values():
+        counts[node.status] = counts.get(node.status, 0) + 1
+    return counts
+
+
+async def prepare_plan(ctx: BuildContext):
+    try:
+        await ctx.prepare()
+    finally:
+        await ctx.close()
+
+
+def print_plan(graph: BuildGraph):
+    """Fresh/stale per node without building anything. A node is stale if
+    its key is not in the store (keys of stale inputs are still known:
+    they hash inputs, not outputs)."""
+    stale = 0
+    for node in graph.order():
+        graph.compute_key(node)
+        fresh = os.path.exists(node.object_path)
+        stale += not fresh
+        print(f"  {'fresh' if fresh else 'STALE':<6} {node.id}")
+    print(f"  {stale}/{len(graph.nodes)} node(s) to build")
+
+
+def run(args, cells):
+    """Entry point for generate_screenshots.py --build."""
+    from browser_pool import available_cpus
+
+    targets = set(args.targets or DEFAULT_TARGETS)
+    unknown = targets - set(TARGETS)
+    if unknown:
+        print(f"ERROR: unknown build target(s) {', '.join(sorted(unknown))}")
+        print(f"  available: {', '.join(TARGETS)}")
+        sys.exit(1)
+    ctx = BuildContext(args, cells)
+    graph = plan_graph(cells, targets, ctx)
+    ctx.graph = graph
+    if args.plan:
+        asyncio.run(prepare_plan(ctx))
+        print_plan(graph)
+        return
+
+    jobs = args.jobs or available_cpus()
+    print("Vantag Build Graph")
+    print(f"{'=' * 52}")
+    print(f"  Nodes   : {len(graph.nodes)} ({len(cells)} cells, targets: {', '.join(sorted(targets))})")
+    print(f"  Workers : {jobs}")
+    print()
+    started = time.perf_counter()
+    counts = asyncio.run(execute(graph, ctx, jobs))
+    print()
+    print(f"  {counts.get('built', 0)} built, {counts.get('cached', 0)} up to date, "
+          f"{counts.get('failed', 0)} failed, {counts.get('blocked', 0)} blocked "
+          f"in {time.perf_counter() - started:.1f}s")
+    if counts.get("failed") or counts.get("blocked"):
+        sys.exit(1)
@@ -10,14 +10,19 @@ Prerequisites:
 - pip3 install pyobjc-framework-Quartz
 
 Usage:
-    python3 scripts/capture_raw_screenshots.py
+    python3 scripts/capture_raw_screenshots.py [--trace trace.json]
 """
 
+import argparse
 import subprocess
 import time
 import os
 import Quartz
 
+import render_trace
+
+DEVICE = "booted"
+
 
 def find_simulator_window():
     """Find the Simulator window bounds."""
@@ -46,8 +51,19 @@ def bring_simulator_to_front():
     time.sleep(0.5)
 
 
+def pause(seconds, reason="settle"):
+    """Sleep while the app animates; recorded as a span when tracing."""
+    with render_trace.tracer.span("sleep", seconds=seconds, reason=reason, device=DEVICE):
+        time.sleep(seconds)
+
+
 def tap(x, y):
     """Send a mouse click at absolute screen coordinates using CGEvents."""
+    with render_trace.tracer.span("tap", x=round(x), y=round(y), device=DEVICE):
+        _tap(x, y)
+
+
+def _tap(x, y):
     point = Quartz.CGPointMake(x, y)
 
     # Mouse down
@@ -74,10 +90,12 @@ def tap(x, y):
 def take_screenshot(name, output_dir):
     """Take a screenshot using xcrun simctl."""
     path = os.path.join(output_dir, f"{name}.png")
-    result = subprocess.run(
-        ['xcrun', 'simctl', 'io', 'booted', 'screenshot', path],
-        capture_output=True, text=True
-    )
+    with render_trace.tracer.span("take_screenshot", frame=name, device=DEVICE) as span:
+        result = subprocess.run(
+            ['xcrun', 'simctl', 'io', DEVICE, 'screenshot', path],
+            capture_output=True, text=True
+        )
+        span.set(returncode=result.returncode)
     if result.returncode == 0:
         size = os.path.getsize(path)
         print(f"  Saved: {path} ({size // 1024} KB)")
@@ -87,6 +105,16 @@ def take_screenshot(name, output_dir):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Capture raw screenshots from the iOS Simulator.")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write Chrome trace / Perfetto JSON spans (or set VANTAG_TRACE)")
+    args = parser.parse_args()
+
+    if args.trace:
+        render_trace.enable(args.trace, 'vantag-capture')
+    else:
+        render_trace.enable_from_env('vantag-capture')
+
     output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'docs', 'screenshots')
     os.makedirs(output_dir, exist_ok=True)
 
@@ -116,65 +144,68 @@ def main():
 
     # Bring simulator to front
     bring_simulator_to_front()
-    time.sleep(1)
+    pause(1)
 
     # === Screenshot 1: Home Screen ===
     print("\n[1/6] Home Screen")
     tap(tab_positions['home'], tab_y)
-    time.sleep(1.5)
+    pause(1.5)
     take_screenshot('raw_1_home', output_dir)
 
     # === Screenshot 2: Reports/Analysis Screen ===
     print("\n[2/6] Reports/Analysis Screen")
     tap(tab_positions['analysis'], tab_y)
-    time.sleep(2)
+    pause(2)
     take_screenshot('raw_2_reports', output_dir)
 
     # === Screenshot 3: Add Expense Sheet ===
     print("\n[3/6] Add Expense Sheet")
     tap(tab_positions['home'], tab_y)  # Go home first
-    time.sleep(1)
+    pause(1)
     tap(tab_positions['add'], tab_y)   # Tap the + button
-    time.sleep(2)
+    pause(2)
     take_screenshot('raw_3_add_expense', output_dir)
 
     # Close the add expense sheet - tap outside (top area)
     tap(wx + ww / 2, wy + 100)
-    time.sleep(1)
+    pause(1)
 
     # === Screenshot 4: Achievements Screen ===
     # First navigate to Settings, then tap on Badges/Rozetler row
     print("\n[4/6] Achievements Screen (via Settings > Badges)")
     tap(tab_positions['settings'], tab_y)
-    time.sleep(2)
+    pause(2)
 
     # Badges/Rozetler is typically in the middle section of settings
     # Let's scroll down a bit first and then tap on the Badges row
     # Settings screen layout: the badges row is usually around y=55-65% down
     badges_y = wy + wh * 0.55
     tap(wx + ww / 2, badges_y)
-    time.sleep(2)
+    pause(2)
     take_screenshot('raw_4_achievements', output_dir)
 
     # Go back from achievements to settings
     # The back button is in the top-left corner
     tap(wx + 30, wy + 60)
-    time.sleep(1)
+    pause(1)
 
     # === Screenshot 5: Dreams/Pursuits Screen ===
     print("\n[5/6] Dreams/Pursuits Screen")
     tap(tab_positions['dreams'], tab_y)
-    time.sleep(2)
+    pause(2)
     take_screenshot('raw_5_dreams', output_dir)
 
     # === Screenshot 6: Settings Screen ===
     print("\n[6/6] Settings Screen")
     tap(tab_positions['settings'], tab_y)
-    time.sleep(2)
+    pause(2)
     take_screenshot('raw_6_settings', output_dir)
 
     print("\n=== All 6 screenshots captured! ===")
     print(f"Output directory: {output_dir}")
+    if render_trace.tracer.enabled:
+        render_trace.tracer.save()
+        print(f"Trace saved to {render_trace.tracer.path}")
 
 
 if __name__ == '__main__':
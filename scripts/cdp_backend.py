@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+Direct Chrome DevTools Protocol rendering backend.
+
+The Playwright path costs a driver process, its own protocol hop and
+several round trips per render (set_content → lifecycle wait →
+screenshot). This backend launches Chromium itself and talks CDP over
+--remote-debugging-pipe — one persistent connection, no extra process,
+standard library only. Commands are written without waiting for earlier
+replies, so per-target setup (emulation, request interception, page
+domain) and a navigation go out as one burst.
+
+It mirrors the slice of Playwright's API the renderer uses —
+chromium.launch() → browser.new_context() → context.new_page() /
+route() / new_cdp_session(), page.set_content() / wait_for_timeout() /
+screenshot() — so BrowserPool, render_png() and the launch tuner run on
+it unchanged and both backends can be compared on identical jobs:
+
+    async with async_cdp() as p:                  # like async_playwright()
+        async with BrowserPool(p, **pool_options(args)) as pool:
+            png = await render_png(pool, html, attrs)
+
+A pooled page is one target reused across renders. Small pages are
+navigated to as data: URLs; larger ones are written into the reused
+document with Page.setDocumentContent. Screenshots accept clip regions
+and the raw Page.captureScreenshot options.
+
+Usage:
+    python3 scripts/generate_screenshots.py --backend cdp
+    python3 scripts/cdp_backend.py --only 'appstore_[12]*' --runs 3    # benchmark both backends
+
+Chromium is found via VANTAG_CHROMIUM, Playwright's browser cache, or PATH.
+"""
+
+import argparse
+import asyncio
+import base64
+import contextlib
+import fnmatch
+import glob
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from urllib.parse import quote
+
+# Chromium rejects URLs above 2 MB; bigger pages go through setDocumentContent.
+DATA_URL_LIMIT = 1_500_000
+COMMAND_TIMEOUT_S = 30
+READ_LIMIT = 1 << 30        # full-size PNGs arrive base64-encoded in one message
+
+BASE_ARGS = [
+    "--headless", "--remote-debugging-pipe", "--no-first-run",
+    "--no-default-browser-check", "--disable-background-networking",
+    "--disable-extensions", "--disable-sync", "--hide-scrollbars",
+    "--mute-audio", "--disable-dev-shm-usage",
+]
+EXECUTABLE_NAMES = ("chromium", "chromium-browser", "google-chrome", "chrome",
+                    "headless_shell", "chrome-headless-shell")
+
+
+class CDPError(RuntimeError):
+    pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CONNECTION
+# ═══════════════════════════════════════════════════════════════════════════
+
+def find_chromium(channel: str = None) -> str:
+    """Chromium executable: $VANTAG_CHROMIUM, Playwright's cache, then PATH."""
+    if os.environ.get("VANTAG_CHROMIUM"):
+        return os.environ["VANTAG_CHROMIUM"]
+    root = os.environ.get("PLAYWRIGHT_BROWSERS_PATH") or os.path.expanduser(
+        "~/Library/Caches/ms-playwright" if sys.platform == "darwin" else "~/.cache/ms-playwright")
+    patterns = ["chromium-*/chrome-*/chrome",
+                "chromium-*/chrome-mac/Chromium.app/Contents/MacOS/Chromium"]
+    if channel != "chromium":
+        patterns.insert(0, "chromium_headless_shell-*/chrome-*/*headless_shell")
+    for pattern in patterns:
+        found = sorted(glob.glob(os.path.join(root, pattern)))
+        if found:
+            return found[-1]
+    for name in EXECUTABLE_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+    print("ERROR: no Chromium executable found for the CDP backend.")
+    print("  python -m playwright install chromium      # or set VANTAG_CHROMIUM")
+    sys.exit(1)
+
+
+class Connection:
+    """One CDP pipe to a Chromium process; sessions are multiplexed on it."""
+
+    def __init__(self, process, reader, transport, profile_dir, temporary):
+        self.process = process
+        self.profile_dir = profile_dir
+        self.temporary = temporary
+        self._reader = reader
+        self._transport = transport
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = {}
+        self._tasks = set()
+        self._closed = None
+        self._read_task = asyncio.ensure_future(self._read_loop())
+
+    @classmethod
+    async def launch(cls, executable: str, args: list, user_data_dir: str = None,
+                     env: dict = None) -> "Connection":
+        import fcntl
+
+        loop = asyncio.get_running_loop()
+        chrome_in, ours_out = os.pipe()         # Chromium reads commands on fd 3
+        ours_in, chrome_out = os.pipe()         # and writes replies to fd 4
+
+        def child_fds():
+            r = fcntl.fcntl(chrome_in, fcntl.F_DUPFD_CLOEXEC, 10)
+            w = fcntl.fcntl(chrome_out, fcntl.F_DUPFD_CLOEXEC, 10)
+            os.dup2(r, 3)
+            os.dup2(w, 4)
+
+        profile_dir = user_data_dir or tempfile.mkdtemp(prefix="vantag-cdp-")
+        process = await asyncio.create_subprocess_exec(
+            executable, *BASE_ARGS, f"--user-data-dir={profile_dir}", *args, "about:blank",
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            close_fds=False, preexec_fn=child_fds, env={**os.environ, **(env or {})},
+        )
+        os.close(chrome_in)
+        os.close(chrome_out)
+        reader = asyncio.StreamReader(limit=READ_LIMIT)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader),
+                                     os.fdopen(ours_in, "rb", 0))
+        transport, _ = await loop.connect_write_pipe(asyncio.Protocol,
+                                                     os.fdopen(ours_out, "wb", 0))
+        return cls(process, reader, transport, profile_dir, temporary=not user_data_dir)
+
+    def send(self, method: str, params: dict = None, session: str = None) -> asyncio.Future:
+        """Write a command now and return a future for its result; callers
+        pipeline by sending several before awaiting any."""
+        future = asyncio.get_running_loop().create_future()
+        if self._closed:
+            future.set_exception(self._closed)
+            return future
+        message = {"id": next(self._ids), "method": method, "params": params or {}}
+        if session:
+            message["sessionId"] = session
+        self._pending[message["id"]] = (future, method)
+        self._transport.write(json.dumps(message).encode("utf-8") + b"\0")
+        return future
+
+    async def call(self, method: str, params: dict = None, session: str = None) -> dict:
+        return await asyncio.wait_for(self.send(method, params, session), COMMAND_TIMEOUT_S)
+
+    def on(self, method: str, session: str, callback):
+        self._listeners.setdefault((session, method), []).append(callback)
+
+    def off(self, method: str, session: str, callback):
+        with contextlib.suppress(KeyError, ValueError):
+            self._listeners[(session, method)].remove(callback)
+
+    def wait_for(self, method: str, session: str) -> asyncio.Future:
+        """Future for the next `method` event on a session; register before
+        sending the command that triggers it."""
+        future = asyncio.get_running_loop().create_future()
+
+        def fire(params):
+            self.off(method, session, fire)
+            if not future.done():
+                future.set_result(params)
+
+        self.on(method, session, fire)
+        return future
+
+    def spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _read_loop(self):
+        error = CDPError("Chromium closed the DevTools pipe")
+        try:
+            while True:
+                raw = await self._reader.readuntil(b"\0")
+                message = json.loads(raw[:-1])
+                if "id" in message:
+                    future, method = self._pending.pop(message["id"], (None, None))
+                    if future is None or future.done():
+                        continue
+                    if "error" in message:
+                        future.set_exception(CDPError(f"{method}: {message['error'].get('message')}"))
+                    else:
+                        future.set_result(message.get("result", {}))
+                else:
+                    key = (message.get("sessionId"), message.get("method"))
+                    for callback in list(self._listeners.get(key, ())):
+                        callback(message.get("params", {}))
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            error = CDPError(f"Chromium closed the DevTools pipe ({e.__class__.__name__})")
+        finally:
+            self._closed = error
+            for future, _ in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    async def close(self):
+        if not self._closed:
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(self.send("Browser.close"), 5)
+        try:
+            await asyncio.wait_for(self.process.wait(), 10)
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+        self._transport.close()
+        self._read_task.cancel()
+        if self.temporary:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PLAYWRIGHT-SHAPED OBJECTS
+# ═══════════════════════════════════════════════════════════════════════════
+
+class _Request:
+    def __init__(self, params):
+        self.url = params["request"]["url"]
+        self.method = params["request"]["method"]
+
+
+class Route:
+    """A paused request, fulfilled or continued like Playwright's Route."""
+
+    def __init__(self, page, params):
+        self._page = page
+        self._id = params["requestId"]
+        self.request = _Request(params)
+
+    async def fulfill(self, status: int = 200, body: bytes = b"", headers: dict = None):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        await self._page.send("Fetch.fulfillRequest", {
+            "requestId": self._id,
+            "responseCode": status,
+            "responseHeaders": [{"name": k, "value": str(v)} for k, v in (headers or {}).items()],
+            "body": base64.b64encode(body).decode("ascii"),
+        })
+
+    async def continue_(self):
+        await self._page.send("Fetch.continueRequest", {"requestId": self._id})
+
+
+class Page:
+    """One reused target; also serves as its own CDP session."""
+
+    def __init__(self, context, target_id, session):
+        self.context = context
+        self.target_id = target_id
+        self.session = session
+        self._conn = context.browser.connection
+        self._frame_id = target_id          # a page target's main frame id
+
+    def send(self, method: str, params: dict = None) -> asyncio.Future:
+        return self._conn.send(method, params, self.session)
+
+    async def _setup(self):
+        viewport = self.context.viewport
+        self._conn.on("Fetch.requestPaused", self.session, self._on_request)
+        await asyncio.gather(
+            self.send("Page.enable"),
+            self.send("Emulation.setDeviceMetricsOverride", {
+                "width": viewport["width"], "height": viewport["height"],
+                "deviceScaleFactor": self.context.device_scale_factor, "mobile": False,
+            }),
+            self._enable_routes(),
+        )
+
+    async def _enable_routes(self):
+        routes = self.context.routes
+        if routes:
+            await self.send("Fetch.enable", {"patterns": [
+                {"urlPattern": pattern.replace("**", "*"), "requestStage": "Request"}
+                for pattern, _ in routes
+            ]})
+
+    def _on_request(self, params):
+        url = params["request"]["url"]
+        route = Route(self, params)
+        for pattern, handler in reversed(self.context.routes):
+            if fnmatch.fnmatchcase(url, pattern.replace("**", "*")):
+                self._conn.spawn(self._handle(handler, route))
+                return
+        self._conn.spawn(route.continue_())
+
+    @staticmethod
+    async def _handle(handler, route):
+        try:
+            await handler(route)
+        except Exception:
+            with contextlib.suppress(Exception):
+                await route.continue_()
+
+    async def set_content(self, html: str, wait_until: str = "domcontentloaded"):
+        """Load a document: as a data: URL when it fits, else written into
+        the current document. Returns after DOMContentLoaded (or load)."""
+        event = "Page.loadEventFired" if wait_until == "load" else "Page.domContentEventFired"
+        url = "data:text/html;charset=utf-8," + quote(html, safe="")
+        if len(url) <= DATA_URL_LIMIT:
+            fired = self._conn.wait_for(event, self.session)
+            navigated = await self.send("Page.navigate", {"url": url})
+            if navigated.get("errorText"):
+                raise CDPError(f"Page.navigate: {navigated['errorText']}")
+            await asyncio.wait_for(fired, COMMAND_TIMEOUT_S)
+            self._frame_id = navigated.get("frameId", self._frame_id)
+            return
+        await self.send("Page.setDocumentContent", {"frameId": self._frame_id, "html": html})
+        await self.evaluate(
+            "document.readyState !== 'loading' || new Promise(r => "
+            "addEventListener('DOMContentLoaded', () => r(true), {once: true}))")
+
+    async def evaluate(self, expression: str, arg=None):
+        """Like Playwright's: an expression that evaluates to a function is
+        called (on `arg`, if given) and its result awaited."""
+        argument = "undefined" if arg is None else json.dumps(arg)
+        expression = (
+            f"(() => {{ const value = (0, eval)({json.dumps(expression)}); "
+            f"return typeof value === 'function' ? value({argument}) : value; }})()")
+        result = await self.send("Runtime.evaluate", {
+            "expression": expression, "awaitPromise": True, "returnByValue": True,
+        })
+        if "exceptionDetails" in result:
+            raise CDPError(result["exceptionDetails"].get("text", "evaluation failed"))
+        return result["result"].get("value")
+
+    async def wait_for_timeout(self, ms: float):
+        await asyncio.sleep(ms / 1000)
+
+    async def screenshot(self, type: str = "png", quality: int = None, clip: dict = None,
+                         optimize_for_speed: bool = False, path: str = None,
+                         omit_background: bool = False, **raw) -> bytes:
+        """Viewport capture. `clip` is {x, y, width, height[, scale]} in CSS
+        pixels relative to the viewport, as in Playwright (CDP takes
+        document coordinates); `omit_background` captures a transparent
+        page background; extra keyword arguments pass straight to
+        Page.captureScreenshot."""
+        params = {"format": type, "fromSurface": True, "captureBeyondViewport": False,
+                  "optimizeForSpeed": optimize_for_speed, **raw}
+        if quality is not None and type != "png":
+            params["quality"] = quality
+        if clip:
+            scroll_x, scroll_y = await self.evaluate("[window.scrollX, window.scrollY]")
+            params["clip"] = {"scale": 1, **clip,
+                              "x": clip["x"] + scroll_x, "y": clip["y"] + scroll_y}
+        if omit_background:
+            await self.send("Emulation.setDefaultBackgroundColorOverride",
+                            {"color": {"r": 0, "g": 0, "b": 0, "a": 0}})
+        try:
+            result = await self.send("Page.captureScreenshot", params)
+        finally:
+            if omit_background:
+                await self.send("Emulation.setDefaultBackgroundColorOverride")
+        data = base64.b64decode(result["data"])
+        if path:
+            with open(path, "wb") as f:
+                f.write(data)
+        return data
+
+    async def close(self):
+        self._conn.off("Fetch.requestPaused", self.session, self._on_request)
+        with contextlib.suppress(CDPError):
+            await self._conn.call("Target.closeTarget", {"targetId": self.target_id})
+        self.context.pages.remove(self)
+
+
+class BrowserContext:
+    """An isolated CDP browser context with Playwright-style routes; with
+    no context id, the profile's default context (persistent launches)."""
+
+    def __init__(self, browser, context_id, viewport, device_scale_factor):
+        self.browser = browser
+        self.context_id = context_id
+        self.viewport = viewport or {"width": 1280, "height": 720}
+        self.device_scale_factor = device_scale_factor
+        self.routes = []
+        self.pages = []
+
+    async def new_page(self) -> Page:
+        conn = self.browser.connection
+        params = {"url": "about:blank"}
+        if self.context_id:
+            params["browserContextId"] = self.context_id
+        created = await conn.call("Target.createTarget", params)
+        attached = await conn.call("Target.attachToTarget", {
+            "targetId": created["targetId"], "flatten": True,
+        })
+        page = Page(self, created["targetId"], attached["sessionId"])
+        await page._setup()
+        self.pages.append(page)
+        return page
+
+    async def route(self, pattern: str, handler):
+        self.routes.append((pattern, handler))
+        await asyncio.gather(*(page._enable_routes() for page in self.pages))
+
+    async def new_cdp_session(self, page: Page) -> Page:
+        return page
+
+    async def close(self):
+        for page in list(self.pages):
+            await page.close()
+        if self.context_id is None:
+            await self.browser.close()
+            return
+        with contextlib.suppress(CDPError):
+            await self.browser.connection.call("Target.disposeBrowserContext",
+                                               {"browserContextId": self.context_id})
+
+
+class Browser:
+    def __init__(self, connection, version):
+        self.connection = connection
+        self.version = version
+
+    async def new_context(self, viewport: dict = None, device_scale_factor: float = 1,
+                          **_ignored) -> BrowserContext:
+        created = await self.connection.call("Target.createBrowserContext")
+        return BrowserContext(self, created["browserContextId"], viewport, device_scale_factor)
+
+    async def new_page(self, viewport: dict = None, **kwargs) -> Page:
+        context = await self.new_context(viewport, **kwargs)
+        return await context.new_page()
+
+    async def close(self):
+        await self.connection.close()
+
+
+class _Chromium:
+    async def launch(self, executable_path: str = None, args: list = None,
+                     channel: str = None, env: dict = None, user_data_dir: str = None,
+                     **_ignored) -> Browser:
+        """Same keyword arguments as Playwright's chromium.launch()."""
+        if sys.platform == "win32":
+            print("ERROR: the CDP backend needs a POSIX pipe; use --backend playwright.")
+            sys.exit(1)
+        executable = executable_path or find_chromium(channel)
+        connection = await Connection.launch(executable, list(args or ()), user_data_dir, env)
+        try:
+            version = await connection.call("Browser.getVersion")
+        except BaseException:
+            await connection.close()
+            raise
+        return Browser(connection, version["product"].split("/", 1)[-1])
+
+    async def launch_persistent_context(self, user_data_dir: str, viewport: dict = None,
+                                        device_scale_factor: float = 1, **options) -> BrowserContext:
+        """The default context of a browser started on `user_data_dir`;
+        closing it closes the browser."""
+        options.pop("no_viewport", None)
+        browser = await self.launch(user_data_dir=user_data_dir, **options)
+        return BrowserContext(browser, None, viewport, device_scale_factor)
+
+
+@contextlib.asynccontextmanager
+async def async_cdp():
+    """Drop-in for async_playwright() limited to Chromium."""
+    yield SimpleNamespace(chromium=_Chromium())
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════
+
+async def bench_backend(driver, args, jobs: list, runs: int) -> dict:
+    """Render identical jobs through BrowserPool + render_png on one backend."""
+    from browser_pool import BrowserPool
+    from generate_screenshots import pool_options, render_png
+
+    timings, shots = [], {}
+    async with driver() as p:
+        async with BrowserPool(p, **pool_options(args)) as pool:
+            for run in range(runs + 1):                     # run 0 warms up
+                started = time.perf_counter()
+                pngs = await asyncio.gather(*(
+                    render_png(pool, html, {"frame": key}, device)
+                    for key, html, device in jobs))
+                if run:
+                    timings.append(time.perf_counter() - started)
+                shots = dict(zip((key for key, _, _ in jobs), pngs))
+    best = min(timings)
+    return {"ms_per_frame": 1000 * best / len(jobs), "shots": shots}
+
+
+def main():
+    from generate_screenshots import (
+        DEVICE, LOCALE, add_pool_arguments, cell_key, enable_page_features, frame_html,
+        load_playwright, plan_cells,
+    )
+    import frames
+    import launch_tuner
+
+    parser = argparse.ArgumentParser(description="Compare the Playwright and direct CDP backends.")
+    add_pool_arguments(parser)
+    parser.add_argument("--only", nargs="+", metavar="GLOB", help="frames (default: all)")
+    parser.add_argument("--locale", nargs="+", metavar="GLOB", default=[LOCALE])
+    parser.add_argument("--device", nargs="+", metavar="GLOB", default=[DEVICE])
+    parser.add_argument("--runs", type=int, default=3, help="timed passes per backend")
+    args = parser.parse_args()
+    asyncio.run(enable_page_features(args))
+
+    jobs = [(cell_key(name, locale, device), frame_html(frames.load(name), locale=locale), device)
+            for name, locale, device in plan_cells(args)]
+    print("Vantag Render Backend Benchmark")
+    print(f"{'=' * 52}")
+    print(f"  Jobs : {len(jobs)} cells × {args.runs} runs")
+    print()
+
+    results = {}
+    for label, driver in (("playwright", load_playwright()), ("cdp", async_cdp)):
+        results[label] = asyncio.run(bench_backend(driver, args, jobs, args.runs))
+        print(f"  {label:<11} {results[label]['ms_per_frame']:8.1f} ms/frame")
+
+    diffs = [launch_tuner.pixel_diff(results["playwright"]["shots"][key],
+                                     results["cdp"]["shots"][key]) for key, _, _ in jobs]
+    speedup = results["playwright"]["ms_per_frame"] / results["cdp"]["ms_per_frame"]
+    print()
+    print(f"  CDP vs Playwright : {speedup:.2f}× · max mean pixel diff "
+          f"{max(d['mean_diff'] or 0 for d in diffs):.3f} · "
+          f"{'equivalent' if all(d['ok'] for d in diffs) else 'DIFFERENT'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Critical-CSS pruning per frame.
+
+Every page embeds all of COMMON_CSS (status bar, tab bar, phone mockup,
+glows, headlines, …) plus the frame's own CSS, though `appstore_1_hook`
+uses almost none of it. The pruner parses the stylesheet once into rules,
+collects the tags, classes and ids a frame's DOM actually contains, and
+keeps only the rules whose selectors can match — conservatively: pseudo
+classes, attribute selectors and combinators never cause a drop, so a
+pruned page renders identically. @media/@supports blocks are pruned
+recursively, @keyframes survive only if a kept rule animates with them.
+
+Results are cached per template: the key is the stylesheet plus the
+DOM's tag/class/id signature, so content-only variants reuse one result.
+
+Usage:
+    python3 scripts/css_prune.py                   # size report per frame
+    python3 scripts/css_prune.py --measure         # style-recalc time before/after
+    python3 scripts/generate_screenshots.py --prune-css
+"""
+
+import argparse
+import asyncio
+import functools
+import re
+from dataclasses import dataclass, field
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_PSEUDO = re.compile(r"::?[-\w]+(\((?:[^()]|\([^()]*\))*\))?")
+_ATTR = re.compile(r"\[[^\]]*\]")
+_COMBINATOR = re.compile(r"\s*[>+~]\s*|\s+")
+_TAG = re.compile(r"^[a-zA-Z][\w-]*")
+_CLASS = re.compile(r"\.(-?[_a-zA-Z][-\w]*)")
+_ID = re.compile(r"#(-?[_a-zA-Z][-\w]*)")
+_OPEN_TAG = re.compile(r"<([a-zA-Z][\w-]*)")
+_CLASS_ATTR = re.compile(r"""\bclass\s*=\s*["']([^"']*)["']""")
+_ID_ATTR = re.compile(r"""\bid\s*=\s*["']([^"']*)["']""")
+_STYLE_BLOCK = re.compile(r"(<style>)(.*?)(</style>)", re.S)
+
+ALWAYS_KEEP_AT = ("@font-face", "@page", "@import", "@charset", "@property")
+
+enabled = False
+
+
+@dataclass
+class Rule:
+    prelude: str
+    body: str = ""
+    children: list = field(default_factory=list)
+
+    @property
+    def is_group(self) -> bool:
+        return self.prelude.startswith(("@media", "@supports", "@layer"))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PARSING
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _block_end(css: str, start: int) -> int:
+    """Index of the brace closing the block opened just before `start`."""
+    depth, i, quote = 1, start, None
+    while i < len(css):
+        ch = css[i]
+        if quote:
+            if ch == "\\":
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(css)
+
+
+def parse(css: str) -> list:
+    """Top-level rules; group at-rules carry their parsed children."""
+    css = _COMMENT.sub("", css)
+    rules, i = [], 0
+    while i < len(css):
+        brace, semi = css.find("{", i), css.find(";", i)
+        if brace == -1 and semi == -1:
+            break
+        if semi != -1 and (brace == -1 or semi < brace) and css[i:semi].strip().startswith("@"):
+            rules.append(Rule(css[i:semi + 1].strip()))
+            i = semi + 1
+            continue
+        end = _block_end(css, brace + 1)
+        rule = Rule(" ".join(css[i:brace].split()), css[brace + 1:end])
+        if rule.is_group:
+            rule.children = parse(rule.body)
+        rules.append(rule)
+        i = end + 1
+    return rules
+
+
+def split_selectors(prelude: str) -> list:
+    out, depth, current = [], 0, ""
+    for ch in prelude:
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        if ch == "," and depth == 0:
+            out.append(current.strip())
+            current = ""
+        else:
+            current += ch
+    out.append(current.strip())
+    return [s for s in out if s]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# MATCHING
+# ═══════════════════════════════════════════════════════════════════════════
+
+def dom_signature(body: str) -> tuple:
+    """(tags, classes, ids) present in a body's markup."""
+    tags = {"html", "body", "head"}
+    tags.update(t.lower() for t in _OPEN_TAG.findall(body))
+    classes = {c for value in _CLASS_ATTR.findall(body) for c in value.split()}
+    ids = set(_ID_ATTR.findall(body))
+    return frozenset(tags), frozenset(classes), frozenset(ids)
+
+
+def selector_may_match(selector: str, signature) -> bool:
+    tags, classes, ids = signature
+    stripped = _ATTR.sub("", _PSEUDO.sub("", selector)).strip()
+    for compound in _COMBINATOR.split(stripped):
+        if not compound or compound == "*":
+            continue
+        tag = _TAG.match(compound)
+        if tag and tag.group(0).lower() not in tags:
+            return False
+        if any(c not in classes for c in _CLASS.findall(compound)):
+            return False
+        if any(i not in ids for i in _ID.findall(compound)):
+            return False
+    return True
+
+
+def _prune_rules(rules, signature) -> list:
+    kept = []
+    for rule in rules:
+        if rule.prelude.startswith(ALWAYS_KEEP_AT) or rule.prelude.startswith("@keyframes"):
+            kept.append(rule)
+        elif rule.is_group:
+            children = _prune_rules(rule.children, signature)
+            if children:
+                kept.append(Rule(rule.prelude, children=children))
+        elif rule.prelude.startswith("@"):
+            kept.append(rule)
+        else:
+            selectors = [s for s in split_selectors(rule.prelude)
+                         if selector_may_match(s, signature)]
+            if selectors:
+                kept.append(Rule(", ".join(selectors), rule.body))
+    return kept
+
+
+def _drop_unused_keyframes(rules) -> list:
+    declarations = " ".join(r.body for r in _flatten(rules) if not r.prelude.startswith("@"))
+    return [r for r in rules if not r.prelude.startswith("@keyframes")
+            or re.search(rf"\b{re.escape(r.prelude.split()[-1])}\b", declarations)]
+
+
+def _flatten(rules):
+    for r in rules:
+        yield r
+        yield from _flatten(r.children)
+
+
+def serialize(rules) -> str:
+    out = []
+    for r in rules:
+        if r.children:
+            out.append(f"{r.prelude} {{\n{serialize(r.children)}\n}}")
+        elif r.prelude.endswith(";"):
+            out.append(r.prelude)
+        else:
+            body = " ".join(r.body.split())
+            out.append(f"{r.prelude} {{ {body} }}")
+    return "\n".join(out)
+
+
+@functools.lru_cache(maxsize=64)
+def _parsed(css: str) -> list:
+    return parse(css)
+
+
+@functools.lru_cache(maxsize=4096)
+def _pruned(css: str, signature) -> str:
+    rules = _prune_rules(_parsed(css), signature)
+    return serialize(_drop_unused_keyframes(rules))
+
+
+def prune_css(css: str, body: str) -> str:
+    """Minimal stylesheet for a body; cached per (stylesheet, DOM signature)."""
+    return _pruned(css, dom_signature(body))
+
+
+def prune_page(page: str) -> str:
+    """Replace a page's <style> block with its pruned version."""
+    body = page.partition("<body>")[2]
+    return _STYLE_BLOCK.sub(lambda m: m.group(1) + "\n" + prune_css(m.group(2), body)
+                            + "\n" + m.group(3), page, count=1)
+
+
+def apply(page: str) -> str:
+    return prune_page(page) if enabled else page
+
+
+def enable():
+    """Prune every page built from now on."""
+    global enabled
+    enabled = True
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# REPORT
+# ═══════════════════════════════════════════════════════════════════════════
+
+def count_rules(css: str) -> int:
+    return sum(1 for r in _flatten(parse(css)) if not r.is_group)
+
+
+async def measure_recalc(pages: dict, runs: int) -> dict:
+    """Style-recalc / layout ms per page from Chromium's Performance metrics,
+    plus whether full and pruned pages render the same pixels."""
+    from generate_screenshots import H, W, load_playwright
+
+    async_playwright = load_playwright()
+    results = {}
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page(viewport={"width": W, "height": H})
+        cdp = await page.context.new_cdp_session(page)
+        await cdp.send("Performance.enable")
+
+        async def metrics():
+            data = await cdp.send("Performance.getMetrics")
+            return {m["name"]: m["value"] for m in data["metrics"]}
+
+        for name, variants in pages.items():
+            results[name] = {}
+            shots = {}
+            for label, html in variants.items():
+                recalc = layout = 0.0
+                for _ in range(runs):
+                    before = await metrics()
+                    await page.set_content(html, wait_until="domcontentloaded")
+                    await page.evaluate("document.body.offsetHeight")
+                    after = await metrics()
+                    recalc += after["RecalcStyleDuration"] - before["RecalcStyleDuration"]
+                    layout += after["LayoutDuration"] - before["LayoutDuration"]
+                shots[label] = await page.screenshot(type="png")
+                results[name][label] = {"recalc_ms": 1000 * recalc / runs,
+                                        "layout_ms": 1000 * layout / runs}
+            results[name]["identical"] = shots["full"] == shots["pruned"]
+        await browser.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report per-frame critical CSS.")
+    parser.add_argument("--measure", action="store_true",
+                        help="measure style recalc in Chromium before/after pruning")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    import css_prune            # the module html_page() consults, not __main__
+    from generate_screenshots import FRAMES, frame_html
+
+    pages = {}
+    print(f"{'frame':<22} {'CSS bytes':>17} {'rules':>11}")
+    for spec in FRAMES:
+        css_prune.enabled = False
+        full = frame_html(spec)
+        css_prune.enabled = True
+        pruned = frame_html(spec)
+        pages[spec.name] = {"full": full, "pruned": pruned}
+        css_full = _STYLE_BLOCK.search(full).group(2)
+        css_pruned = _STYLE_BLOCK.search(pruned).group(2)
+        print(f"{spec.name:<22} {len(css_full):>7} → {len(css_pruned):>6}"
+              f" {count_rules(css_full):>4} → {count_rules(css_pruned):<4}")
+
+    if args.measure:
+        results = asyncio.run(measure_recalc(pages, args.runs))
+        print()
+        print(f"{'frame':<22} {'recalc ms':>17} {'layout ms':>17}  pixels")
+        for name, r in results.items():
+            print(f"{name:<22} {r['full']['recalc_ms']:7.2f} → {r['pruned']['recalc_ms']:6.2f}"
+                  f" {r['full']['layout_ms']:7.2f} → {r['pruned']['layout_ms']:6.2f}"
+                  f"  {'identical' if r['identical'] else 'DIFFER'}")
+
+
+if __name__ == "__main__":
+    main()
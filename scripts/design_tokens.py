@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Design-token compiler shared by the app theme and the screenshot renderer.
+
+Sources, parsed once into one indexed table:
+
+    lib/theme/app_colors.dart        class VantColors → --vant-<name>
+                                     (+ --vant-<name>-rgb for rgb(… / a))
+    design-system/vantag/MASTER.md   tables with a `--css-variable` column
+
+Frame CSS refers to tokens as var(--vant-accent) or, for translucent
+uses, rgb(var(--vant-accent-rgb) / 0.45). html_page() emits a :root block
+with only the tokens referenced by the rules (and inline styles) that can
+match a page's DOM, so a palette change alters the
+HTML — and therefore the render cache key — of exactly the frames that
+use the changed tokens. The parsed table is cached under
+.screenshot_cache/tokens/ keyed by the source files' hash.
+
+Usage:
+    python3 scripts/design_tokens.py              # table summary
+    python3 scripts/design_tokens.py --diff       # tokens/frames changed since last render
+    python3 scripts/design_tokens.py --lint       # literals in frame CSS that have a token
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_COLORS = os.path.join(_ROOT, "lib", "theme", "app_colors.dart")
+MASTER_MD = os.path.join(_ROOT, "design-system", "vantag", "MASTER.md")
+
+_DART_CLASS = re.compile(r"class VantColors \{(.*?)\n\}", re.S)
+_DART_COLOR = re.compile(r"static const Color (\w+) = Color\(0x([0-9A-Fa-f]{8})\)")
+_MD_ROW = re.compile(r"^\|(.+)\|\s*$", re.M)
+_MD_CODE = re.compile(r"`([^`]+)`")
+_VAR_REF = re.compile(r"var\(--([\w-]+)")
+_HEX = re.compile(r"#([0-9A-Fa-f]{6})\b")
+_ROOT_BLOCK = re.compile(r":root \{([^}]*)\}")
+_DECL = re.compile(r"--([\w-]+):")
+_RGBA = re.compile(r"rgba\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*([\d.]+)\s*\)")
+
+# Pure black/white stay literal: the palette's #000000 is a brand colour
+# (tiktok), not the shadow black the frames mean.
+NEUTRALS = ("#000000", "#FFFFFF")
+
+
+@dataclass(frozen=True)
+class Token:
+    var: str            # custom property name without the leading "--"
+    value: str          # CSS value
+    source: str
+    rgb: str = ""       # "r g b" for colour tokens, feeding --<var>-rgb
+
+
+def kebab(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])([A-Z])", r"-\1", name).lower()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PARSERS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def parse_dart_colors(text: str) -> list:
+    match = _DART_CLASS.search(text)
+    tokens = []
+    for name, argb in _DART_COLOR.findall(match.group(1) if match else ""):
+        a, r, g, b = (int(argb[i:i + 2], 16) for i in (0, 2, 4, 6))
+        value = (f"#{argb[2:].upper()}" if a == 255
+                 else f"rgba({r},{g},{b},{round(a / 255, 3):g})")
+        tokens.append(Token(f"vant-{kebab(name)}", value, f"app_colors.dart:{name}", f"{r} {g} {b}"))
+    return tokens
+
+
+def parse_master(text: str) -> list:
+    """Rows of MASTER.md tables that name a CSS custom property."""
+    tokens = []
+    for row in _MD_ROW.findall(text):
+        cells = [c.strip() for c in row.split("|")]
+        codes = [_MD_CODE.findall(c) for c in cells]
+        var = next((c[0] for c in codes if c and c[0].startswith("--")), None)
+        value = next((c[0] for c in codes if c and not c[0].startswith("--")), None)
+        if not var or not value:
+            continue
+        rgb = ""
+        if _HEX.fullmatch(value):
+            rgb = " ".join(str(int(value[i:i + 2], 16)) for i in (1, 3, 5))
+        tokens.append(Token(var[2:], value, f"MASTER.md:{cells[0].strip('`') or var}", rgb))
+    return tokens
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TABLE
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TokenTable:
+    """Tokens indexed by variable name and by opaque colour value."""
+
+    def __init__(self, tokens: list, digest: str):
+        self.digest = digest
+        self.by_var = {}
+        self.by_hex = {}
+        for t in tokens:
+            self.by_var.setdefault(t.var, t)
+            if (t.value.startswith("#") and t.var.startswith("vant-")
+                    and t.value not in NEUTRALS):
+                self.by_hex.setdefault(t.value.upper(), t)     # first name wins
+
+    def value(self, var: str, overrides: dict = None) -> str:
+        if overrides and var in overrides:
+            return overrides[var]
+        return self.by_var[var].value
+
+    def root_css(self, *sources, overrides: dict = None) -> str:
+        """:root block declaring only the tokens the sources reference."""
+        overrides = {self.resolve(k): v for k, v in (overrides or {}).items()}
+        decls = []
+        for ref in sorted(set(_VAR_REF.findall("".join(sources)))):
+            base = ref[:-4] if ref.endswith("-rgb") and ref not in self.by_var else ref
+            if base not in self.by_var:
+                continue
+            value = self.value(base, overrides)
+            if base != ref:
+                value = hex_to_rgb(value) if value.startswith("#") else self.by_var[base].rgb
+            decls.append(f"--{ref}: {value};")
+        return f":root {{ {' '.join(decls)} }}" if decls else ""
+
+    def resolve(self, name: str) -> str:
+        """Accept "accent", "vant-accent" or "--vant-accent"."""
+        name = name.lstrip("-")
+        return name if name in self.by_var else f"vant-{kebab(name)}"
+
+    def tokenize_css(self, css: str) -> str:
+        """Replace colour literals that have a token with var() references."""
+        def hex_ref(m):
+            t = self.by_hex.get(f"#{m.group(1).upper()}")
+            return f"var(--{t.var})" if t else m.group(0)
+
+        def rgba_ref(m):
+            r, g, b, a = m.groups()
+            t = self.by_hex.get(f"#{int(r):02X}{int(g):02X}{int(b):02X}")
+            return f"rgb(var(--{t.var}-rgb) / {a})" if t else m.group(0)
+
+        return _RGBA.sub(rgba_ref, _HEX.sub(hex_ref, css))
+
+
+def hex_to_rgb(value: str) -> str:
+    return " ".join(str(int(value[i:i + 2], 16)) for i in (1, 3, 5))
+
+
+def _sources_digest() -> str:
+    h = hashlib.sha256()
+    for path in (APP_COLORS, MASTER_MD):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:20]
+
+
+@functools.lru_cache(maxsize=None)
+def load_table() -> TokenTable:
+    """Parsed token table, from the cache when the sources are unchanged."""
+    from generate_screenshots import CACHE_DIR
+
+    digest = _sources_digest()
+    cache_path = os.path.join(CACHE_DIR, "tokens", f"{digest}.json")
+    if os.path.exists(cache_path):
+        with open(cache_path, encoding="utf-8") as f:
+            return TokenTable([Token(**t) for t in json.load(f)], digest)
+
+    with open(APP_COLORS, encoding="utf-8") as f:
+        tokens = parse_dart_colors(f.read())
+    with open(MASTER_MD, encoding="utf-8") as f:
+        tokens += parse_master(f.read())
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump([asdict(t) for t in tokens], f, ensure_ascii=False, indent=1)
+    return TokenTable(tokens, digest)
+
+
+def root_css(*sources, overrides: dict = None) -> str:
+    return load_table().root_css(*sources, overrides=overrides)
+
+
+def used_tokens(html: str) -> dict:
+    """var → current value for every token a page's :root block declares
+    (html_page() declares only those its matching rules reference)."""
+    table = load_table()
+    root = _ROOT_BLOCK.search(html)
+    refs = {r[:-4] if r.endswith("-rgb") and r not in table.by_var else r
+            for r in _DECL.findall(root.group(1) if root else "")}
+    return {r: table.by_var[r].value for r in sorted(refs) if r in table.by_var}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile design tokens for the renderer.")
+    parser.add_argument("--diff", action="store_true",
+                        help="tokens changed since the last render and the frames they affect")
+    parser.add_argument("--lint", action="store_true",
+                        help="report colour literals in frame CSS that have a token")
+    args = parser.parse_args()
+
+    table = load_table()
+    from generate_screenshots import COMMON_CSS, FRAMES, frame_html, load_manifest
+
+    if args.lint:
+        found = 0
+        for name, css in [("COMMON_CSS", COMMON_CSS)] + [(s.name, s.css) for s in FRAMES]:
+            for m in list(_HEX.finditer(css)) + list(_RGBA.finditer(css)):
+                key = (f"#{m.group(1).upper()}" if m.re is _HEX
+                       else "#%02X%02X%02X" % tuple(int(v) for v in m.groups()[:3]))
+                if key in table.by_hex:
+                    print(f"  {name}: {m.group(0)} → --{table.by_hex[key].var}")
+                    found += 1
+        print(f"{found} literal(s) could use tokens")
+        raise SystemExit(1 if found else 0)
+
+    if args.diff:
+        import frames
+        manifest = load_manifest()
+        if not manifest:
+            raise SystemExit("No render manifest yet; run generate_screenshots.py first.")
+        for key, entry in manifest.items():
+            locale, _, name = key.split("/")
+            previous = entry.get("tokens", {})
+            current = used_tokens(frame_html(frames.load(name), locale=locale))
+            changed = sorted(k for k in set(previous) | set(current)
+                             if previous.get(k) != current.get(k))
+            status = "re-render" if changed else "unchanged"
+            print(f"  {key:<40} {status:<10} {', '.join(changed)}")
+        return
+
+    sources = {}
+    for t in table.by_var.values():
+        sources[t.source.split(":")[0]] = sources.get(t.source.split(":")[0], 0) + 1
+    print(f"  Token table {table.digest}: {len(table.by_var)} tokens "
+          f"({', '.join(f'{n} from {s}' for s, n in sources.items())})")
+    for spec in FRAMES:
+        print(f"  {spec.name:<22} uses {len(used_tokens(frame_html(spec)))} tokens")
+
+
+if __name__ == "__main__":
+    main()
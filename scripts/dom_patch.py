@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Hot page reuse: render content variants as DOM patches.
+
+Locale and A/B variants of one frame differ in a handful of text nodes
+and attributes, yet a full set_content() rebuilds style, layout and paint
+from nothing. In patch mode a frame's first variant is loaded normally;
+each following variant is diffed against the document already on the
+page and applied in place:
+
+  * same markup structure → one op per changed text node or attribute,
+  * otherwise → innerHTML of the deepest element enclosing the change,
+  * a change to <html> itself → full set_content().
+
+Changes outside <body> (the lang attribute of a locale switch, the
+stylesheet) still skip the reload but are captured in full, since they
+can restyle text that was not patched.
+
+The page records every element's box before and after the patch. If
+nothing outside the patched elements moved, only the dirty rectangle
+(patched boxes before and after, plus DIRTY_MARGIN for shadows and
+glows) is recaptured and pasted into the cached bitmap; otherwise the
+viewport is captured in full. --verify-patches also captures the full
+viewport and falls back to it whenever the merge differs.
+
+Usage:
+    python3 scripts/generate_screenshots.py --locale '*' --patch-variants
+    python3 scripts/generate_variants.py grid.json --patch-variants
+    python3 scripts/dom_patch.py appstore_2_home tr        # print the patch from the base locale
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+from html.parser import HTMLParser
+
+# CSS px added around the dirty rectangle (text-shadow, glows, AA fringes).
+DIRTY_MARGIN = 32
+# Above this fraction of the viewport a clipped capture saves nothing.
+FULL_CAPTURE_FRACTION = 0.6
+
+VOID_TAGS = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input",
+                       "link", "meta", "source", "track", "wbr"))
+
+stats = {"loads": 0, "patches": 0, "partial": 0, "full": 0, "fallbacks": 0,
+         "verify_mismatch": 0}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# DIFF
+# ═══════════════════════════════════════════════════════════════════════════
+
+class _Tokens(HTMLParser):
+    """Flat start/end/text token stream with element indices (document
+    order, as getElementsByTagName('*') numbers them) and raw offsets."""
+
+    def __init__(self, html: str):
+        super().__init__(convert_charrefs=True)
+        self.html = html
+        self.lines = [0]
+        for i, ch in enumerate(html):
+            if ch == "\n":
+                self.lines.append(i + 1)
+        self.tokens = []            # (kind, tag/text, element index, attrs)
+        self.stacks = []            # open element indices before each token
+        self.elements = []          # [tag, inner_start, inner_end]
+        self.texts = {}             # element index → non-blank text count
+        self._stack = []
+        self.feed(html)
+        self.close()
+
+    def _offset(self) -> int:
+        line, col = self.getpos()
+        return self.lines[line - 1] + col
+
+    def _push(self, token):
+        self.stacks.append(tuple(self._stack))
+        self.tokens.append(token)
+
+    def handle_starttag(self, tag, attrs):
+        index = len(self.elements)
+        start = self._offset() + len(self.get_starttag_text())
+        self.elements.append([tag, start, start])
+        self._push(("start", tag, index, tuple(attrs)))
+        if tag not in VOID_TAGS:
+            self._stack.append(index)
+
+    def handle_startendtag(self, tag, attrs):
+        index = len(self.elements)
+        end = self._offset() + len(self.get_starttag_text())
+        self.elements.append([tag, end, end])
+        self._push(("start", tag, index, tuple(attrs)))
+
+    def handle_endtag(self, tag):
+        # Like the HTML parser: an end tag closes any elements left open
+        # inside it (e.g. an unclosed <path> in <svg>); stray ones are ignored.
+        if tag in VOID_TAGS or not any(self.elements[i][0] == tag for i in self._stack):
+            return
+        offset = self._offset()
+        while True:
+            index = self._stack.pop()
+            self.elements[index][2] = offset
+            self._push(("end", self.elements[index][0], index, ()))
+            if self.elements[index][0] == tag:
+                return
+
+    def handle_data(self, data):
+        parent = self._stack[-1] if self._stack else -1
+        if data.strip():
+            self.texts[parent] = self.texts.get(parent, 0) + 1
+        self._push(("text", data, parent, ()))
+
+
+def _ordinal(doc: _Tokens, position: int) -> int:
+    """Index of a text token among its parent's non-blank text children."""
+    parent = doc.tokens[position][2]
+    return sum(1 for kind, data, p, _ in doc.tokens[:position]
+               if kind == "text" and p == parent and data.strip())
+
+
+def _loose(a, b) -> bool:
+    """Tokens that can be patched in place: same tag, or text of the same
+    kind (both blank or both not)."""
+    if a[0] != b[0]:
+        return False
+    if a[0] == "text":
+        return bool(a[1].strip()) == bool(b[1].strip())
+    return a[1] == b[1]
+
+
+def _token_ops(old: _Tokens, new: _Tokens, i: int, j: int) -> list:
+    a, b = old.tokens[i], new.tokens[j]
+    if a[0] == "end" or a[:2] == b[:2] and a[3] == b[3]:
+        return []
+    if a[0] == "start":
+        before, after = dict(a[3]), dict(b[3])
+        ops = []
+        for name in sorted(set(before) | set(after)):
+            if before.get(name, False) != after.get(name, False):
+                value = after.get(name, False)
+                ops.append({"op": "attr", "el": a[2], "tag": a[1], "name": name,
+                            "value": None if value is False else (value or "")})
+        return ops
+    if a[2] < 0:
+        return [None]
+    if a[1].strip():
+        return [{"op": "text", "el": a[2], "tag": old.elements[a[2]][0],
+                 "nth": _ordinal(old, i), "count": old.texts[a[2]], "value": b[1]}]
+    return [_inner_html(old, new, a[2])]          # whitespace may be significant
+
+
+def diff(old_html: str, new_html: str, old: _Tokens = None) -> dict:
+    """Patch turning the document `old_html` into `new_html`, or None when
+    only a full reload can. `old` is a cached parse of old_html.
+
+    Matching tokens are scanned from both ends, collecting text/attribute
+    ops; whatever structural change remains in the middle becomes one
+    innerHTML op on the deepest element enclosing it."""
+    old = old or _Tokens(old_html)
+    new = _Tokens(new_html)
+    n_old, n_new = len(old.tokens), len(new.tokens)
+    limit = min(n_old, n_new)
+    ops = []
+
+    prefix = 0
+    while prefix < limit and _loose(old.tokens[prefix], new.tokens[prefix]):
+        ops += _token_ops(old, new, prefix, prefix)
+        prefix += 1
+    suffix = 0
+    while (suffix < limit - prefix
+           and _loose(old.tokens[n_old - 1 - suffix], new.tokens[n_new - 1 - suffix])):
+        ops += _token_ops(old, new, n_old - 1 - suffix, n_new - 1 - suffix)
+        suffix += 1
+
+    if prefix + suffix < max(n_old, n_new):
+        # Indices of elements opened before `prefix` agree in both documents.
+        open_old = set(old.stacks[n_old - suffix]) if suffix else set()
+        open_new = set(new.stacks[n_new - suffix]) if suffix else set()
+        enclosing = [i for i in old.stacks[prefix] if i in open_old and i in open_new]
+        ops.append(_inner_html(old, new, enclosing[-1]) if enclosing else None)
+
+    if any(op is None or op["tag"] == "html" and op["op"] == "html" for op in ops):
+        return None
+    return {"count": len(old.elements), "ops": _collapse(old, ops)}
+
+
+def _inner_html(old: _Tokens, new: _Tokens, index: int):
+    if index < 0:
+        return None
+    tag, start, end = new.elements[index]
+    return {"op": "html", "el": index, "tag": old.elements[index][0],
+            "value": new.html[start:end]}
+
+
+def _collapse(old: _Tokens, ops: list) -> list:
+    """Drop ops on an element whose innerHTML is replaced, or inside one."""
+    replaced = [old.elements[op["el"]] for op in ops if op["op"] == "html"]
+    if not replaced:
+        return ops
+
+    def inside(index):
+        _, start, _ = old.elements[index]
+        return any(r_start <= start <= r_end for _, r_start, r_end in replaced)
+
+    seen, out = set(), []
+    for op in ops:
+        if op["op"] == "html":
+            if op["el"] not in seen and not any(
+                    r is not old.elements[op["el"]] and r[1] <= old.elements[op["el"]][1] <= r[2]
+                    for r in replaced):
+                seen.add(op["el"])
+                out.append(op)
+        elif not inside(op["el"]) and op["el"] not in seen:
+            out.append(op)
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PAGE SIDE
+# ═══════════════════════════════════════════════════════════════════════════
+
+APPLY_JS = """async ({count, ops}) => {
+  const all = document.getElementsByTagName('*');
+  if (all.length !== count) return {ok: false, reason: 'element count'};
+  const filled = n => n.nodeType === 3 && n.data.trim();
+  for (const op of ops) {
+    const el = all[op.el];
+    if (!el || el.tagName.toLowerCase() !== op.tag) return {ok: false, reason: 'tag ' + op.tag};
+    if (op.op === 'text' && Array.from(el.childNodes).filter(filled).length !== op.count)
+      return {ok: false, reason: 'text nodes'};
+  }
+  const elements = Array.from(all);
+  const box = e => { const r = e.getBoundingClientRect(); return [r.left, r.top, r.right, r.bottom]; };
+  const before = new Map(elements.map(e => [e, box(e)]));
+  const targets = ops.map(op => all[op.el]);
+  for (let i = 0; i < ops.length; i++) {
+    const op = ops[i], el = targets[i];
+    if (op.op === 'text') Array.from(el.childNodes).filter(filled)[op.nth].data = op.value;
+    else if (op.op === 'html') el.innerHTML = op.value;
+    else if (op.value === null) el.removeAttribute(op.name);
+    else el.setAttribute(op.name, op.value);
+  }
+  await document.fonts.ready;
+  await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+
+  const inside = e => targets.some(t => t.contains(e));
+  let dirty = null, moved = false, head = false;
+  const grow = r => {
+    if (r[2] <= r[0] || r[3] <= r[1]) return;
+    dirty = dirty ? [Math.min(dirty[0], r[0]), Math.min(dirty[1], r[1]),
+                     Math.max(dirty[2], r[2]), Math.max(dirty[3], r[3])] : r.slice();
+  };
+  for (const t of targets) if (!document.body.contains(t)) head = true;
+  for (const e of elements) {
+    const old = before.get(e);
+    if (inside(e)) { grow(old); if (e.isConnected) grow(box(e)); continue; }
+    const now = box(e);
+    if (now.some((v, i) => Math.abs(v - old[i]) > 0.01)) {
+      if (targets.some(t => e.contains(t))) { grow(old); grow(now); }
+      else moved = true;
+    }
+  }
+  for (const t of targets) for (const e of t.getElementsByTagName('*')) grow(box(e));
+  return {ok: true, moved, head, dirty};
+}"""
+
+
+class HotPage:
+    """One pooled page kept loaded across the variants of a frame."""
+
+    def __init__(self, page, viewport: dict, scale: float, verify: bool = False):
+        self.page = page
+        self.viewport = viewport
+        self.scale = scale
+        self.verify = verify
+        self.html = None
+        self._parsed = None
+        self.bitmap = None
+
+    async def _full(self) -> bytes:
+        import launch_tuner
+        png = await launch_tuner.screenshot(self.page)
+        self.bitmap = _image(png)
+        stats["full"] += 1
+        return png
+
+    async def load(self, html: str) -> bytes:
+        from generate_screenshots import settle_fonts
+
+        await self.page.set_content(html, wait_until="domcontentloaded")
+        await settle_fonts(self.page)                  # same settle as render_png
+        self.html, self._parsed = html, None
+        stats["loads"] += 1
+        return await self._full()
+
+    async def render(self, html: str) -> bytes:
+        """PNG of `html`, patched into the loaded document when possible."""
+        if self.html is None:
+            return await self.load(html)
+        if html == self.html:
+            return _encode(self.bitmap)
+        patch = diff(self.html, html, self._parsed)
+        if patch is None:
+            stats["fallbacks"] += 1
+            return await self.load(html)
+        result = await self.page.evaluate(APPLY_JS, patch)
+        if not result.get("ok"):
+            stats["fallbacks"] += 1
+            return await self.load(html)
+        stats["patches"] += 1
+        self.html, self._parsed = html, None
+
+        clip = self._clip(result)
+        if clip is None:
+            return await self._full()
+        part = await self.page.screenshot(type="png", clip=clip)
+        merged = self.bitmap.copy()
+        merged.paste(_image(part), (round(clip["x"] * self.scale), round(clip["y"] * self.scale)))
+        if self.verify:
+            import launch_tuner
+            full = await self._full()
+            if not launch_tuner.pixel_diff(full, _encode(merged))["ok"]:
+                stats["verify_mismatch"] += 1
+                return full
+        self.bitmap = merged
+        stats["partial"] += 1
+        return _encode(merged)
+
+    def _clip(self, result: dict):
+        dirty = result.get("dirty")
+        if result.get("moved") or result.get("head") or not dirty:
+            return None
+        width, height = self.viewport["width"], self.viewport["height"]
+        x0 = max(0, int(dirty[0]) - DIRTY_MARGIN)
+        y0 = max(0, int(dirty[1]) - DIRTY_MARGIN)
+        x1 = min(width, int(dirty[2]) + 1 + DIRTY_MARGIN)
+        y1 = min(height, int(dirty[3]) + 1 + DIRTY_MARGIN)
+        if x1 <= x0 or y1 <= y0 or (x1 - x0) * (y1 - y0) > FULL_CAPTURE_FRACTION * width * height:
+            return None
+        return {"x": x0, "y": y0, "width": x1 - x0, "height": y1 - y0}
+
+
+def _image(png: bytes):
+    try:
+        from PIL import Image
+    except ImportError:
+        print("ERROR: Pillow is required for --patch-variants.")
+        print("  pip install pillow --break-system-packages")
+        sys.exit(1)
+    image = Image.open(io.BytesIO(png))
+    image.load()
+    return image
+
+
+def _encode(image) -> bytes:
+    buf = io.BytesIO()
+    image.save(buf, format="PNG", compress_level=6)
+    return buf.getvalue()
+
+
+@contextlib.asynccontextmanager
+async def hot_page(pool, device: str, verify: bool = False):
+    """Borrow a pooled page for a group of variants of one frame/device."""
+    from generate_screenshots import device_profile
+
+    viewport, scale = device_profile(device)
+    async with pool.page(viewport, scale) as page:
+        yield HotPage(page, viewport, scale, verify)
+
+
+def format_stats() -> str:
+    return (f"patch mode · {stats['loads']} loads · {stats['patches']} patches "
+            f"({stats['partial']} dirty-rect, {stats['full']} full captures) · "
+            f"{stats['fallbacks']} fallbacks"
+            + (f" · {stats['verify_mismatch']} verify mismatches" if stats["verify_mismatch"] else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the DOM patch between two variants.")
+    parser.add_argument("frame")
+    parser.add_argument("locale", help="target locale (patched from the base locale)")
+    args = parser.parse_args()
+
+    import frames
+    from generate_screenshots import LOCALE, frame_html
+
+    spec = frames.load(args.frame)
+    patch = diff(frame_html(spec, locale=LOCALE), frame_html(spec, locale=args.locale))
+    if patch is None:
+        print("full reload (the change reaches <html>)")
+        return
+    for op in patch["ops"]:
+        detail = op.get("name", "") if op["op"] == "attr" else ""
+        value = json.dumps(op["value"], ensure_ascii=False)
+        print(f"  {op['op']:<5} <{op['tag']}>#{op['el']:<4} {detail:<8} "
+              f"{value[:70]}{'…' if len(value) > 70 else ''}")
+    print(f"  {len(patch['ops'])} op(s) on {patch['count']} elements")
+
+
+if __name__ == "__main__":
+    main()
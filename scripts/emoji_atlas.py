@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Pre-rasterized emoji sprite atlas.
+
+The frames use dozens of emoji as icons (tab bar, expense rows, badges,
+the hook), often under drop-shadow/grayscale filters, and every page makes
+Chromium rasterize colour-emoji glyphs again at large sizes. The atlas
+builder:
+
+  1. scans every frame × locale for emoji sequences and measures, in one
+     page.evaluate per page, the font size each occurrence renders at,
+  2. rasterizes each distinct emoji once, at the largest size it was
+     measured at, into a transparent sprite sheet at ATLAS_SCALE device
+     pixels per CSS pixel,
+  3. lets frame_html() wrap every occurrence of a known emoji in a span
+     that keeps the glyph (painted transparent, so layout is unchanged)
+     and shows its cell as an em-sized background.
+
+Cells are keyed by emoji alone and placed in em units, so one cell serves
+any font size and any page: variants, export data, fitted text and
+DOM-patched locales all get sprites. Only emoji the atlas has never seen
+stay text. Container filters still apply to the sprite, so filtered
+variants need no extra cells. Above ATLAS_SCALE device pixels per CSS
+pixel (tiled 3×/4× exports) a resolution media query falls back to the
+glyphs instead of upscaling the sheet. Sheet and cells are cached under
+.screenshot_cache/emoji_atlas/, keyed by the frame bodies and scale;
+pages fetch the sheet from memory through one route per browser context.
+
+Usage:
+    python3 scripts/emoji_atlas.py                  # build / refresh the atlas
+    python3 scripts/generate_screenshots.py --emoji-atlas
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+
+ATLAS_ORIGIN = "https://assets.vantag.invalid"
+ATLAS_SCALE = 2                 # above every store slot's device scale factor
+ATLAS_VERSION = 2               # bump when the cached data layout changes
+SHEET_WIDTH = 2048
+
+# Emoji-presentation symbols in the BMP; other BMP symbols (→, ✓, ★ …) are
+# text unless followed by VS16.
+_BMP_EMOJI = (
+    "\u231A\u231B\u23E9-\u23EC\u23F0\u23F3\u25FD\u25FE\u2614\u2615\u2648-\u2653"
+    "\u267F\u2693\u26A1\u26AA\u26AB\u26BD\u26BE\u26C4\u26C5\u26CE\u26D4\u26EA"
+    "\u26F2\u26F3\u26F5\u26FA\u26FD\u2705\u270A\u270B\u2728\u274C\u274E"
+    "\u2753-\u2755\u2757\u2795-\u2797\u27B0\u27BF\u2B1B\u2B1C\u2B50\u2B55"
+)
+_PICTO = "\U0001F000-\U0001FAFF"
+_TONE = "[\U0001F3FB-\U0001F3FF]?"
+_BASE = f"(?:[{_PICTO}]\uFE0F?|[{_BMP_EMOJI}]\uFE0F?|[\u2000-\u2BFF]\uFE0F)"
+EMOJI = re.compile(
+    "[\U0001F1E6-\U0001F1FF]{2}"                      # flags
+    "|[0-9#*]\uFE0F\u20E3"                            # keycaps
+    f"|{_BASE}{_TONE}(?:\u200D{_BASE}{_TONE})*"        # ZWJ sequences
+)
+_MARKUP = re.compile(r"(<style\b.*?</style>|<script\b.*?</script>|<[^>]+>)", re.S | re.I)
+
+MEASURE_SCRIPT = """
+async () => {
+    await document.fonts.ready;
+    return [...document.querySelectorAll('[data-emoji]')]
+        .map(el => parseFloat(getComputedStyle(el).fontSize));
+}
+"""
+
+SHEET_SCRIPT = """
+async () => {
+    await document.fonts.ready;
+    const sheet = document.querySelector('.sheet').getBoundingClientRect();
+    const cells = [...document.querySelectorAll('.g')].map(g => {
+        const r = g.getBoundingClientRect();
+        return [r.left - sheet.left, r.top - sheet.top, r.width, r.height];
+    });
+    return {size: [sheet.width, sheet.height], cells};
+}
+"""
+
+active = None
+
+
+def body_of(html: str) -> str:
+    return html.partition("<body>")[2]
+
+
+def body_key(html: str) -> str:
+    return hashlib.sha256(body_of(html).encode("utf-8")).hexdigest()[:20]
+
+
+def scan(html: str, replace):
+    """Apply `replace(index, emoji)` to every emoji in text content only."""
+    parts = _MARKUP.split(html)
+    index = 0
+    for i in range(0, len(parts), 2):          # even parts are text
+        def sub(m):
+            nonlocal index
+            out = replace(index, m.group(0))
+            index += 1
+            return out
+        parts[i] = EMOJI.sub(sub, parts[i])
+    return "".join(parts)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# ATLAS
+# ═══════════════════════════════════════════════════════════════════════════
+
+class EmojiAtlas:
+    """Cached sprite sheet with one em-placed cell per emoji."""
+
+    def __init__(self, data: dict, png: bytes):
+        self.scale = data["scale"]
+        self.cells = data["cells"]             # emoji → [x, y, w, h, size] in sheet px
+        self.sheet_w, self.sheet_h = data["size"]
+        self.classes = {emoji: f"emoji-{i}" for i, emoji in enumerate(self.cells)}
+        self.png = png
+        self.url = f"{ATLAS_ORIGIN}/emoji-{hashlib.sha256(png).hexdigest()[:16]}.png"
+
+    def css(self) -> str:
+        rules = [f".emoji-sprite {{ color: transparent; text-shadow: none; "
+                 f"background-image: url({self.url}); background-repeat: no-repeat; }}"]
+        for emoji, (x, y, _, _, size) in self.cells.items():
+            # The span's content area is the glyph box measured on the
+            # sheet, scaled by font-size / size.
+            rules.append(f".{self.classes[emoji]} {{ "
+                         f"background-size: {self.sheet_w / size:.4f}em {self.sheet_h / size:.4f}em; "
+                         f"background-position: {-x / size:.4f}em {-y / size:.4f}em; }}")
+        rules.append(f"@media (min-resolution: {self.scale + 0.01:g}dppx) {{ "
+                     f".emoji-sprite {{ color: inherit; text-shadow: inherit; "
+                     f"background-image: none; }} }}")
+        return "\n".join(rules)
+
+    def substitute(self, html: str) -> str:
+        def sprite(index, emoji):
+            cls = self.classes.get(emoji)
+            if cls is None:
+                return emoji
+            return f'<span class="emoji-sprite {cls}">{emoji}</span>'
+
+        return scan(html, sprite)
+
+    async def install(self, context):
+        async def handle(route):
+            await route.fulfill(status=200, body=self.png, headers={
+                "Content-Type": "image/png",
+                "Access-Control-Allow-Origin": "*",
+            })
+
+        await context.route(self.url, handle)
+
+
+def frame_pages(locales):
+    """Pre-substitution HTML of every frame in every locale."""
+    from generate_screenshots import FRAMES, available_locales, frame_html
+
+    return [frame_html(spec, locale=locale)
+            for locale in locales or available_locales() for spec in FRAMES]
+
+
+def atlas_paths(pages, scale):
+    from generate_screenshots import CACHE_DIR
+
+    h = hashlib.sha256(f"v{ATLAS_VERSION} scale={scale}".encode())
+    for page in pages:
+        h.update(body_of(page).encode("utf-8"))
+    key = h.hexdigest()[:24]
+    base = os.path.join(CACHE_DIR, "emoji_atlas", key)
+    return f"{base}.json", f"{base}.png"
+
+
+def sheet_html(cells) -> str:
+    from generate_screenshots import COMMON_CSS
+
+    font_stack = COMMON_CSS.split("font-family:", 1)[1].split(";", 1)[0]
+    spans = "".join(
+        f'<span class="cell" style="font-size:{size:g}px"><span class="g">{emoji}</span></span>'
+        for emoji, size in cells
+    )
+    return f"""<!DOCTYPE html><html><head><meta charset="utf-8"><style>
+html, body {{ margin: 0; background: transparent; font-family: {font_stack}; }}
+.sheet {{ display: flex; flex-wrap: wrap; align-items: flex-start; width: {SHEET_WIDTH}px; }}
+.cell {{ line-height: normal; padding: 2px; white-space: pre; }}
+</style></head><body><div class="sheet">{spans}</div></body></html>"""
+
+
+async def build(pool, pages, scale=ATLAS_SCALE) -> tuple:
+    """Measure occurrences on every page, then rasterize each emoji once at
+    its largest size."""
+    from generate_screenshots import DEVICE, device_profile
+
+    viewport, _ = device_profile(DEVICE)
+
+    async def measure(html):
+        marked = scan(html, lambda i, e: f'<span data-emoji="{i}">{e}</span>')
+        async with pool.page(viewport, 1) as page:
+            await page.set_content(marked, wait_until="domcontentloaded")
+            sizes = await page.evaluate(MEASURE_SCRIPT)
+        return body_key(html), [round(s * 2) / 2 for s in sizes]
+
+    measured = dict(await asyncio.gather(*(measure(html) for html in pages)))
+
+    largest = {}
+    for html in pages:
+        sizes = measured[body_key(html)]
+
+        def record(i, emoji):
+            if i < len(sizes):
+                largest[emoji] = max(sizes[i], largest.get(emoji, 0))
+            return emoji
+
+        scan(html, record)
+    cells = list(largest.items())
+
+    html = sheet_html(cells)
+    async with pool.page({"width": SHEET_WIDTH, "height": 1024}, 1) as page:
+        await page.set_content(html, wait_until="domcontentloaded")
+        height = math.ceil((await page.evaluate(SHEET_SCRIPT))["size"][1])
+    # Lay out again in a viewport as tall as the sheet, so one clipped
+    # page.screenshot() — which both backends implement — covers it.
+    async with pool.page({"width": SHEET_WIDTH, "height": max(height, 1)}, scale) as page:
+        await page.set_content(html, wait_until="domcontentloaded")
+        layout = await page.evaluate(SHEET_SCRIPT)
+        width, height = (max(math.ceil(v), 1) for v in layout["size"])
+        png = await page.screenshot(clip={"x": 0, "y": 0, "width": width, "height": height},
+                                    omit_background=True)
+
+    data = {
+        "scale": scale,
+        "size": layout["size"],
+        "cells": {e: [round(v, 2) for v in rect] + [s]
+                  for (e, s), rect in zip(cells, layout["cells"])},
+    }
+    return data, png
+
+
+async def _build_standalone(pages, scale, args=None):
+    """build() on a pool of its own: launched like the render pool (backend,
+    launch profile, warm profile) when given the parsed flags."""
+    from browser_pool import BrowserPool
+    from generate_screenshots import load_backend, load_playwright, pool_options
+
+    options = pool_options(args) if args else {}
+    options["viewport"] = {"width": SHEET_WIDTH, "height": 1024}
+    async_playwright = load_backend(args) if args else load_playwright()
+    async with async_playwright() as p:
+        async with BrowserPool(p, **options) as pool:
+            return await build(pool, pages, scale)
+
+
+async def load_or_build_async(locales=None, scale=ATLAS_SCALE, force=False,
+                              args=None) -> EmojiAtlas:
+    pages = frame_pages(locales)
+    json_path, png_path = atlas_paths(pages, scale)
+    if force or not (os.path.exists(json_path) and os.path.exists(png_path)):
+        data, png = await _build_standalone(pages, scale, args)
+        os.makedirs(os.path.dirname(json_path), exist_ok=True)
+        with open(png_path, "wb") as f:
+            f.write(png)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+    with open(json_path, encoding="utf-8") as f:
+        data = json.load(f)
+    with open(png_path, "rb") as f:
+        return EmojiAtlas(data, f.read())
+
+
+def load_or_build(locales=None, scale=ATLAS_SCALE, force=False) -> EmojiAtlas:
+    return asyncio.run(load_or_build_async(locales, scale, force))
+
+
+async def enable(args=None, locales=None, scale=ATLAS_SCALE) -> EmojiAtlas:
+    """Build (or load) the atlas and substitute sprites from now on."""
+    global active
+    if active is None:
+        active = await load_or_build_async(locales, scale, args=args)
+    return active
+
+
+def page_css() -> str:
+    return active.css() if active else ""
+
+
+def substitute(html: str) -> str:
+    return active.substitute(html) if active else html
+
+
+async def setup_context(context):
+    if active:
+        await active.install(context)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the emoji sprite atlas.")
+    parser.add_argument("--locale", nargs="*", help="locales (default: all)")
+    parser.add_argument("--scale", type=float, default=ATLAS_SCALE,
+                        help="device pixels per CSS pixel in the sheet")
+    parser.add_argument("--force", action="store_true", help="rebuild even if cached")
+    args = parser.parse_args()
+
+    atlas = load_or_build(args.locale, args.scale, args.force)
+    print(f"  Sprites     : {len(atlas.cells)}")
+    print(f"  Sheet       : {atlas.sheet_w:g} × {atlas.sheet_h:g} CSS px @{args.scale:g}x, "
+          f"{len(atlas.png) / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,688 @@
+#!/usr/bin/env python3
+"""
+Frame content from the app's expense export.
+
+ExportService.exportToExcel (lib/services/export_service.dart) writes a
+Vantag_Rapor_*.xlsx whose expenses sheet ("Harcamalar" / "Expenses") has
+localized Date, Time, Amount, Currency, Category, Decision and Hours
+Equiv. columns; a CSV with the same headers (comma or semicolon
+separated) works too. With --export-data PATH the reports frame's stats,
+category legend and pie slices and the home frame's recent expenses come
+from that file instead of the hard-coded demo values.
+
+Rows are streamed: the xlsx sheet is read from the ZIP block by block and
+scanned one complete row at a time, and CSV goes through csv.reader.
+Every CHUNK_ROWS rows become NumPy arrays (amount, hours, category code,
+decision code, timestamp) that are folded into running totals with
+bincount, plus a running top-RECENT by timestamp, so memory follows the
+chunk size, not the file. Only the xlsx shared-string table
+(unique cell texts) is held whole. The summary is cached under
+.screenshot_cache/export_data/ by the file's path, size and mtime.
+
+Frame text stays localized: numbers inside the locale's own strings
+("15.3 saat karşılığı", "12 bought · 12 passed") are replaced in place.
+
+Usage:
+    python3 scripts/generate_screenshots.py --export-data Vantag_Rapor_2026-02-08_16-10.xlsx
+    python3 scripts/export_data.py export.csv               # summary + timing
+    python3 scripts/export_data.py --demo 300000 demo.xlsx  # synthetic export
+"""
+
+import argparse
+import codecs
+import csv
+import datetime
+import hashlib
+import html
+import itertools
+import json
+import os
+import random
+import re
+import sys
+import time
+import zipfile
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils import escape
+
+CHUNK_ROWS = 65536
+READ_BYTES = 1 << 20
+RECENT = 3
+LEGEND_SLICES = 5           # top categories, the last one absorbing the rest
+# Bump when the summary format changes.
+SUMMARY_VERSION = 1
+
+EXPENSE_SHEETS = ("Harcamalar", "Expenses")
+
+# column → header in each app language (app_tr.arb / app_en.arb).
+HEADERS = {
+    "date": ("Tarih", "Date"),
+    "time": ("Saat", "Time"),
+    "amount": ("Tutar", "Amount"),
+    "currency": ("Para Birimi", "Currency"),
+    "category": ("Kategori", "Category"),
+    "decision": ("Karar", "Decision"),
+    "hours": ("Saat Karşılığı", "Hours Equiv."),
+}
+REQUIRED = ("date", "amount", "category")
+
+# Decision codes; rows without a decision count as spent.
+SPENT, THINKING, PASSED = 0, 1, 2
+DECISIONS = {"aldım": SPENT, "bought": SPENT, "düşünüyorum": THINKING, "thinking": THINKING,
+             "vazgeçtim": PASSED, "passed": PASSED}
+
+# App category key (ExpenseCategory) → colour token, icon and the names
+# the frames use per locale. The export writes the app's localized name.
+CATEGORIES = {
+    "Yiyecek":    ("category-food", "🍕", {"tr": "Yeme-İçme", "en": "Food & Drink",
+                                          "de": "Essen & Trinken"}, ("Food",)),
+    "Ulaşım":     ("category-transport", "🚌", {"tr": "Ulaşım", "en": "Transport",
+                                               "de": "Verkehr"}, ()),
+    "Giyim":      ("category-shopping", "👕", {"tr": "Giyim", "en": "Clothing",
+                                              "de": "Kleidung"}, ()),
+    "Elektronik": ("category-digital", "📱", {"tr": "Elektronik", "en": "Electronics",
+                                             "de": "Elektronik"}, ()),
+    "Eğlence":    ("category-entertainment", "🎬", {"tr": "Eğlence", "en": "Entertainment",
+                                                   "de": "Unterhaltung"}, ()),
+    "Sağlık":     ("category-health", "💊", {"tr": "Sağlık", "en": "Health",
+                                            "de": "Gesundheit"}, ()),
+    "Eğitim":     ("category-education", "📚", {"tr": "Eğitim", "en": "Education",
+                                               "de": "Bildung"}, ()),
+    "Faturalar":  ("category-bills", "📄", {"tr": "Faturalar", "en": "Bills",
+                                           "de": "Rechnungen"}, ()),
+    "Abonelik":   ("primary", "🔔", {"tr": "Abonelik", "en": "Subscription",
+                                    "de": "Abonnement"}, ()),
+    "Diğer":      ("category-other", "📦", {"tr": "Diğer", "en": "Other",
+                                           "de": "Sonstiges"}, ()),
+}
+OTHER = "Diğer"
+
+MONTHS = {
+    "tr": ("Oca", "Şub", "Mar", "Nis", "May", "Haz", "Tem", "Ağu", "Eyl", "Eki", "Kas", "Ara"),
+    "en": ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+    "de": ("Jan.", "Feb.", "März", "Apr.", "Mai", "Juni", "Juli", "Aug.", "Sep.", "Okt.",
+           "Nov.", "Dez."),
+}
+DATE_FORMATS = {"tr": "{d} {m} {y}", "en": "{m} {d}, {y}", "de": "{d}. {m} {y}"}
+CURRENCY_SYMBOLS = {"TRY": "₺", "USD": "$", "EUR": "€", "GBP": "£"}
+
+XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+active = None           # summary of the --export-data file
+
+
+class ExportError(Exception):
+    pass
+
+
+def load_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        print("ERROR: NumPy is required to aggregate export data.")
+        print("  pip install numpy --break-system-packages")
+        sys.exit(1)
+    return np
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# STREAMING READERS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _column_index(ref: str) -> int:
+    index = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        index = index * 26 + ord(ch.upper()) - 64
+    return index - 1
+
+
+def _shared_strings(zf: zipfile.ZipFile) -> list:
+    if "xl/sharedStrings.xml" not in zf.namelist():
+        return []
+    strings = []
+    with zf.open("xl/sharedStrings.xml") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == f"{XLSX_NS}si":
+                strings.append("".join(t.text or "" for t in elem.iter(f"{XLSX_NS}t")))
+                elem.clear()
+    return strings
+
+
+def _expense_sheet(zf: zipfile.ZipFile) -> str:
+    """ZIP member of the expenses sheet, else of the first sheet."""
+    with zf.open("xl/workbook.xml") as f:
+        sheets = [(e.get("name"), e.get(f"{REL_NS}id"))
+                  for _, e in iterparse(f) if e.tag == f"{XLSX_NS}sheet"]
+    with zf.open("xl/_rels/workbook.xml.rels") as f:
+        targets = {e.get("Id"): e.get("Target")
+                   for _, e in iterparse(f) if e.tag == f"{PKG_REL_NS}Relationship"}
+    if not sheets:
+        raise ExportError("workbook has no sheets")
+    rid = next((rid for name, rid in sheets if name in EXPENSE_SHEETS), sheets[0][1])
+    target = targets[rid].lstrip("/")
+    return target if target.startswith("xl/") else f"xl/{target}"
+
+
+# Worksheet XML is regular enough to scan row by row with patterns, which
+# is several times faster than per-element callbacks (tags may carry a
+# namespace prefix; empty rows and cells may be self-closing).
+_ROW = re.compile(r"<(?:\w+:)?row\b[^>]*?(?:/>|>(.*?)</(?:\w+:)?row>)", re.S)
+_CELL = re.compile(r"<(?:\w+:)?c\b([^>]*?)(?:/>|>(.*?)</(?:\w+:)?c>)", re.S)
+_CELL_REF = re.compile(r'\br="([A-Za-z]+)')
+_CELL_TYPE = re.compile(r'\bt="(\w+)"')
+_CELL_TEXT = re.compile(r"<(?:\w+:)?[vt](?:\s[^>]*)?>([^<]*)<")
+
+
+def _cell_value(attrs: str, inner: str, shared: list) -> str:
+    if inner.startswith("<v>") and inner.endswith("</v>"):
+        value = inner[3:-4]
+    elif inner.startswith("<is><t>") and inner.endswith("</t></is>") and "<" not in inner[7:-9]:
+        value = inner[7:-9]
+    else:
+        value = "".join(_CELL_TEXT.findall(inner)) if inner else ""
+    if 't="s"' in attrs and value:
+        return shared[int(value)]
+    return html.unescape(value) if "&" in value else value
+
+
+def _sheet_row(body: str, shared: list) -> list:
+    cells = _CELL.findall(body)
+    row = [_cell_value(attrs, inner, shared) for attrs, inner in cells]
+    if not cells:
+        return row
+    # Refs only matter when cells were skipped: a row whose last cell sits
+    # in column len(cells) is dense.
+    last = _CELL_REF.search(cells[-1][0])
+    if last is None or _column_index(last.group(1)) == len(cells) - 1:
+        return row
+    placed = []
+    for (attrs, _), value in zip(cells, row):
+        ref = _CELL_REF.search(attrs)
+        index = _column_index(ref.group(1)) if ref else len(placed)
+        placed.extend([""] * (index + 1 - len(placed)))
+        placed[index] = value
+    return placed
+
+
+def xlsx_rows(path: str):
+    """Yield each row of the expenses sheet as a list of cell strings,
+    reading the sheet from the ZIP in READ_BYTES blocks."""
+    with zipfile.ZipFile(path) as zf:
+        shared = _shared_strings(zf)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        with zf.open(_expense_sheet(zf)) as f:
+            buffer = ""
+            while True:
+                block = f.read(READ_BYTES)
+                buffer += decoder.decode(block, final=not block)
+                consumed = 0
+                for m in _ROW.finditer(buffer):
+                    consumed = m.end()
+                    yield _sheet_row(m.group(1) or "", shared)
+                buffer = buffer[consumed:]
+                if not block:
+                    break
+
+
+def csv_rows(path: str):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        sample = f.read(8192)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        yield from csv.reader(f, dialect)
+
+
+def read_rows(path: str):
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        return xlsx_rows(path)
+    return csv_rows(path)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PARSING
+# ═══════════════════════════════════════════════════════════════════════════
+
+_NUMBER = re.compile(r"-?[\d.,]+")
+_SEPARATED = re.compile(r"[.,]")
+
+
+def parse_amount(text: str) -> float:
+    """Amounts as the export formats them ("₺1.000,00", "$1,250.50",
+    "990 ₺") or as a plain number."""
+    m = _NUMBER.search(text)
+    if not m:
+        return float("nan")
+    number = m.group().rstrip(".,")
+    seps = _SEPARATED.findall(number)
+    if seps:
+        last = max(number.rfind("."), number.rfind(","))
+        decimals = len(number) - last - 1
+        if len(set(seps)) == 2 or (len(seps) == 1 and decimals != 3):
+            number = re.sub(r"[.,]", "", number[:last]) + "." + number[last + 1:]
+        else:
+            number = re.sub(r"[.,]", "", number)
+    try:
+        return float(number)
+    except ValueError:
+        return float("nan")
+
+
+def parse_stamp(date: str, clock: str = "") -> int:
+    """yyyymmddHHMM of "dd.MM.yyyy" (tr), "MM/dd/yyyy" (en), ISO or an
+    Excel serial date; 0 when unreadable."""
+    date = date.strip()
+    try:
+        if date.count(".") == 2:
+            d, m, y = date.split(".")
+        elif "/" in date:
+            m, d, y = date.split("/")
+        elif "-" in date:
+            y, m, d = date[:10].split("-")
+        else:
+            serial = datetime.date(1899, 12, 30) + datetime.timedelta(days=float(date))
+            y, m, d = serial.year, serial.month, serial.day
+        hh, mm = (clock.split(":") + ["0"])[:2] if ":" in clock else (0, 0)
+        return (int(y) * 100000000 + int(m) * 1000000 + int(d) * 10000
+                + int(hh) * 100 + int(mm))
+    except (ValueError, OverflowError):
+        return 0
+
+
+def _category_aliases() -> dict:
+    aliases = {}
+    for key, (_, _, names, extra) in CATEGORIES.items():
+        for name in (key, *names.values(), *extra):
+            aliases[name.casefold()] = key
+    return aliases
+
+
+def _columns(header: list) -> dict:
+    lookup = {h.strip().casefold(): i for i, h in enumerate(header)}
+    columns = {}
+    for column, names in HEADERS.items():
+        for name in names:
+            if name.casefold() in lookup:
+                columns[column] = lookup[name.casefold()]
+                break
+    missing = [c for c in REQUIRED if c not in columns]
+    if missing:
+        raise ExportError(f"missing column(s) {', '.join(missing)}; header row: {header}")
+    return columns
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# AGGREGATION
+# ═══════════════════════════════════════════════════════════════════════════
+
+def aggregate(rows) -> dict:
+    """Fold a row stream (header first) into the summary, CHUNK_ROWS at a time."""
+    np = load_numpy()
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        raise ExportError("empty export")
+    col = _columns(header)
+    width = max(col.values()) + 1
+    aliases = _category_aliases()
+    codes = {}                                  # category key → code
+    totals = np.zeros(0)
+    by_decision = {"count": np.zeros(3, np.int64), "amount": np.zeros(3), "hours": np.zeros(3)}
+    has_hours = "hours" in col
+    recent = []                                 # (-stamp, row, amount, category code, hours)
+    symbol = None
+    count = 0
+
+    while True:
+        chunk = list(itertools.islice(rows, CHUNK_ROWS))
+        if not chunk:
+            break
+        chunk = [r + [""] * (width - len(r)) for r in chunk if any(r)]
+        if not chunk:
+            continue
+        if symbol is None:
+            currency = chunk[0][col["currency"]].strip() if "currency" in col else ""
+            symbol = (re.sub(r"[\d\s.,-]", "", chunk[0][col["amount"]])
+                      or CURRENCY_SYMBOLS.get(currency, currency))
+        amounts = np.array([parse_amount(r[col["amount"]]) for r in chunk])
+        hours = (np.array([parse_amount(r[col["hours"]]) for r in chunk]) if has_hours
+                 else np.full(len(chunk), np.nan))
+        category = np.array([codes.setdefault(
+            aliases.get(r[col["category"]].strip().casefold(), r[col["category"]].strip()),
+            len(codes)) for r in chunk], np.int32)
+        decision = np.array([DECISIONS.get(r[col["decision"]].strip().casefold(), SPENT)
+                             if "decision" in col else SPENT for r in chunk], np.int8)
+        stamps = np.array([parse_stamp(r[col["date"]], r[col["time"]] if "time" in col else "")
+                           for r in chunk], np.int64)
+
+        valid = ~np.isnan(amounts)
+        amounts, hours = amounts[valid], hours[valid]
+        category, decision, stamps = category[valid], decision[valid], stamps[valid]
+        hours = np.nan_to_num(hours)
+
+        by_decision["count"] += np.bincount(decision, minlength=3)
+        by_decision["amount"] += np.bincount(decision, weights=amounts, minlength=3)
+        by_decision["hours"] += np.bincount(decision, weights=hours, minlength=3)
+        spent = decision == SPENT
+        chunk_totals = np.bincount(category[spent], weights=amounts[spent], minlength=len(codes))
+        totals = np.pad(totals, (0, len(codes) - len(totals))) + chunk_totals
+
+        candidates = np.flatnonzero(spent)
+        if len(candidates) > RECENT:
+            top = np.argpartition(stamps[candidates], -RECENT)[-RECENT:]
+            candidates = candidates[top]
+        recent.extend((-int(stamps[i]), count + int(i), float(amounts[i]), int(category[i]),
+                       float(hours[i])) for i in candidates)
+        recent = sorted(recent)[:RECENT]
+        count += len(amounts)
+
+    names = {code: key for key, code in codes.items()}
+    categories = sorted(((names[i], float(v)) for i, v in enumerate(totals) if v > 0),
+                        key=lambda kv: (-kv[1], kv[0]))
+
+    def group(code):
+        return {"count": int(by_decision["count"][code]),
+                "amount": round(float(by_decision["amount"][code]), 2),
+                "hours": round(float(by_decision["hours"][code]), 2) if has_hours else None}
+
+    return {
+        "version": SUMMARY_VERSION,
+        "rows": count,
+        "currency": symbol or "₺",
+        "spent": group(SPENT),
+        "thinking": group(THINKING),
+        "passed": group(PASSED),
+        "categories": [[k, round(v, 2)] for k, v in categories],
+        "recent": [{"stamp": -s, "amount": a, "category": names[c],
+                    "hours": h if has_hours else None} for s, _, a, c, h in recent],
+    }
+
+
+def _cache_path(path: str) -> str:
+    from generate_screenshots import CACHE_DIR
+    st = os.stat(path)
+    raw = f"{SUMMARY_VERSION}|{os.path.realpath(path)}|{st.st_size}|{st.st_mtime_ns}"
+    return os.path.join(CACHE_DIR, "export_data",
+                        hashlib.sha256(raw.encode("utf-8")).hexdigest()[:20] + ".json")
+
+
+def summarize(path: str) -> dict:
+    """The export's summary, from the cache when the file is unchanged."""
+    cache = _cache_path(path)
+    try:
+        with open(cache, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    summary = aggregate(read_rows(path))
+    summary["source"] = os.path.basename(path)
+    os.makedirs(os.path.dirname(cache), exist_ok=True)
+    with open(cache, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=1)
+    return summary
+
+
+def enable(path: str) -> dict:
+    global active
+    try:
+        active = summarize(path)
+    except (OSError, zipfile.BadZipFile, KeyError, ExportError) as e:
+        print(f"ERROR: cannot read export {path}: {e}")
+        sys.exit(1)
+    return active
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# FRAME CONTENT
+# ═══════════════════════════════════════════════════════════════════════════
+
+def money(value: float, symbol: str) -> str:
+    return f"{round(value):,}".replace(",", ".") + f" {symbol}"
+
+
+def compact(value: float) -> str:
+    for size, suffix in ((1e6, "M"), (1e3, "K")):
+        if value >= size:
+            return f"{value / size:.1f}{suffix}"
+    return f"{round(value)}"
+
+
+def renumber(text: str, *values) -> str:
+    """Replace the numbers in localized `text`, in order, keeping each one's
+    decimal separator and precision ("15,3 Arbeitsstunden")."""
+    values = iter(values)
+
+    def sub(m):
+        try:
+            value = next(values)
+        except StopIteration:
+            return m.group()
+        if value is None:
+            return m.group()
+        whole, sep, frac = re.match(r"(\d+)(?:([.,])(\d+))?", m.group()).groups()
+        if sep:
+            return f"{value:.{len(frac)}f}".replace(".", sep)
+        return f"{round(value)}"
+
+    return re.sub(r"\d+(?:[.,]\d+)?", sub, text)
+
+
+def _token_hex(key: str) -> str:
+    import design_tokens
+    return design_tokens.load_table().value(f"vant-{CATEGORIES.get(key, CATEGORIES[OTHER])[0]}")
+
+
+def _category_name(key: str, locale: str) -> str:
+    names = CATEGORIES[key][2] if key in CATEGORIES else None
+    return names.get(locale, names["en"]) if names else key
+
+
+def _date(stamp: int, locale: str) -> str:
+    y, m, d = stamp // 100000000, stamp // 1000000 % 100, stamp // 10000 % 100
+    months = MONTHS.get(locale, MONTHS["en"])
+    return DATE_FORMATS.get(locale, DATE_FORMATS["en"]).format(d=d, m=months[m - 1], y=y)
+
+
+def reports_overrides(summary: dict, content: dict, locale: str) -> dict:
+    symbol = summary["currency"]
+    spent, passed = summary["spent"], summary["passed"]
+    stats = content["stats"]
+    decided = spent["count"] + passed["count"]
+    rate = 100 * passed["count"] / decided if decided else 0
+
+    categories = summary["categories"]
+    if len(categories) > LEGEND_SLICES:
+        rest = sum(v for _, v in categories[LEGEND_SLICES - 1:])
+        categories = categories[:LEGEND_SLICES - 1] + [[None, rest]]
+    total = sum(v for _, v in categories) or 1
+    legend, slices, angle = [], [], 0.0
+    for key, value in categories:
+        color = _token_hex(key or OTHER)
+        name = content["legend"][-1]["name"] if key is None else _category_name(key, locale)
+        legend.append({"color": color, "name": name, "value": money(value, symbol)})
+        end = angle + 360 * value / total
+        slices.append(f"{color} {angle:.1f}deg {end:.1f}deg")
+        angle = end
+
+    return {
+        "stats.0.value": money(spent["amount"], symbol),
+        "stats.0.sub": renumber(stats[0]["sub"], spent["hours"]),
+        "stats.1.value": money(passed["amount"], symbol),
+        "stats.1.sub": renumber(stats[1]["sub"], passed["hours"]),
+        "stats.2.value": f"{summary['rows']:,}".replace(",", "."),
+        "stats.2.sub": renumber(stats[2]["sub"], spent["count"], passed["count"]),
+        "stats.3.value": renumber(stats[3]["value"], rate),
+        "pie_total": compact(spent["amount"]),
+        "pie_slices": ", ".join(slices),
+        "legend": legend,
+    }
+
+
+def home_overrides(summary: dict, content: dict, locale: str) -> dict:
+    from design_tokens import hex_to_rgb
+
+    expenses = []
+    for item in summary["recent"]:
+        key = item["category"]
+        color = _token_hex(key)
+        icon = CATEGORIES.get(key, CATEGORIES[OTHER])[1]
+        hours = item["hours"]
+        expenses.append({
+            "icon": icon, "color": color, "rgb": ",".join(hex_to_rgb(color).split()),
+            "amount": money(item["amount"], summary["currency"]),
+            "category": _category_name(key, locale),
+            "hours": "–" if hours is None else f"{hours:.1f}",
+            "date": _date(item["stamp"], locale),
+        })
+    return {"expenses": expenses} if expenses else {}
+
+
+FRAME_OVERRIDES = {
+    "appstore_4_reports": reports_overrides,
+    "appstore_2_home": home_overrides,
+}
+
+
+def overrides(name: str, content: dict, locale: str) -> dict:
+    """Content overrides for frame `name` from the active export, given the
+    frame's localized content; empty without --export-data."""
+    build = FRAME_OVERRIDES.get(name)
+    if active is None or build is None:
+        return {}
+    return build(active, content, locale)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# DEMO DATASET
+# ═══════════════════════════════════════════════════════════════════════════
+
+DEMO_HEADER = ["Tarih", "Gün", "Saat", "Tutar", "Para Birimi", "Kategori", "Alt Kategori",
+               "Mağaza/Yer", "Ürün", "Karar", "Saat Karşılığı", "Dakika Karşılığı", "Taksit",
+               "Aylık Taksit", "Zorunlu", "Simülasyon"]
+DEMO_DAYS = ("Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma", "Cumartesi", "Pazar")
+DEMO_WEIGHTS = {"Yiyecek": 40, "Ulaşım": 25, "Giyim": 10, "Eğlence": 9, "Faturalar": 6,
+                "Elektronik": 3, "Sağlık": 3, "Eğitim": 2, "Abonelik": 1, "Diğer": 1}
+
+
+def demo_rows(count: int, hourly_rate: float = 340.0, seed: int = 7):
+    """A synthetic export in the app's Turkish layout, newest first."""
+    rng = random.Random(seed)
+    keys, weights = list(DEMO_WEIGHTS), list(DEMO_WEIGHTS.values())
+    now = datetime.datetime(2026, 2, 8, 16, 10)
+    yield DEMO_HEADER
+    for i in range(count):
+        when = now - datetime.timedelta(minutes=i * 7 + rng.randrange(7))
+        amount = round(rng.lognormvariate(5.5, 0.9), 2)
+        decision = rng.choices(("Aldım", "Vazgeçtim", "Düşünüyorum", "-"), (55, 35, 5, 5))[0]
+        hours = amount / hourly_rate
+        whole, frac = f"{amount:,.2f}".split(".")
+        yield [when.strftime("%d.%m.%Y"), DEMO_DAYS[when.weekday()], when.strftime("%H:%M"),
+               f"₺{whole.replace(',', '.')},{frac}", "TRY",
+               rng.choices(keys, weights)[0], "-", "-", "-", decision,
+               f"{hours:.1f} h", f"{round(hours * 60)} dk", "-", "-", "-", "-"]
+
+
+def _cell_ref(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def write_xlsx(path: str, rows, sheet: str = "Harcamalar"):
+    """Minimal streaming xlsx writer (inline strings) for demo exports."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            '</Types>'))
+        zf.writestr("_rels/.rels", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'))
+        zf.writestr("xl/workbook.xml", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name="{escape(sheet)}" sheetId="1" r:id="rId1"/></sheets></workbook>'))
+        zf.writestr("xl/_rels/workbook.xml.rels", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+            '</Relationships>'))
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as f:
+            f.write(b'<?xml version="1.0" encoding="UTF-8"?>'
+                    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                    b'<sheetData>')
+            for r, row in enumerate(rows, 1):
+                cells = "".join(f'<c r="{_cell_ref(c)}{r}" t="inlineStr"><is><t>{escape(v)}</t></is></c>'
+                                for c, v in enumerate(row))
+                f.write(f'<row r="{r}">{cells}</row>'.encode("utf-8"))
+            f.write(b"</sheetData></worksheet>")
+
+
+def write_demo(path: str, count: int):
+    rows = demo_rows(count)
+    if path.lower().endswith(".xlsx"):
+        write_xlsx(path, rows)
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize an app expense export for the frames.")
+    parser.add_argument("path", help="Vantag_Rapor_*.xlsx or CSV with the same headers")
+    parser.add_argument("--demo", type=int, metavar="ROWS",
+                        help="write a synthetic export with ROWS expenses to PATH first")
+    parser.add_argument("--no-cache", action="store_true", help="re-read even if unchanged")
+    args = parser.parse_args()
+
+    print("Vantag Export Data")
+    print(f"{'=' * 52}")
+    if args.demo:
+        started = time.perf_counter()
+        write_demo(args.path, args.demo)
+        print(f"  Demo    : {args.demo:,} rows → {args.path} "
+              f"({os.path.getsize(args.path) / (1024 * 1024):.1f} MB) "
+              f"in {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    try:
+        summary = (aggregate(read_rows(args.path)) if args.no_cache
+                   else summarize(args.path))
+    except (OSError, zipfile.BadZipFile, KeyError, ExportError) as e:
+        print(f"ERROR: cannot read export {args.path}: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+    symbol = summary["currency"]
+    print(f"  Rows    : {summary['rows']:,} in {elapsed:.2f}s "
+          f"({summary['rows'] / max(elapsed, 1e-9):,.0f} rows/s)")
+    for kind in ("spent", "passed", "thinking"):
+        g = summary[kind]
+        hours = "" if g["hours"] is None else f", {g['hours']:,.1f} h"
+        print(f"  {kind.capitalize():<8}: {g['count']:,} × → {money(g['amount'], symbol)}{hours}")
+    print("  Categories:")
+    for key, value in summary["categories"]:
+        print(f"    {_category_name(key, 'en'):<16} {money(value, symbol):>16}")
+    print("  Recent:")
+    for item in summary["recent"]:
+        print(f"    {_date(item['stamp'], 'en'):<14} {money(item['amount'], symbol):>12}  "
+              f"{_category_name(item['category'], 'en')}")
+
+
+if __name__ == "__main__":
+    main()
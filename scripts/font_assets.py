@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Bundled, subsetted fonts for deterministic renders.
+
+COMMON_CSS asks for -apple-system / SF Pro, which Linux CI does not have,
+so every page falls back to whatever fontconfig finds — different on each
+machine, and slow for Turkish glyphs and emoji. With bundled fonts on:
+
+  * the design-system faces (MASTER.md: Satoshi for headings, General Sans
+    for body) and a colour emoji font are read from scripts/fonts/,
+  * each is subset to the glyphs actually used across every frame and
+    locale (plus Latin/Turkish basics, so copy edits rarely change it),
+  * subsets are cached under .screenshot_cache/font_subsets/ keyed by the
+    source file and the glyph set,
+  * pages reference them by URL and each browser context serves them from
+    memory through one route, so no page inlines or refetches font data.
+
+Usage:
+    python3 scripts/font_assets.py               # build subsets, print report
+    python3 scripts/generate_screenshots.py --bundled-fonts
+
+Drop the font files into scripts/fonts/ (see FONT_FILES).
+"""
+
+import argparse
+import hashlib
+import html
+import os
+import re
+import sys
+
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+FONT_ORIGIN = "https://fonts.vantag.invalid"
+
+# role → (CSS family, file in FONTS_DIR, weight range)
+FONT_FILES = {
+    "heading": ("Vantag Heading", "Satoshi-Variable.ttf", "300 900"),
+    "body": ("Vantag Body", "GeneralSans-Variable.ttf", "200 700"),
+    "emoji": ("Vantag Emoji", "NotoColorEmoji.ttf", "400"),
+}
+
+# Display text set in the heading face; everything else uses the body face.
+HEADING_SELECTORS = (
+    ".headline", ".hook-line", ".hero-num", ".result-amount", ".result-hours",
+    ".stat-value", ".pie-total", ".logo-mark",
+)
+
+# Always included so small copy changes keep the same subset (and cache key).
+BASE_CHARS = (
+    "".join(chr(c) for c in range(0x20, 0x7F))
+    + "çğıöşüÇĞİÖŞÜâîûÂÎÛäÄßéèêÉ€₺£•·×÷–—‘’“”…→←↑↓%‰°"
+)
+
+_TAG = re.compile(r"<[^>]+>")
+_STYLE = re.compile(r"<style.*?</style>", re.S)
+
+active = None
+
+
+def load_subsetter():
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        print("ERROR: fontTools is required for bundled fonts.")
+        print("  pip install fonttools brotli --break-system-packages")
+        sys.exit(1)
+    return subset, TTFont
+
+
+def _woff2_available() -> bool:
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GLYPH SET + SUBSETS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def used_text(locales=None) -> str:
+    """Every character any frame renders, across the given locales."""
+    from generate_screenshots import FRAMES, available_locales, frame_html
+
+    chars = set(BASE_CHARS)
+    for locale in locales or available_locales():
+        for spec in FRAMES:
+            page = _STYLE.sub("", frame_html(spec, locale=locale))
+            chars.update(html.unescape(_TAG.sub("", page)))
+    chars.update(c.upper() for c in list(chars))
+    chars.update(c.lower() for c in list(chars))
+    return "".join(sorted(c for c in chars if c.isprintable() and len(c) == 1))
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def subset_font(path: str, text: str) -> tuple:
+    """(bytes, format) of `path` subset to `text`, from cache when possible."""
+    from generate_screenshots import CACHE_DIR
+
+    flavor = "woff2" if _woff2_available() else None
+    key = hashlib.sha256(f"{_file_digest(path)}|{flavor}|{text}".encode("utf-8")).hexdigest()
+    ext = flavor or "ttf"
+    cache_path = os.path.join(CACHE_DIR, "font_subsets", f"{key[:24]}.{ext}")
+    fmt = "woff2" if flavor else "truetype"
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return f.read(), fmt
+
+    subset, TTFont = load_subsetter()
+    options = subset.Options()
+    options.flavor = flavor
+    options.layout_features = ["*"]        # keep kerning, ligatures, tnum
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    font = TTFont(path, lazy=False)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp = f"{cache_path}.tmp"
+    font.flavor = flavor
+    font.save(tmp)
+    font.close()
+    os.replace(tmp, cache_path)
+    with open(cache_path, "rb") as f:
+        return f.read(), fmt
+
+
+class FontAssets:
+    """Subsetted font bytes plus the CSS and route that serve them."""
+
+    def __init__(self, locales=None):
+        missing = [name for _, name, _ in FONT_FILES.values()
+                   if not os.path.exists(os.path.join(FONTS_DIR, name))]
+        if missing:
+            print("ERROR: bundled fonts missing from scripts/fonts/:")
+            for name in missing:
+                print(f"  {name}")
+            sys.exit(1)
+
+        self.text = used_text(locales)
+        self.fonts = {}             # url → (bytes, mime)
+        self.faces = []
+        for role, (family, name, weight) in FONT_FILES.items():
+            data, fmt = subset_font(os.path.join(FONTS_DIR, name), self.text)
+            digest = hashlib.sha256(data).hexdigest()[:16]
+            url = f"{FONT_ORIGIN}/{role}-{digest}.{'woff2' if fmt == 'woff2' else 'ttf'}"
+            self.fonts[url] = (data, "font/woff2" if fmt == "woff2" else "font/ttf")
+            self.faces.append((role, family, url, fmt, weight, len(data)))
+
+    def css(self) -> str:
+        families = {role: family for role, family, *_ in self.faces}
+        rules = [
+            f"@font-face {{ font-family: '{family}'; src: url({url}) format('{fmt}'); "
+            f"font-weight: {weight}; font-display: block; }}"
+            for _, family, url, fmt, weight, _ in self.faces
+        ]
+        emoji = f"'{families['emoji']}'"
+        rules.append(f"html, body {{ font-family: '{families['body']}', {emoji}, sans-serif; }}")
+        rules.append(f"{', '.join(HEADING_SELECTORS)} "
+                     f"{{ font-family: '{families['heading']}', {emoji}, sans-serif; }}")
+        return "\n".join(rules)
+
+    async def install(self, context):
+        """Serve every subset from memory for one browser context."""
+        async def handle(route):
+            data, mime = self.fonts.get(route.request.url, (None, None))
+            if data is None:
+                await route.fulfill(status=404)
+                return
+            await route.fulfill(status=200, body=data, headers={
+                "Content-Type": mime,
+                "Access-Control-Allow-Origin": "*",
+                "Cache-Control": "public, max-age=31536000, immutable",
+            })
+
+        await context.route(f"{FONT_ORIGIN}/**", handle)
+
+
+def enable(locales=None) -> FontAssets:
+    """Switch every subsequently built page to the bundled fonts."""
+    global active
+    if active is None:
+        active = FontAssets(locales)
+    return active
+
+
+def font_file(selector: str = None):
+    """Bundled font file text matching `selector` is set in (the heading
+    face for HEADING_SELECTORS, else the body face); None when bundled
+    fonts are off and pages use the system stack."""
+    if active is None:
+        return None
+    role = "heading" if selector in HEADING_SELECTORS else "body"
+    return os.path.join(FONTS_DIR, FONT_FILES[role][1])
+
+
+def emoji_file():
+    """Bundled colour emoji font file; None when bundled fonts are off."""
+    return os.path.join(FONTS_DIR, FONT_FILES["emoji"][1]) if active else None
+
+
+def page_css() -> str:
+    return active.css() if active else ""
+
+
+async def setup_context(context):
+    """BrowserPool context hook; a no-op unless bundled fonts are enabled."""
+    if active:
+        await active.install(context)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build bundled font subsets.")
+    parser.add_argument("--locale", nargs="*", help="locales (default: all)")
+    args = parser.parse_args()
+
+    assets = enable(args.locale)
+    print(f"  Glyph set : {len(assets.text)} characters")
+    for role, family, url, fmt, weight, size in assets.faces:
+        print(f"  {role:<8} {family:<15} {fmt:<8} {size / 1024:7.1f} KB  {url}")
+
+
+if __name__ == "__main__":
+    main()
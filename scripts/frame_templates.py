@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Compiled HTML templates and declarative frame specs for the screenshot
+generator.
+
+A frame is data: CSS, a layout template, an optional screen template, named
+part templates for repeated or optional markup, and a content dataset.
+Templates are parsed once into literal/field segments and cached; each
+variant is then a single pass of string joins instead of re-running
+f-string assembly.
+
+Template syntax is str.format-style:
+
+    {field}          insert content["field"] verbatim (HTML allowed)
+    {field:part}     render content["field"] with spec.parts["part"]:
+                       list → part rendered once per item (dict) and joined
+                       dict → part rendered with that dict
+                       str  → part rendered with {field: value}
+                       ""/None → nothing (optional markup)
+"""
+
+import copy
+import functools
+import string
+from dataclasses import dataclass, field
+
+_FORMATTER = string.Formatter()
+
+
+# Phone mockup with headline — shared by every frame except the hook.
+PHONE_LAYOUT = """
+    <div class="headline-section">
+        <h1 class="headline">{headline}</h1>{subtitle:subtitle}
+    </div>
+    <div class="phone-container">
+        <div class="phone-frame">
+            <div class="notch"></div>
+            <div class="screen">{screen}</div>
+            <div class="home-bar"></div>
+        </div>
+    </div>
+    """
+
+PHONE_PARTS = {
+    "subtitle": """
+        <p class="subtitle">{subtitle}</p>""",
+}
+
+
+class Template:
+    """A template parsed once into literal and field segments."""
+
+    __slots__ = ("source", "segments", "fields")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.segments = []
+        for literal, name, spec, _conversion in _FORMATTER.parse(source):
+            if literal:
+                self.segments.append((literal, None, None))
+            if name is not None:
+                self.segments.append((None, name, spec or None))
+        self.fields = frozenset(name for _, name, _ in self.segments if name)
+
+    def render(self, values: dict, parts: dict = None) -> str:
+        out = []
+        append = out.append
+        for literal, name, part in self.segments:
+            if name is None:
+                append(literal)
+            elif part is None:
+                append(str(values[name]))
+            else:
+                append(_render_part(parts[part], name, values.get(name), values, parts))
+        return "".join(out)
+
+
+def _render_part(template, name, value, scope, parts) -> str:
+    if not value:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return "".join(template.render({**scope, **item}, parts) for item in value)
+    if isinstance(value, dict):
+        return template.render({**scope, **value}, parts)
+    return template.render({**scope, name: value}, parts)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_template(source: str) -> Template:
+    """Parse a template source once; identical sources share one Template."""
+    return Template(source)
+
+
+def apply_overrides(content: dict, overrides: dict) -> dict:
+    """Copy of a content dataset with overrides applied.
+
+    Keys may be dotted paths into nested lists/dicts, e.g.
+    "hero_numbers.0.num" or "badges.3.name".
+    """
+    content = copy.deepcopy(content)
+    for key, value in overrides.items():
+        *path, leaf = key.split(".")
+        target = content
+        for part in path:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        if isinstance(target, list):
+            target[int(leaf)] = value
+        else:
+            target[leaf] = value
+    return content
+
+
+@dataclass(eq=False)
+class FrameSpec:
+    """Declarative description of one App Store frame."""
+
+    name: str
+    css: str
+    layout: str
+    content: dict
+    screen: str = ""
+    parts: dict = field(default_factory=dict)
+    tab: str = None
+
+    @functools.cached_property
+    def compiled(self) -> "CompiledFrame":
+        return CompiledFrame(self)
+
+    def render_body(self, content: dict) -> str:
+        """Instantiate the frame body for a complete content dataset."""
+        return self.compiled.render(content)
+
+
+class CompiledFrame:
+    """Templates of a FrameSpec, compiled once and reused per variant."""
+
+    __slots__ = ("layout", "screen", "parts")
+
+    def __init__(self, spec: FrameSpec):
+        self.layout = compile_template(spec.layout)
+        self.screen = compile_template(spec.screen) if spec.screen else None
+        self.parts = {k: compile_template(v) for k, v in spec.parts.items()}
+
+    def render(self, content: dict) -> str:
+        if self.screen is not None:
+            content = {**content, "screen": self.screen.render(content, self.parts)}
+        return self.layout.render(content, self.parts)
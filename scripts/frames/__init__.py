@@ -0,0 +1,56 @@
+"""
+Frame registry.
+
+Every frame is a module in this package named after the frame
+(appstore_<n>_<slug>.py) that defines `FRAME = FrameSpec(...)`. Names come
+from the file names, so listing and selecting frames imports nothing; a
+frame module is imported the first time its spec is needed. Frame order is
+file-name order.
+
+    import frames
+    frames.select(["appstore_[12]_*"])     # → names, no frame code imported
+    frames.load("appstore_2_home")         # → FrameSpec
+    frames.load_all(["*home*"])            # → [FrameSpec]
+
+To add a frame, drop a new module here; nothing else needs registering.
+"""
+
+import fnmatch
+import functools
+import importlib
+import os
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.lru_cache(maxsize=None)
+def names() -> tuple:
+    """All registered frame names, in frame order."""
+    return tuple(sorted(
+        f[:-3] for f in os.listdir(_DIR)
+        if f.endswith(".py") and not f.startswith("_")
+    ))
+
+
+def match(candidates, patterns) -> list:
+    """Candidates matching any glob, in candidate order; all when no patterns."""
+    if not patterns:
+        return list(candidates)
+    return [c for c in candidates if any(fnmatch.fnmatchcase(c, p) for p in patterns)]
+
+
+def select(patterns=None) -> list:
+    """Names of the frames matching any glob (every frame when none given)."""
+    return match(names(), patterns)
+
+
+@functools.lru_cache(maxsize=None)
+def load(name: str):
+    """The FrameSpec of one frame, importing its module on first use."""
+    if name not in names():
+        raise KeyError(f"unknown frame {name!r} (have: {', '.join(names())})")
+    return importlib.import_module(f"{__name__}.{name}").FRAME
+
+
+def load_all(patterns=None) -> list:
+    return [load(name) for name in select(patterns)]
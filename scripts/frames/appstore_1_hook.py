@@ -0,0 +1,97 @@
+"""Frame 1 — hook (no phone, centred text)."""
+
+from frame_templates import FrameSpec
+
+FRAME = FrameSpec(
+    name="appstore_1_hook",
+    css="""
+    .hook-wrap {
+        position: absolute;
+        top: 0; left: 0; right: 0; bottom: 0;
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        justify-content: center;
+        z-index: 5;
+    }
+    .hook-emoji {
+        font-size: 160px;
+        margin-bottom: 40px;
+        filter: drop-shadow(0 8px 30px rgba(0,0,0,0.3));
+    }
+    .hook-main {
+        text-align: center;
+    }
+    .hook-line {
+        font-size: 96px;
+        font-weight: 800;
+        color: var(--vant-accent);
+        letter-spacing: -2px;
+        line-height: 1.15;
+        text-shadow: 0 4px 50px rgb(var(--vant-accent-rgb) / 0.2);
+    }
+    .hook-equals {
+        font-size: 72px;
+        font-weight: 300;
+        color: rgb(var(--vant-accent-rgb) / 0.45);
+        margin: 20px 0;
+        display: block;
+    }
+    .hook-tagline {
+        font-size: 38px;
+        font-weight: 400;
+        color: rgb(var(--vant-text-primary-rgb) / 0.45);
+        margin-top: 50px;
+        letter-spacing: -0.3px;
+    }
+    .logo-section {
+        position: absolute;
+        bottom: 120px; left: 0; right: 0;
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        gap: 12px;
+        z-index: 5;
+    }
+    .logo-mark {
+        width: 80px; height: 80px;
+        border-radius: 20px;
+        background: linear-gradient(135deg, var(--vant-primary), var(--vant-primary-light));
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-size: 40px;
+        font-weight: 800;
+        color: var(--vant-accent);
+        box-shadow: 0 8px 30px rgb(var(--vant-primary-rgb) / 0.4);
+    }
+    .logo-name {
+        font-size: 32px;
+        font-weight: 700;
+        color: rgb(var(--vant-text-primary-rgb) / 0.5);
+        letter-spacing: 4px;
+        text-transform: lowercase;
+    }
+    """,
+    layout="""
+    <div class="hook-wrap">
+        <div class="hook-emoji">{emoji}</div>
+        <div class="hook-main">
+            <div class="hook-line">{line_1}</div>
+            <span class="hook-equals">=</span>
+            <div class="hook-line">{line_2}</div>
+        </div>
+        <div class="hook-tagline">{tagline}</div>
+    </div>
+    <div class="logo-section">
+        <div class="logo-mark">V</div>
+        <div class="logo-name">vantag</div>
+    </div>
+    """,
+    content={
+        "emoji": "☕",
+        "line_1": "200₺ kahve",
+        "line_2": "⏱ 45 dk mesai",
+        "tagline": "Gerçek maliyet bu.",
+    },
+)
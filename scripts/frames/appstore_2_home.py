@@ -0,0 +1,299 @@
+"""Frame 2 — home screen."""
+
+from frame_templates import FrameSpec, PHONE_LAYOUT, PHONE_PARTS
+
+FRAME = FrameSpec(
+    name="appstore_2_home",
+    tab="home",
+    css="""
+    .home-content { padding: 88px 28px 120px; }
+    .greeting-row {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        margin-bottom: 8px;
+    }
+    .avatar {
+        width: 56px; height: 56px;
+        border-radius: 50%;
+        background: linear-gradient(135deg, var(--vant-primary-dark), var(--vant-primary));
+        border: 2px solid rgba(255,255,255,0.1);
+        display: flex; align-items: center; justify-content: center;
+        font-size: 24px;
+    }
+    .streak-badge {
+        background: rgb(var(--vant-error-rgb) / 0.15);
+        border: 1px solid rgb(var(--vant-error-rgb) / 0.3);
+        border-radius: 20px;
+        padding: 8px 16px;
+        font-size: 22px;
+        font-weight: 600;
+        color: var(--vant-error-light);
+    }
+    .greeting-text {
+        font-size: 26px;
+        color: var(--vant-text-secondary);
+        margin: 14px 0 4px;
+    }
+    .month-header {
+        font-size: 44px;
+        font-weight: 800;
+        color: var(--vant-text-primary);
+        letter-spacing: -0.5px;
+        margin-bottom: 24px;
+    }
+    /* Habit CTA */
+    .habit-cta {
+        background: linear-gradient(135deg, rgb(var(--vant-primary-rgb) / 0.25), rgb(var(--vant-primary-rgb) / 0.1));
+        border: 1px solid rgb(var(--vant-primary-rgb) / 0.35);
+        border-radius: 20px;
+        padding: 22px 26px;
+        display: flex;
+        align-items: center;
+        gap: 16px;
+        margin-bottom: 28px;
+    }
+    .habit-icon {
+        width: 48px; height: 48px;
+        border-radius: 14px;
+        background: linear-gradient(135deg, var(--vant-primary), var(--vant-primary-light));
+        display: flex; align-items: center; justify-content: center;
+        font-size: 26px;
+    }
+    .habit-text { flex: 1; }
+    .habit-title {
+        font-size: 24px; font-weight: 600;
+        color: var(--vant-text-primary);
+    }
+    .habit-sub {
+        font-size: 20px; color: var(--vant-text-secondary);
+        margin-top: 2px;
+    }
+    .habit-arrow { font-size: 28px; color: var(--vant-text-secondary); }
+    /* Hero card */
+    .hero-card {
+        background: linear-gradient(145deg, rgb(var(--vant-primary-rgb) / 0.35), rgba(60,45,92,0.2));
+        border: 1px solid rgb(var(--vant-primary-rgb) / 0.3);
+        border-radius: 28px;
+        padding: 28px;
+        text-align: center;
+        margin-bottom: 28px;
+        position: relative;
+        overflow: hidden;
+    }
+    .hero-card::before {
+        content: '';
+        position: absolute;
+        top: -60px; left: 50%;
+        transform: translateX(-50%);
+        width: 300px; height: 300px;
+        border-radius: 50%;
+        background: radial-gradient(circle, rgb(var(--vant-primary-rgb) / 0.25), transparent 70%);
+    }
+    .hero-badge {
+        display: inline-flex;
+        align-items: center;
+        gap: 8px;
+        background: rgba(255,255,255,0.06);
+        border: 1px solid rgba(255,255,255,0.1);
+        border-radius: 12px;
+        padding: 8px 16px;
+        font-size: 20px;
+        font-weight: 600;
+        color: var(--vant-accent);
+        margin-bottom: 28px;
+        position: relative;
+    }
+    .hero-ring {
+        width: 120px; height: 120px;
+        border-radius: 50%;
+        border: 5px solid rgb(var(--vant-primary-rgb) / 0.25);
+        margin: 0 auto 24px;
+        position: relative;
+        display: flex; align-items: center; justify-content: center;
+    }
+    .hero-ring::after {
+        content: '';
+        position: absolute;
+        top: -5px; left: -5px; right: -5px; bottom: -5px;
+        border-radius: 50%;
+        border: 5px solid transparent;
+        border-top-color: var(--vant-primary);
+        border-right-color: var(--vant-primary);
+    }
+    .hero-ring-icon { font-size: 40px; }
+    .hero-numbers {
+        display: flex;
+        justify-content: center;
+        gap: 60px;
+        position: relative;
+    }
+    .hero-num-group { text-align: center; }
+    .hero-num {
+        font-size: 80px;
+        font-weight: 800;
+        color: var(--vant-text-primary);
+        line-height: 1;
+    }
+    .hero-label {
+        font-size: 22px;
+        font-weight: 600;
+        color: var(--vant-text-secondary);
+        letter-spacing: 2px;
+        margin-top: 6px;
+    }
+    .hero-footer {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        margin-top: 22px;
+        font-size: 21px;
+        color: var(--vant-text-secondary);
+    }
+    .hero-budget-tag {
+        color: var(--vant-accent);
+        font-weight: 600;
+    }
+    .budget-dots {
+        display: flex;
+        justify-content: center;
+        gap: 8px;
+        margin-top: 14px;
+    }
+    .budget-dot {
+        width: 10px; height: 10px;
+        border-radius: 50%;
+        background: var(--vant-success);
+    }
+    /* Expense list */
+    .section-title {
+        font-size: 28px;
+        font-weight: 700;
+        color: var(--vant-text-primary);
+        margin: 20px 0 18px;
+    }
+    .expense-item {
+        display: flex;
+        align-items: center;
+        gap: 16px;
+        padding: 20px;
+        background: rgb(var(--vant-surface-rgb) / 0.6);
+        border: 1px solid rgba(255,255,255,0.04);
+        border-radius: 18px;
+        margin-bottom: 12px;
+    }
+    .expense-icon {
+        width: 50px; height: 50px;
+        border-radius: 14px;
+        display: flex; align-items: center; justify-content: center;
+        font-size: 22px;
+    }
+    .expense-info { flex: 1; }
+    .expense-amount {
+        font-size: 26px; font-weight: 700; color: var(--vant-text-primary);
+    }
+    .expense-meta {
+        font-size: 20px; color: var(--vant-text-tertiary); margin-top: 3px;
+    }
+    .expense-right { text-align: right; }
+    .expense-date {
+        font-size: 20px; color: var(--vant-text-tertiary);
+    }
+    .expense-check {
+        width: 36px; height: 36px;
+        border-radius: 50%;
+        background: linear-gradient(135deg, var(--vant-secondary), var(--vant-secondary-dark));
+        display: flex; align-items: center; justify-content: center;
+        font-size: 18px;
+        margin-top: 6px;
+    }
+    """,
+    layout=PHONE_LAYOUT,
+    screen="""
+    {status_bar}
+    <div class="home-content">
+        <div class="greeting-row">
+            <div class="avatar">👤</div>
+            <div class="streak-badge">{streak}</div>
+        </div>
+        <div class="greeting-text">{greeting}</div>
+        <div class="month-header">{month}</div>
+
+        <div class="habit-cta">
+            <div class="habit-icon">⚡</div>
+            <div class="habit-text">
+                <div class="habit-title">{habit_title}</div>
+                <div class="habit-sub">{habit_sub}</div>
+            </div>
+            <div class="habit-arrow">›</div>
+        </div>
+
+        <div class="hero-card">
+            <div class="hero-badge">{hero_badge}</div>
+            <div class="hero-ring">
+                <div class="hero-ring-icon">💫</div>
+            </div>
+            <div class="hero-numbers">{hero_numbers:hero_number}
+            </div>
+            <div class="hero-footer">
+                <span>{budget_label}</span>
+                <span class="hero-budget-tag">{budget_pct}</span>
+            </div>
+            <div class="budget-dots"><div class="budget-dot"></div></div>
+        </div>
+
+        <div class="section-title">{section_title}</div>
+        {expenses:expense}
+    </div>
+    {tab_bar}
+    """,
+    parts={
+        **PHONE_PARTS,
+        "hero_number": """
+                <div class="hero-num-group">
+                    <div class="hero-num">{num}</div>
+                    <div class="hero-label">{label}</div>
+                </div>""",
+        "expense": """
+        <div class="expense-item">
+            <div class="expense-icon" style="background:rgba({rgb},0.12);border:1px solid rgba({rgb},0.25);">
+                <span style="color:{color};">{icon}</span>
+            </div>
+            <div class="expense-info">
+                <div class="expense-amount">{amount}</div>
+                <div class="expense-meta">{category} · {hours} {hours_unit}</div>
+            </div>
+            <div class="expense-right">
+                <div class="expense-date">{date}</div>
+                <div class="expense-check">✓</div>
+            </div>
+        </div>
+""",
+    },
+    content={
+        "headline": "Her harcamayı<br>saatinle gör",
+        "subtitle": "",
+        "streak": "🔥 2 gün",
+        "greeting": "İyi günler 👋",
+        "month": "Şubat 2026",
+        "habit_title": "Alışkanlığın kaç gününü alıyor?",
+        "habit_sub": "Hesapla ve şok ol →",
+        "hero_badge": "⏰ ÇALIŞMA KARŞILIĞI",
+        "hero_numbers": [
+            {"num": "7", "label": "SAAT"},
+            {"num": "1", "label": "GÜN"},
+        ],
+        "budget_label": "Bütçe Kullanımı",
+        "budget_pct": "%4",
+        "section_title": "Son Harcamalar",
+        "hours_unit": "saat",
+        "expenses": [
+            {"icon": "📄", "color": "#F87171", "rgb": "248,113,113",
+             "amount": "1.000 ₺", "category": "Faturalar", "hours": "2.9", "date": "8 Şub 2026"},
+            {"icon": "🚌", "color": "#4ECDC4", "rgb": "78,205,196",
+             "amount": "990 ₺", "category": "Ulaşım", "hours": "2.9", "date": "8 Şub 2026"},
+            {"icon": "🍕", "color": "#FF6B6B", "rgb": "255,107,107",
+             "amount": "550 ₺", "category": "Yeme-İçme", "hours": "1.6", "date": "8 Şub 2026"},
+        ],
+    },
+)
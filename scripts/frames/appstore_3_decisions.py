@@ -0,0 +1,220 @@
+"""Frame 3 — decisions."""
+
+from frame_templates import FrameSpec, PHONE_LAYOUT, PHONE_PARTS
+
+FRAME = FrameSpec(
+    name="appstore_3_decisions",
+    css="""
+    .decision-content {
+        padding: 88px 28px 60px;
+        display: flex;
+        flex-direction: column;
+        height: 100%;
+    }
+    .sheet-handle {
+        width: 50px; height: 5px;
+        border-radius: 3px;
+        background: rgba(255,255,255,0.15);
+        margin: 0 auto 24px;
+    }
+    .sheet-title {
+        font-size: 30px;
+        font-weight: 700;
+        color: var(--vant-text-primary);
+        text-align: center;
+        margin-bottom: 36px;
+    }
+    /* Result card */
+    .result-card {
+        background: linear-gradient(145deg, rgb(var(--vant-primary-rgb) / 0.3), rgba(40,30,65,0.2));
+        border: 1px solid rgb(var(--vant-primary-rgb) / 0.3);
+        border-radius: 28px;
+        padding: 36px;
+        text-align: center;
+        margin-bottom: 32px;
+    }
+    .result-amount {
+        font-size: 72px;
+        font-weight: 800;
+        color: var(--vant-text-primary);
+        letter-spacing: -1px;
+    }
+    .result-category {
+        display: inline-flex;
+        align-items: center;
+        gap: 8px;
+        background: rgb(var(--vant-category-transport-rgb) / 0.1);
+        border: 1px solid rgb(var(--vant-category-transport-rgb) / 0.2);
+        border-radius: 12px;
+        padding: 8px 18px;
+        font-size: 22px;
+        color: var(--vant-category-transport);
+        margin: 16px 0 28px;
+    }
+    .result-divider {
+        width: 60px; height: 3px;
+        background: rgb(var(--vant-primary-rgb) / 0.4);
+        border-radius: 2px;
+        margin: 0 auto 28px;
+    }
+    .result-hours-label {
+        font-size: 22px;
+        color: var(--vant-text-secondary);
+        margin-bottom: 8px;
+        letter-spacing: 2px;
+        font-weight: 600;
+    }
+    .result-hours {
+        font-size: 80px;
+        font-weight: 800;
+        color: var(--vant-accent);
+        line-height: 1;
+    }
+    .result-hours-unit {
+        font-size: 30px;
+        font-weight: 600;
+        color: rgb(var(--vant-accent-rgb) / 0.6);
+        margin-top: 4px;
+    }
+    .result-ring {
+        width: 160px; height: 160px;
+        border-radius: 50%;
+        border: 6px solid rgb(var(--vant-primary-rgb) / 0.2);
+        margin: 10px auto 20px;
+        position: relative;
+        display: flex; align-items: center; justify-content: center;
+        flex-direction: column;
+    }
+    .result-ring::after {
+        content: '';
+        position: absolute;
+        top: -6px; left: -6px; right: -6px; bottom: -6px;
+        border-radius: 50%;
+        border: 6px solid transparent;
+        border-top-color: var(--vant-accent);
+        border-right-color: var(--vant-accent);
+        border-bottom-color: var(--vant-accent);
+        transform: rotate(-30deg);
+    }
+    .result-insight {
+        font-size: 22px;
+        color: var(--vant-text-secondary);
+        margin-top: 20px;
+        font-style: italic;
+        line-height: 1.4;
+        padding: 0 10px;
+    }
+    /* Decision buttons */
+    .decision-label {
+        font-size: 26px;
+        color: var(--vant-text-secondary);
+        text-align: center;
+        margin-bottom: 20px;
+        font-weight: 500;
+    }
+    .decision-row {
+        display: flex;
+        gap: 14px;
+    }
+    .decision-btn {
+        flex: 1;
+        border-radius: 22px;
+        padding: 28px 12px;
+        text-align: center;
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        gap: 12px;
+    }
+    .decision-btn .d-icon {
+        width: 56px; height: 56px;
+        border-radius: 16px;
+        display: flex; align-items: center; justify-content: center;
+        font-size: 26px;
+    }
+    .decision-btn .d-label {
+        font-size: 24px;
+        font-weight: 600;
+    }
+    .btn-yes {
+        background: rgb(var(--vant-error-light-rgb) / 0.08);
+        border: 1px solid rgb(var(--vant-error-light-rgb) / 0.2);
+    }
+    .btn-yes .d-icon {
+        background: rgb(var(--vant-error-light-rgb) / 0.15);
+        border: 1px solid rgb(var(--vant-error-light-rgb) / 0.3);
+        color: var(--vant-error-light);
+    }
+    .btn-yes .d-label { color: var(--vant-error-light); }
+    .btn-think {
+        background: rgb(var(--vant-warning-light-rgb) / 0.08);
+        border: 1px solid rgb(var(--vant-warning-light-rgb) / 0.2);
+    }
+    .btn-think .d-icon {
+        background: rgb(var(--vant-warning-light-rgb) / 0.15);
+        border: 1px solid rgb(var(--vant-warning-light-rgb) / 0.3);
+        color: var(--vant-warning-light);
+    }
+    .btn-think .d-label { color: var(--vant-warning-light); }
+    .btn-no {
+        background: rgb(var(--vant-secondary-rgb) / 0.1);
+        border: 1.5px solid rgb(var(--vant-secondary-rgb) / 0.35);
+        box-shadow: 0 0 30px rgb(var(--vant-secondary-rgb) / 0.08);
+    }
+    .btn-no .d-icon {
+        background: rgb(var(--vant-secondary-rgb) / 0.2);
+        border: 1px solid rgb(var(--vant-secondary-rgb) / 0.4);
+        color: var(--vant-secondary);
+    }
+    .btn-no .d-label { color: var(--vant-secondary); }
+    """,
+    layout=PHONE_LAYOUT,
+    screen="""
+    {status_bar}
+    <div class="decision-content">
+        <div class="sheet-handle"></div>
+        <div class="sheet-title">{sheet_title}</div>
+
+        <div class="result-card">
+            <div class="result-amount">{amount}</div>
+            <div class="result-category">{category}</div>
+            <div class="result-divider"></div>
+            <div class="result-hours-label">{hours_label}</div>
+            <div class="result-ring">
+                <div class="result-hours">{hours}</div>
+                <div class="result-hours-unit">{hours_unit}</div>
+            </div>
+            <div class="result-insight">{insight}</div>
+        </div>
+
+        <div class="decision-label">{decision_label}</div>
+        <div class="decision-row">{decisions:decision}
+        </div>
+    </div>
+    """,
+    parts={
+        **PHONE_PARTS,
+        "decision": """
+            <div class="decision-btn {cls}">
+                <div class="d-icon">{icon}</div>
+                <div class="d-label">{label}</div>
+            </div>""",
+    },
+    content={
+        "headline": "Aldım. Düşünüyorum.<br>Vazgeçtim.",
+        "subtitle": "Her harcamada bilinçli karar",
+        "sheet_title": "Harcama Ekle",
+        "amount": "990 ₺",
+        "category": "🚌 Ulaşım",
+        "hours_label": "⏰ ÇALIŞMA KARŞILIĞI",
+        "hours": "2.9",
+        "hours_unit": "SAAT",
+        "insight": "\"Bu harcama maaşının %2.9'una denk\"",
+        "decision_label": "Kararını ver:",
+        "decisions": [
+            {"cls": "btn-yes", "icon": "✓", "label": "Aldım"},
+            {"cls": "btn-think", "icon": "⏳", "label": "Düşünüyorum"},
+            {"cls": "btn-no", "icon": "✕", "label": "Vazgeçtim"},
+        ],
+    },
+)
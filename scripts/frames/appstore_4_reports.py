@@ -0,0 +1,211 @@
+"""Frame 4 — reports."""
+
+from frame_templates import FrameSpec, PHONE_LAYOUT, PHONE_PARTS
+
+FRAME = FrameSpec(
+    name="appstore_4_reports",
+    tab="analysis",
+    css="""
+    .report-content { padding: 88px 24px 120px; }
+    .report-header {
+        font-size: 42px;
+        font-weight: 800;
+        color: var(--vant-text-primary);
+        margin-bottom: 20px;
+    }
+    .filter-row {
+        display: flex; gap: 10px;
+        margin-bottom: 28px;
+    }
+    .filter-chip {
+        padding: 10px 22px;
+        border-radius: 14px;
+        font-size: 22px;
+        font-weight: 600;
+        background: rgba(255,255,255,0.04);
+        border: 1px solid rgba(255,255,255,0.06);
+        color: var(--vant-text-tertiary);
+    }
+    .filter-chip.active {
+        background: rgb(var(--vant-primary-rgb) / 0.2);
+        border-color: rgb(var(--vant-primary-rgb) / 0.4);
+        color: var(--vant-accent);
+    }
+    /* Stats grid */
+    .stats-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 14px;
+        margin-bottom: 28px;
+    }
+    .stat-card {
+        background: rgb(var(--vant-surface-rgb) / 0.6);
+        border: 1px solid rgba(255,255,255,0.04);
+        border-radius: 22px;
+        padding: 22px;
+    }
+    .stat-icon-row {
+        display: flex;
+        align-items: center;
+        gap: 10px;
+        margin-bottom: 14px;
+    }
+    .stat-icon {
+        width: 40px; height: 40px;
+        border-radius: 12px;
+        display: flex; align-items: center; justify-content: center;
+        font-size: 20px;
+    }
+    .stat-title {
+        font-size: 20px;
+        color: var(--vant-text-secondary);
+        font-weight: 500;
+    }
+    .stat-value {
+        font-size: 38px;
+        font-weight: 800;
+        color: var(--vant-text-primary);
+        margin-bottom: 4px;
+    }
+    .stat-sub {
+        font-size: 19px;
+        color: var(--vant-text-tertiary);
+    }
+    /* Pie chart */
+    .chart-section {
+        background: rgb(var(--vant-surface-rgb) / 0.6);
+        border: 1px solid rgba(255,255,255,0.04);
+        border-radius: 22px;
+        padding: 24px;
+        margin-bottom: 20px;
+    }
+    .chart-title {
+        font-size: 24px;
+        font-weight: 700;
+        color: var(--vant-text-primary);
+        margin-bottom: 20px;
+    }
+    .pie-wrapper {
+        display: flex;
+        align-items: center;
+        gap: 30px;
+    }
+    .pie-chart {
+        width: 180px; height: 180px;
+        border-radius: 50%;
+        position: relative;
+        flex-shrink: 0;
+    }
+    .pie-hole {
+        position: absolute;
+        top: 35px; left: 35px; right: 35px; bottom: 35px;
+        border-radius: 50%;
+        background: rgb(var(--vant-surface-rgb) / 0.95);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        flex-direction: column;
+    }
+    .pie-total { font-size: 28px; font-weight: 800; color: var(--vant-text-primary); }
+    .pie-total-label { font-size: 16px; color: var(--vant-text-tertiary); }
+    .pie-legend { flex: 1; }
+    .legend-item {
+        display: flex; align-items: center; gap: 10px;
+        margin-bottom: 12px;
+        font-size: 20px;
+        color: var(--vant-text-secondary);
+    }
+    .legend-dot {
+        width: 14px; height: 14px;
+        border-radius: 4px;
+        flex-shrink: 0;
+    }
+    .legend-value {
+        margin-left: auto;
+        font-weight: 600;
+        color: var(--vant-text-primary);
+    }
+    """,
+    layout=PHONE_LAYOUT,
+    screen="""
+    {status_bar}
+    <div class="report-content">
+        <div class="report-header">{report_header}</div>
+        <div class="filter-row">{filters:filter}
+        </div>
+
+        <div class="stats-grid">{stats:stat}
+        </div>
+
+        <div class="chart-section">
+            <div class="chart-title">{chart_title}</div>
+            <div class="pie-wrapper">
+                <div class="pie-chart" style="background:conic-gradient({pie_slices});">
+                    <div class="pie-hole">
+                        <div class="pie-total">{pie_total}</div>
+                        <div class="pie-total-label">{pie_total_label}</div>
+                    </div>
+                </div>
+                <div class="pie-legend">{legend:legend_item}
+                </div>
+            </div>
+        </div>
+    </div>
+    {tab_bar}
+    """,
+    parts={
+        **PHONE_PARTS,
+        "filter": """
+            <div class="filter-chip{active}">{label}</div>""",
+        "stat": """
+            <div class="stat-card">
+                <div class="stat-icon-row">
+                    <div class="stat-icon" style="background:rgba({rgb},0.12);"><span style="color:{color};">{icon}</span></div>
+                    <div class="stat-title">{title}</div>
+                </div>
+                <div class="stat-value" style="color:{value_color};">{value}</div>
+                <div class="stat-sub">{sub}</div>
+            </div>""",
+        "legend_item": """
+                    <div class="legend-item">
+                        <div class="legend-dot" style="background:{color};"></div>
+                        {name}
+                        <span class="legend-value">{value}</span>
+                    </div>""",
+    },
+    content={
+        "headline": "Paran nereye gidiyor?",
+        "subtitle": "Detaylı analiz ve raporlar",
+        "report_header": "Analiz",
+        "filters": [
+            {"label": "Bu Hafta", "active": ""},
+            {"label": "Bu Ay", "active": " active"},
+            {"label": "Tümü", "active": ""},
+        ],
+        "stats": [
+            {"icon": "🛒", "color": "#F87171", "rgb": "248,113,113", "title": "Toplam Harcama",
+             "value": "5.240 ₺", "value_color": "#F5F5F7", "sub": "15.3 saat karşılığı"},
+            {"icon": "🛡️", "color": "#22D3EE", "rgb": "34,211,238", "title": "Toplam Tasarruf",
+             "value": "2.100 ₺", "value_color": "#22D3EE", "sub": "6.1 saat kurtarıldı"},
+            {"icon": "📋", "color": "#3B82F6", "rgb": "59,130,246", "title": "Harcama Sayısı",
+             "value": "24", "value_color": "#F5F5F7", "sub": "12 aldım · 12 vazgeçtim"},
+            {"icon": "📈", "color": "#4ADE80", "rgb": "74,222,128", "title": "Vazgeçme Oranı",
+             "value": "%38", "value_color": "#4ADE80", "sub": "Daha iyi olabilir"},
+        ],
+        "chart_title": "Kategori Dağılımı",
+        "pie_slices": ("var(--vant-category-food) 0deg 120deg, "
+                       "var(--vant-category-transport) 120deg 210deg, "
+                       "var(--vant-category-shopping) 210deg 275deg, "
+                       "var(--vant-category-entertainment) 275deg 320deg, "
+                       "var(--vant-text-tertiary) 320deg 360deg"),
+        "pie_total": "5.2K",
+        "pie_total_label": "Toplam",
+        "legend": [
+            {"color": "#FF6B6B", "name": "Yeme-İçme", "value": "2.100 ₺"},
+            {"color": "#4ECDC4", "name": "Ulaşım", "value": "1.500 ₺"},
+            {"color": "#9B59B6", "name": "Giyim", "value": "890 ₺"},
+            {"color": "#3498DB", "name": "Eğlence", "value": "450 ₺"},
+            {"color": "#6B6B7E", "name": "Diğer", "value": "300 ₺"},
+        ],
+    },
+)
@@ -0,0 +1,119 @@
+"""Frame 5 — badges."""
+
+from frame_templates import FrameSpec, PHONE_LAYOUT, PHONE_PARTS
+
+FRAME = FrameSpec(
+    name="appstore_5_badges",
+    tab="settings",
+    css="""
+    .badge-content { padding: 88px 24px 120px; }
+    .badge-header {
+        font-size: 42px;
+        font-weight: 800;
+        color: var(--vant-text-primary);
+        margin-bottom: 6px;
+    }
+    .badge-count {
+        font-size: 24px;
+        color: var(--vant-text-secondary);
+        margin-bottom: 28px;
+    }
+    .badge-count span {
+        color: var(--vant-accent);
+        font-weight: 700;
+    }
+    .badge-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr 1fr;
+        gap: 14px;
+    }
+    .badge-card {
+        background: rgb(var(--vant-surface-rgb) / 0.6);
+        border: 1px solid rgba(255,255,255,0.04);
+        border-radius: 20px;
+        padding: 22px 14px;
+        text-align: center;
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        gap: 10px;
+    }
+    .badge-card.earned {
+        border-color: rgb(var(--vant-primary-rgb) / 0.4);
+        background: rgb(var(--vant-primary-rgb) / 0.1);
+        box-shadow: 0 0 25px rgb(var(--vant-primary-rgb) / 0.1);
+    }
+    .badge-card.locked {
+        opacity: 0.4;
+        border-style: dashed;
+    }
+    .badge-emoji {
+        font-size: 48px;
+        filter: drop-shadow(0 2px 8px rgba(0,0,0,0.3));
+    }
+    .badge-card.locked .badge-emoji {
+        filter: grayscale(0.7) drop-shadow(0 2px 8px rgba(0,0,0,0.3));
+    }
+    .badge-name {
+        font-size: 19px;
+        font-weight: 600;
+        color: var(--vant-text-primary);
+        line-height: 1.2;
+    }
+    .badge-card.locked .badge-name {
+        color: var(--vant-text-tertiary);
+    }
+    .badge-level {
+        font-size: 16px;
+        color: var(--vant-text-secondary);
+    }
+    .badge-card.earned .badge-level {
+        color: var(--vant-accent);
+    }
+    """,
+    layout=PHONE_LAYOUT,
+    screen="""
+    {status_bar}
+    <div class="badge-content">
+        <div class="badge-header">{badge_header}</div>
+        <div class="badge-count"><span>{earned}</span> / {total} {earned_label}</div>
+        <div class="badge-grid">{badges:badge}
+        </div>
+    </div>
+    {tab_bar}
+    """,
+    parts={
+        **PHONE_PARTS,
+        "badge": """
+            <div class="badge-card {state}">
+                <div class="badge-emoji">{emoji}</div>
+                <div class="badge-name">{name}</div>
+                <div class="badge-level">{level}</div>
+            </div>""",
+    },
+    content={
+        "headline": "57 rozet.<br>Gerçek ödüller.",
+        "subtitle": "Finansal disiplini oyunlaştır",
+        "badge_header": "Rozetler",
+        "earned": "12",
+        "total": "57",
+        "earned_label": "kazanıldı",
+        "badges": [
+            {"emoji": emoji, "name": name, "level": level, "state": state}
+            for emoji, name, level, state in (
+                ("🚀", "İlk Adım", "Kazanıldı", "earned"),
+                ("🔥", "3 Gün Seri", "Kazanıldı", "earned"),
+                ("💰", "1K Tasarruf", "Kazanıldı", "earned"),
+                ("🎯", "Hedef Koyucu", "Kazanıldı", "earned"),
+                ("📊", "Analist", "Kazanıldı", "earned"),
+                ("🛡️", "Koruyucu", "Kazanıldı", "earned"),
+                ("⚡", "Hızlı Karar", "Kazanıldı", "earned"),
+                ("🌟", "Parlayan Yıldız", "Kazanıldı", "earned"),
+                ("🎖️", "Disiplinli", "Kazanıldı", "earned"),
+                ("👑", "Kral", "Kilitli", "locked"),
+                ("💎", "Elmas", "Kilitli", "locked"),
+                ("🏅", "Altın Çağ", "Kilitli", "locked"),
+            )
+        ],
+    },
+)
@@ -0,0 +1,149 @@
+"""Frame 6 — AI chat."""
+
+from frame_templates import FrameSpec, PHONE_LAYOUT, PHONE_PARTS
+
+FRAME = FrameSpec(
+    name="appstore_6_ai_chat",
+    css="""
+    .chat-content {
+        padding: 88px 24px 30px;
+        display: flex;
+        flex-direction: column;
+        height: 100%;
+    }
+    .chat-header {
+        text-align: center;
+        margin-bottom: 28px;
+    }
+    .chat-header-title {
+        font-size: 34px;
+        font-weight: 700;
+        color: var(--vant-text-primary);
+    }
+    .chat-header-sub {
+        font-size: 20px;
+        color: var(--vant-text-secondary);
+        margin-top: 4px;
+    }
+    .chat-ai-avatar {
+        width: 70px; height: 70px;
+        border-radius: 50%;
+        background: linear-gradient(135deg, var(--vant-primary), var(--vant-primary-light));
+        display: flex; align-items: center; justify-content: center;
+        font-size: 34px;
+        margin: 0 auto 20px;
+        box-shadow: 0 4px 20px rgb(var(--vant-primary-rgb) / 0.4);
+    }
+    .chat-messages {
+        flex: 1;
+        display: flex;
+        flex-direction: column;
+        gap: 18px;
+        overflow: hidden;
+    }
+    .msg {
+        max-width: 85%;
+        border-radius: 22px;
+        padding: 20px 24px;
+        font-size: 24px;
+        line-height: 1.45;
+    }
+    .msg-user {
+        align-self: flex-end;
+        background: linear-gradient(135deg, var(--vant-primary), #4A3870);
+        color: var(--vant-text-primary);
+        border-bottom-right-radius: 6px;
+    }
+    .msg-ai {
+        align-self: flex-start;
+        background: rgb(var(--vant-surface-rgb) / 0.8);
+        border: 1px solid rgba(255,255,255,0.06);
+        color: var(--vant-text-primary);
+        border-bottom-left-radius: 6px;
+    }
+    .msg-ai .highlight {
+        color: var(--vant-accent);
+        font-weight: 600;
+    }
+    .msg-ai .stat-line {
+        display: block;
+        padding: 3px 0;
+    }
+    .chat-input-bar {
+        display: flex;
+        align-items: center;
+        gap: 12px;
+        padding: 16px 20px;
+        background: rgb(var(--vant-surface-rgb) / 0.6);
+        border: 1px solid rgba(255,255,255,0.06);
+        border-radius: 20px;
+        margin-top: 18px;
+        margin-bottom: 48px;
+    }
+    .chat-input-text {
+        flex: 1;
+        font-size: 22px;
+        color: var(--vant-text-tertiary);
+    }
+    .chat-input-mic {
+        width: 44px; height: 44px;
+        border-radius: 50%;
+        background: linear-gradient(135deg, var(--vant-primary), var(--vant-primary-light));
+        display: flex; align-items: center; justify-content: center;
+        font-size: 22px;
+    }
+    """,
+    layout=PHONE_LAYOUT,
+    screen="""
+    {status_bar}
+    <div class="chat-content">
+        <div class="chat-header">
+            <div class="chat-ai-avatar">✨</div>
+            <div class="chat-header-title">{chat_title}</div>
+            <div class="chat-header-sub">{chat_sub}</div>
+        </div>
+
+        <div class="chat-messages">{messages:message}
+        </div>
+
+        <div class="chat-input-bar">
+            <div class="chat-input-text">{input_placeholder}</div>
+            <div class="chat-input-mic">🎤</div>
+        </div>
+    </div>
+    """,
+    parts={
+        **PHONE_PARTS,
+        "message": """
+            <div class="msg msg-{role}">{text}</div>
+""",
+    },
+    content={
+        "headline": "Yapay zekaya<br>harcamalarını sor",
+        "subtitle": "Kişisel finans asistanın",
+        "chat_title": "AI Asistan",
+        "chat_sub": "Vantag Finansal Asistan",
+        "input_placeholder": "Harcamalarını sor...",
+        "messages": [
+            {"role": "user", "text": "Bu ay ne kadar harcadım?"},
+            {"role": "ai", "text": """
+                Şubat ayında toplam <span class="highlight">5.240₺</span> harcadınız.
+                <br><br>
+                📊 En yüksek kategoriler:
+                <span class="stat-line">1. Yeme-İçme: <span class="highlight">2.100₺</span></span>
+                <span class="stat-line">2. Ulaşım: <span class="highlight">1.500₺</span></span>
+                <span class="stat-line">3. Faturalar: <span class="highlight">890₺</span></span>
+                <br>
+                Geçen aya göre <span class="highlight">%12 azalma</span> var! 🎉
+            """},
+            {"role": "user", "text": "Tasarruf için ne önerirsin?"},
+            {"role": "ai", "text": """
+                Yeme-İçme kategorisinde haftada 3 kez dışarıda yemek yerine
+                evde hazırlayarak ayda yaklaşık
+                <span class="highlight">800₺ tasarruf</span> edebilirsiniz! 💡
+                <br><br>
+                Bu, <span class="highlight">2.3 saat</span> daha az çalışmak demek ⏰
+            """},
+        ],
+    },
+)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Vantag store-listing A/B variant generator.
+
+Expands a parameter grid over the existing frame content (headlines,
+subtitles, accent colour, hero numbers, …) into variants, deduplicates
+variants whose HTML is identical, renders the unique ones through the
+shared browser pool and writes a manifest linking every variant ID to its
+parameters and output files. PNGs are named by content hash, so re-runs
+only render variants that are new.
+
+Grid file (JSON):
+
+    {
+      "appstore_2_home": {
+        "headline": ["Her harcamayı<br>saatinle gör", "Harcamanı saatle ölç"],
+        "accent": ["#FEFACD", "#22D3EE"],
+        "hero_numbers.0.num": ["7", "12"]
+      },
+      "appstore_5_badges": {
+        "headline": ["57 rozet.<br>Gerçek ödüller."]
+      }
+    }
+
+Keys are content fields of the frame spec; dotted keys index into nested
+lists/dicts. "accent" overrides the --vant-accent design token (and the
+--vant-accent-rgb triplet derived from it) through frame_html(tokens=…);
+frames that do not reference the token are unaffected.
+
+Usage:
+    python3 scripts/generate_variants.py scripts/variant_grids/store_listing.json
+    python3 scripts/generate_variants.py grid.json --dry-run   # manifest only
+    python3 scripts/generate_variants.py grid.json --patch-variants   # one page per frame
+
+Output: docs/screenshots/variants/<sha>.png
+        docs/screenshots/variants/manifest.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import time
+
+import design_tokens
+import dom_patch
+import render_trace
+from generate_screenshots import (
+    DEVICE, FRAMES, LOCALE, OUT_DIR,
+    add_pool_arguments, enable_page_features, frame_html, load_backend, pool_options,
+    render_png, tag_srgb,
+)
+
+VARIANTS_DIR = os.path.join(OUT_DIR, "variants")
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GRID EXPANSION
+# ═══════════════════════════════════════════════════════════════════════════
+
+def expand_grid(grid: dict):
+    """Yield (frame_name, params) for every combination in the grid."""
+    for frame_name, axes in grid.items():
+        keys = sorted(axes)
+        for values in itertools.product(*(axes[k] for k in keys)):
+            yield frame_name, dict(zip(keys, values))
+
+
+def variant_id(frame_name: str, params: dict) -> str:
+    digest = hashlib.sha1(
+        json.dumps(params, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    return f"{frame_name}-{digest[:10]}"
+
+
+def variant_html(spec, params: dict) -> str:
+    content = {k: v for k, v in params.items() if k != "accent"}
+    accent = params.get("accent")
+    if not accent or accent.upper() == design_tokens.load_table().value("vant-accent"):
+        return frame_html(spec, content)
+    return frame_html(spec, content, tokens={"accent": accent.upper()})
+
+
+def plan_variants(grid: dict):
+    """Variants with HTML and content hash; identical outputs share a hash."""
+    specs = {spec.name: spec for spec in FRAMES}
+    unknown = sorted(set(grid) - set(specs))
+    if unknown:
+        raise SystemExit(f"ERROR: unknown frame(s) in grid: {', '.join(unknown)}")
+
+    variants, unique = [], {}
+    for frame_name, params in expand_grid(grid):
+        html = variant_html(specs[frame_name], params)
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        variants.append({
+            "id": variant_id(frame_name, params),
+            "frame": frame_name,
+            "params": params,
+            "sha256": digest,
+        })
+        unique.setdefault(digest, (frame_name, html))
+    return variants, unique
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# RENDERING
+# ═══════════════════════════════════════════════════════════════════════════
+
+async def render_unique(unique: dict, args) -> dict:
+    """Render each distinct HTML once; returns sha → png path."""
+    async_playwright = load_backend(args)
+    from browser_pool import BrowserPool
+
+    outputs, pending = {}, []
+    for digest, (frame_name, html) in unique.items():
+        path = os.path.join(VARIANTS_DIR, f"{digest[:16]}.png")
+        outputs[digest] = path
+        if args.force or not os.path.exists(path):
+            pending.append((digest, frame_name, html, path))
+
+    print(f"  Unique outputs : {len(unique)} ({len(unique) - len(pending)} cached)")
+    if not pending:
+        return outputs
+
+    done = 0
+
+    async def render_one(pool, digest, frame_name, html, path):
+        nonlocal done
+        attrs = {"frame": frame_name, "locale": LOCALE, "device": DEVICE,
+                 "variant": digest[:16]}
+        png = await render_png(pool, html, attrs)
+        with open(path, "wb") as f:
+            f.write(png)
+        done += 1
+        if done % 25 == 0 or done == len(pending):
+            print(f"  Rendered {done}/{len(pending)}")
+
+    async def render_patched(pool, jobs):
+        """Variants of one frame on one hot page, each applied as a DOM patch."""
+        nonlocal done
+        async with dom_patch.hot_page(pool, DEVICE, args.verify_patches) as hot:
+            for digest, frame_name, html, path in jobs:
+                png = tag_srgb(await hot.render(html))
+                with open(path, "wb") as f:
+                    f.write(png)
+                done += 1
+                if done % 25 == 0 or done == len(pending):
+                    print(f"  Rendered {done}/{len(pending)}")
+
+    async with async_playwright() as p:
+        async with BrowserPool(p, **pool_options(args)) as pool:
+            print(f"  Concurrency    : {pool.size} pages")
+            if args.patch_variants:
+                by_frame = {}
+                for job in pending:
+                    by_frame.setdefault(job[1], []).append(job)
+                await asyncio.gather(*(render_patched(pool, jobs) for jobs in by_frame.values()))
+                print(f"  {dom_patch.format_stats()}")
+            else:
+                await asyncio.gather(*(render_one(pool, *job) for job in pending))
+            print(f"  {pool.format_metrics()}")
+    return outputs
+
+
+def write_manifest(variants, outputs, path):
+    first_id = {}
+    for v in variants:
+        v["duplicate_of"] = first_id.setdefault(v["sha256"], v["id"])
+        if v["duplicate_of"] == v["id"]:
+            v["duplicate_of"] = None
+        png = outputs.get(v["sha256"])
+        v["files"] = {"png": os.path.relpath(png, os.path.dirname(path))} if png else {}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "locale": LOCALE,
+            "device": DEVICE,
+            "variants": variants,
+        }, f, ensure_ascii=False, indent=2)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render store-listing A/B variants.")
+    parser.add_argument("grid", help="JSON parameter grid")
+    parser.add_argument("--out", default=VARIANTS_DIR, help="output directory")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="expand and deduplicate only; write the manifest without rendering")
+    parser.add_argument("--force", action="store_true", help="re-render cached variants")
+    parser.add_argument("--patch-variants", action="store_true",
+                        help="render each frame's variants on one page as DOM patches")
+    parser.add_argument("--verify-patches", action="store_true",
+                        help="with --patch-variants, compare every merged capture to a full one")
+    add_pool_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main():
+    global VARIANTS_DIR
+    args = parse_args()
+    VARIANTS_DIR = args.out
+    if args.trace:
+        render_trace.enable(args.trace)
+    else:
+        render_trace.enable_from_env()
+    asyncio.run(enable_page_features(args))
+
+    with open(args.grid, encoding="utf-8") as f:
+        grid = json.load(f)
+
+    print("Vantag Store Listing Variant Generator")
+    print(f"{'=' * 52}")
+    started = time.perf_counter()
+    variants, unique = plan_variants(grid)
+    print(f"  Variants       : {len(variants)}")
+    print(f"  Duplicates     : {len(variants) - len(unique)}")
+
+    os.makedirs(VARIANTS_DIR, exist_ok=True)
+    outputs = {} if args.dry_run else asyncio.run(render_unique(unique, args))
+
+    manifest_path = os.path.join(VARIANTS_DIR, "manifest.json")
+    write_manifest(variants, outputs, manifest_path)
+    elapsed = time.perf_counter() - started
+    print()
+    print(f"Done in {elapsed:.1f}s. Manifest → {manifest_path}")
+    if render_trace.tracer.enabled:
+        render_trace.tracer.save()
+
+
+if __name__ == "__main__":
+    main()
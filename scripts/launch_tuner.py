@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Chromium launch-profile auto-tuner.
+
+Per-frame render time on CPU-only runners depends heavily on how Chromium
+is launched and how screenshots are captured: GPU vs SwiftShader vs plain
+software raster, raster thread count, headless shell vs full Chromium,
+and Playwright's screenshot path vs a direct CDP capture with
+optimizeForSpeed. The tuner renders the real frames under every profile
+in PROFILES, rejects profiles whose pixels differ from the default
+launch beyond a tolerance, and stores the fastest one for this host's
+fingerprint (OS, CPU model and count, memory, Playwright version).
+
+Every later render picks the stored profile up automatically through
+pool_options() (--launch-profile overrides: a profile name, "default",
+or "auto").
+
+Usage:
+    python3 scripts/launch_tuner.py                     # benchmark + store
+    python3 scripts/launch_tuner.py --only 'appstore_[12]*' --runs 5
+    python3 scripts/launch_tuner.py --show              # stored profile for this host
+
+Stored: .screenshot_cache/launch_profiles.json
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import weakref
+
+# Pixel-equivalence tolerance against the default profile: rasterizers
+# may differ in anti-aliasing, never in content.
+DIFF_THRESHOLD = 32
+MAX_MEAN_DIFF = 0.5
+MAX_DIFF_FRACTION = 0.001
+
+
+def _raster_threads() -> list:
+    from browser_pool import available_cpus
+    return sorted({1, 2, min(4, available_cpus())})
+
+
+def _profiles() -> dict:
+    """name → {"launch": chromium.launch() kwargs, "capture": mode}."""
+    launches = {
+        "default": {},
+        "no-gpu": {"args": ["--disable-gpu", "--disable-gpu-compositing"]},
+        "swiftshader": {"args": ["--use-angle=swiftshader", "--enable-unsafe-swiftshader",
+                                 "--enable-gpu-rasterization"]},
+        **{f"raster-{n}": {"args": ["--disable-gpu", f"--num-raster-threads={n}"]}
+           for n in _raster_threads()},
+        "full-chromium": {"channel": "chromium"},
+    }
+    profiles = {}
+    for name, launch in launches.items():
+        profiles[name] = {"launch": launch, "capture": "playwright"}
+        profiles[f"{name}+cdp-fast"] = {"launch": launch, "capture": "cdp-fast"}
+    return profiles
+
+
+DEFAULT_PROFILE = {"name": "default", "launch": {}, "capture": "playwright"}
+
+active = None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# HOST FINGERPRINT + STORE
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.lower().startswith(("model name", "hardware")):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _playwright_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("playwright")
+    except Exception:
+        return "unknown"
+
+
+def host_fingerprint() -> tuple:
+    """(short hash, description) of what makes timings comparable."""
+    from browser_pool import available_cpus, total_memory_mb
+
+    memory = total_memory_mb()
+    description = " · ".join([
+        f"{platform.system()} {platform.machine()}",
+        _cpu_model(),
+        f"{available_cpus()} cpu",
+        f"{round((memory or 0) / 1024)} GB",
+        f"playwright {_playwright_version()}",
+    ])
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()[:16], description
+
+
+def store_path() -> str:
+    from generate_screenshots import CACHE_DIR
+    return os.path.join(CACHE_DIR, "launch_profiles.json")
+
+
+def load_store() -> dict:
+    try:
+        with open(store_path(), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_profile(entry: dict):
+    store = load_store()
+    key, _ = host_fingerprint()
+    store[key] = entry
+    os.makedirs(os.path.dirname(store_path()), exist_ok=True)
+    with open(store_path(), "w", encoding="utf-8") as f:
+        json.dump(store, f, ensure_ascii=False, indent=2)
+
+
+def select(name: str = "auto") -> dict:
+    """Make a profile active: "auto" (stored for this host, else default),
+    "default", or a name from PROFILES."""
+    global active
+    if name == "auto":
+        key, _ = host_fingerprint()
+        stored = load_store().get(key)
+        active = ({"name": stored["profile"], "launch": stored["launch"],
+                   "capture": stored["capture"]} if stored else DEFAULT_PROFILE)
+    elif name == "default":
+        active = DEFAULT_PROFILE
+    else:
+        profiles = _profiles()
+        if name not in profiles:
+            print(f"ERROR: unknown launch profile '{name}'")
+            print(f"  available: auto, {', '.join(profiles)}")
+            sys.exit(1)
+        active = {"name": name, **profiles[name]}
+    return active
+
+
+def launch_options() -> dict:
+    return dict((active or DEFAULT_PROFILE)["launch"])
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CAPTURE
+# ═══════════════════════════════════════════════════════════════════════════
+
+_cdp_sessions = weakref.WeakKeyDictionary()
+
+
+async def _capture(page, mode: str, type: str = "png", quality: int = None) -> bytes:
+    if mode == "playwright":
+        return await page.screenshot(type=type, quality=quality)
+    session = _cdp_sessions.get(page)
+    if session is None:
+        session = await page.context.new_cdp_session(page)
+        _cdp_sessions[page] = session
+    params = {
+        "format": type,
+        "fromSurface": True,
+        "captureBeyondViewport": False,
+        "optimizeForSpeed": mode == "cdp-fast",
+    }
+    if quality is not None:
+        params["quality"] = quality
+    result = await session.send("Page.captureScreenshot", params)
+    return base64.b64decode(result["data"])
+
+
+async def screenshot(page, type: str = "png", quality: int = None) -> bytes:
+    """Viewport capture of `page` (PNG, or JPEG at `quality`) using the
+    active profile's capture path."""
+    return await _capture(page, (active or DEFAULT_PROFILE)["capture"], type, quality)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════
+
+def pixel_diff(a_png: bytes, b_png: bytes) -> dict:
+    try:
+        from PIL import Image, ImageChops
+    except ImportError:
+        print("ERROR: Pillow is required to compare renders.")
+        print("  pip install pillow --break-system-packages")
+        sys.exit(1)
+    a = Image.open(io.BytesIO(a_png)).convert("RGB")
+    b = Image.open(io.BytesIO(b_png)).convert("RGB")
+    if a.size != b.size:
+        return {"ok": False, "mean_diff": None, "diff_fraction": 1.0}
+    diff = ImageChops.difference(a, b).convert("L")
+    hist = diff.histogram()
+    pixels = a.size[0] * a.size[1]
+    mean = sum(i * n for i, n in enumerate(hist)) / pixels
+    fraction = sum(hist[DIFF_THRESHOLD + 1:]) / pixels
+    return {"ok": mean <= MAX_MEAN_DIFF and fraction <= MAX_DIFF_FRACTION,
+            "mean_diff": round(mean, 4), "diff_fraction": round(fraction, 6)}
+
+
+async def benchmark_profile(p, profile: dict, pages: list, runs: int) -> dict:
+    """Median per-frame ms (set_content + capture) and the last captures."""
+    from generate_screenshots import settle_fonts, setup_context
+
+    try:
+        browser = await p.chromium.launch(**profile["launch"])
+    except Exception as e:
+        return {"error": str(e).splitlines()[0]}
+    try:
+        shots, totals = {}, []
+        for run in range(runs + 1):            # run 0 warms caches, not timed
+            total = 0.0
+            for name, html, viewport, scale in pages:
+                context = await browser.new_context(viewport=viewport, device_scale_factor=scale)
+                await setup_context(context)
+                page = await context.new_page()
+                started = time.perf_counter()
+                await page.set_content(html, wait_until="domcontentloaded")
+                elapsed = time.perf_counter() - started
+                await settle_fonts(page)                 # same settle as render_png
+                started = time.perf_counter()
+                shots[name] = await _capture(page, profile["capture"])
+                elapsed += time.perf_counter() - started
+                await context.close()
+                if run:
+                    total += elapsed
+            if run:
+                totals.append(total)
+        return {"ms_per_frame": 1000 * statistics.median(totals) / len(pages),
+                "version": browser.version, "shots": shots}
+    finally:
+        await browser.close()
+
+
+async def tune(pages: list, profiles: dict, runs: int) -> list:
+    from generate_screenshots import load_playwright
+
+    async_playwright = load_playwright()
+    results = []
+    async with async_playwright() as p:
+        reference = None
+        for name, profile in profiles.items():
+            r = await benchmark_profile(p, profile, pages, runs)
+            r["profile"] = name
+            if "error" in r:
+                print(f"  – {name:<24} unavailable: {r['error']}")
+                results.append(r)
+                if reference is None:
+                    break                       # no default launch: nothing to compare to
+                continue
+            if reference is None:
+                reference = r["shots"]          # first profile is the default launch
+            diffs = [pixel_diff(reference[k], v) for k, v in r.pop("shots").items()]
+            r["equivalent"] = all(d["ok"] for d in diffs)
+            r["max_mean_diff"] = max(d["mean_diff"] or 0 for d in diffs)
+            mark = "✓" if r["equivalent"] else "✗"
+            print(f"  {mark} {name:<24} {r['ms_per_frame']:8.1f} ms/frame  "
+                  f"mean diff {r['max_mean_diff']:.3f}")
+            results.append(r)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Chromium launch profiles.")
+    parser.add_argument("--only", nargs="+", metavar="GLOB", help="frames to render (default: all)")
+    parser.add_argument("--runs", type=int, default=3, help="timed passes per profile")
+    parser.add_argument("--profiles", nargs="+", metavar="NAME",
+                        help="profiles to try (default: all; 'default' is always included)")
+    parser.add_argument("--show", action="store_true", help="print the stored profile and exit")
+    args = parser.parse_args()
+
+    key, description = host_fingerprint()
+    print("Vantag Launch-Profile Tuner")
+    print(f"{'=' * 52}")
+    print(f"  Host : {description} ({key})")
+
+    if args.show:
+        stored = load_store().get(key)
+        if stored:
+            print(f"  Profile : {stored['profile']} ({stored['ms_per_frame']:.1f} ms/frame, "
+                  f"tuned {stored['tuned_at']})")
+        else:
+            print("  Profile : none stored, renders use the default launch")
+        return
+
+    import frames
+    from generate_screenshots import DEVICE, device_profile, frame_html
+
+    profiles = _profiles()
+    wanted = ["default"] + [n for n in (args.profiles or profiles) if n != "default"]
+    unknown = [n for n in wanted if n not in profiles]
+    if unknown:
+        print(f"ERROR: unknown profile(s) {', '.join(unknown)}")
+        sys.exit(1)
+    viewport, scale = device_profile(DEVICE)
+    pages = [(spec.name, frame_html(spec), viewport, scale)
+             for spec in frames.load_all(args.only)]
+    print(f"  Frames : {len(pages)} × {args.runs} runs, {len(wanted)} profiles")
+    print()
+
+    results = asyncio.run(tune(pages, {n: profiles[n] for n in wanted}, args.runs))
+    baseline = results[0]
+    if "error" in baseline:
+        print("ERROR: the default launch profile failed; nothing to compare against.")
+        sys.exit(1)
+    best = min((r for r in results if r.get("equivalent")), key=lambda r: r["ms_per_frame"])
+    save_profile({
+        "profile": best["profile"],
+        **profiles[best["profile"]],
+        "ms_per_frame": round(best["ms_per_frame"], 2),
+        "baseline_ms_per_frame": round(baseline["ms_per_frame"], 2),
+        "chromium": best["version"],
+        "host": description,
+        "tuned_at": time.strftime("%Y-%m-%d %H:%M"),
+        "results": results,
+    })
+    print()
+    print(f"  Fastest equivalent: {best['profile']} — {best['ms_per_frame']:.1f} ms/frame "
+          f"vs {baseline['ms_per_frame']:.1f} default "
+          f"({baseline['ms_per_frame'] / best['ms_per_frame']:.2f}×)")
+    print(f"  Stored → {store_path()}")
+
+
+if __name__ == "__main__":
+    main()
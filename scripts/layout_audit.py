@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Batched in-page layout audit across the locale × device matrix.
+
+After a frame loads, one page.evaluate() walks every element and returns
+everything that looks broken:
+
+    overflow  content larger than its box (scrollWidth/Height > client)
+    overlap   in-flow siblings whose boxes intersect
+    clipped   text boxes that stick out of `.screen` or the viewport
+    wrap      text that breaks onto more lines than in the base locale
+
+Results from all cells (locale, device, frame) are aggregated into one
+report keyed by element path, so a clipped `.badge-name` shows up once
+with every cell it breaks in.
+
+Usage:
+    python3 scripts/layout_audit.py [--locale en de] [--device iphone_6_9]
+                                    [--report audit.json] [--strict]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+import render_trace
+from generate_screenshots import (
+    CACHE_DIR, DEVICES, FRAMES, LOCALE,
+    add_pool_arguments, available_locales, device_profile, enable_page_features,
+    frame_html, load_backend, pool_options,
+)
+
+AUDIT_REPORT = os.path.join(CACHE_DIR, "layout_audit.json")
+
+# Runs inside the page. Returns every element with a problem plus the line
+# count of every text box, in a single round trip.
+AUDIT_SCRIPT = """
+async () => {
+    await document.fonts.ready;
+    const screen = document.querySelector('.screen');
+    const screenRect = screen ? screen.getBoundingClientRect() : null;
+    const vw = window.innerWidth, vh = window.innerHeight;
+    const TOL = 1;
+
+    const pathOf = (el) => {
+        const parts = [];
+        for (let n = el; n && n !== document.body; n = n.parentElement) {
+            let part = n.tagName.toLowerCase();
+            if (n.classList.length) part += '.' + [...n.classList].join('.');
+            const same = n.parentElement
+                ? [...n.parentElement.children].filter(c => c.tagName === n.tagName)
+                : [];
+            if (same.length > 1) part += `:nth-of-type(${same.indexOf(n) + 1})`;
+            parts.unshift(part);
+        }
+        return parts.join(' > ');
+    };
+    const ownText = (el) => [...el.childNodes]
+        .filter(n => n.nodeType === Node.TEXT_NODE)
+        .map(n => n.textContent).join('').trim();
+    const lineCount = (el) => {
+        const range = document.createRange();
+        range.selectNodeContents(el);
+        const tops = new Set();
+        for (const r of range.getClientRects()) {
+            if (r.width > 0) tops.add(Math.round(r.top));
+        }
+        return tops.size;
+    };
+    const rectOf = (r) => [Math.round(r.left), Math.round(r.top),
+                           Math.round(r.width), Math.round(r.height)];
+    const inFlow = (cs) => cs.position === 'static' || cs.position === 'relative';
+
+    const issues = [];
+    const lines = {};
+    for (const el of document.body.querySelectorAll('*')) {
+        const cs = getComputedStyle(el);
+        if (cs.display === 'none' || cs.visibility === 'hidden') continue;
+        const r = el.getBoundingClientRect();
+        if (r.width === 0 && r.height === 0) continue;
+        const text = ownText(el);
+        const path = pathOf(el);
+
+        if (text) {
+            lines[path] = lineCount(el);
+            if (el.clientWidth > 0 && (el.scrollWidth > el.clientWidth + TOL ||
+                                       el.scrollHeight > el.clientHeight + TOL)) {
+                issues.push({kind: 'overflow', path, text, rect: rectOf(r),
+                             scroll: [el.scrollWidth, el.scrollHeight]});
+            }
+            const bounds = screen && screen.contains(el) ? screenRect
+                : {left: 0, top: 0, right: vw, bottom: vh};
+            if (r.left < bounds.left - TOL || r.right > bounds.right + TOL ||
+                r.top < bounds.top - TOL || r.bottom > bounds.bottom + TOL) {
+                issues.push({kind: 'clipped', path, text, rect: rectOf(r)});
+            }
+        }
+
+        const kids = [...el.children].filter(c => {
+            const s = getComputedStyle(c);
+            return s.display !== 'none' && inFlow(s);
+        });
+        const rects = kids.map(c => c.getBoundingClientRect());
+        for (let i = 0; i < kids.length; i++) {
+            for (let j = i + 1; j < kids.length; j++) {
+                const a = rects[i], b = rects[j];
+                const w = Math.min(a.right, b.right) - Math.max(a.left, b.left);
+                const h = Math.min(a.bottom, b.bottom) - Math.max(a.top, b.top);
+                if (w > TOL && h > TOL) {
+                    issues.push({kind: 'overlap', path: pathOf(kids[i]),
+                                 other: pathOf(kids[j]), rect: rectOf(a),
+                                 text: kids[i].textContent.trim().slice(0, 60)});
+                }
+            }
+        }
+    }
+    return {issues, lines};
+}
+"""
+
+
+async def audit_cell(pool, spec, locale, device):
+    """Load one frame variant and run the batched audit script."""
+    html = frame_html(spec, locale=locale)
+    viewport, scale = device_profile(device)
+    attrs = {"frame": spec.name, "locale": locale, "device": device}
+    async with pool.page(viewport, scale) as page:
+        with render_trace.tracer.span("audit.set_content", **attrs):
+            await page.set_content(html, wait_until="domcontentloaded")
+        with render_trace.tracer.span("audit.evaluate", **attrs):
+            result = await page.evaluate(AUDIT_SCRIPT)
+    return (locale, device, spec.name), result
+
+
+def aggregate(cells: dict, base_locale: str = LOCALE) -> dict:
+    """Group issues by (kind, element path) across the whole matrix."""
+    grouped = {}
+
+    def add(kind, path, cell, detail):
+        entry = grouped.setdefault(f"{kind} {path}", {
+            "kind": kind, "path": path, "cells": [], "examples": {},
+        })
+        label = "/".join(cell)
+        entry["cells"].append(label)
+        entry["examples"].setdefault(label, detail)
+
+    for cell, result in cells.items():
+        locale, device, frame = cell
+        for issue in result["issues"]:
+            detail = {k: v for k, v in issue.items() if k not in ("kind", "path")}
+            add(issue["kind"], f"{frame} :: {issue['path']}", cell, detail)
+
+        base = cells.get((base_locale, device, frame))
+        if base is None or locale == base_locale:
+            continue
+        for path, count in result["lines"].items():
+            expected = base["lines"].get(path)
+            if expected is not None and count > expected:
+                add("wrap", f"{frame} :: {path}", cell,
+                    {"lines": count, "base_lines": expected})
+
+    issues = sorted(grouped.values(), key=lambda e: (-len(e["cells"]), e["path"]))
+    return {
+        "cells": len(cells),
+        "issues": issues,
+        "by_cell": {
+            "/".join(cell): sum(1 for e in issues if "/".join(cell) in e["cells"])
+            for cell in cells
+        },
+    }
+
+
+async def run_audit(locales, devices, args) -> dict:
+    async_playwright = load_backend(args)
+    from browser_pool import BrowserPool
+
+    # The base locale is always audited so wrap regressions have a reference.
+    locales = [LOCALE] + [l for l in locales if l != LOCALE]
+    matrix = [(spec, l, d) for l in locales for d in devices for spec in FRAMES]
+    async with async_playwright() as p:
+        async with BrowserPool(p, **pool_options(args)) as pool:
+            results = await asyncio.gather(*(audit_cell(pool, *cell) for cell in matrix))
+            print(f"  {pool.format_metrics()}")
+    return aggregate(dict(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit frame layouts across locales and devices.")
+    parser.add_argument("--locale", nargs="*", help="locales (default: all)")
+    parser.add_argument("--device", nargs="*", choices=sorted(DEVICES), help="devices (default: all)")
+    parser.add_argument("--report", default=AUDIT_REPORT, help="JSON report path")
+    parser.add_argument("--strict", action="store_true", help="exit non-zero if any issue is found")
+    add_pool_arguments(parser)
+    args = parser.parse_args()
+    if args.trace:
+        render_trace.enable(args.trace)
+    else:
+        render_trace.enable_from_env()
+    asyncio.run(enable_page_features(args))
+
+    locales = args.locale or available_locales()
+    devices = args.device or list(DEVICES)
+    print("Vantag Layout Audit")
+    print(f"{'=' * 52}")
+    print(f"  Matrix : {len(locales)} locales × {len(devices)} devices × {len(FRAMES)} frames")
+
+    started = time.perf_counter()
+    report = asyncio.run(run_audit(locales, devices, args))
+    report["elapsed_s"] = round(time.perf_counter() - started, 2)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print()
+    for entry in report["issues"][:40]:
+        print(f"  {entry['kind']:<8} ×{len(entry['cells']):<3} {entry['path']}")
+    if len(report["issues"]) > 40:
+        print(f"  … {len(report['issues']) - 40} more")
+    print()
+    print(f"{len(report['issues'])} issues in {report['cells']} cells "
+          f"({report['elapsed_s']}s). Report → {args.report}")
+    if render_trace.tracer.enabled:
+        render_trace.tracer.save()
+    if args.strict and report["issues"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
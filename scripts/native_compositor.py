@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Browser-free compositor for simple frames.
+
+`appstore_1_hook` is a gradient, two glow ellipses, centered text lines, an
+emoji and the logo mark — nothing that needs a layout engine. This module
+draws it straight from the same FrameSpec content with NumPy (vectorized
+linear/radial gradients, alpha blending) and Pillow (FreeType text, colour
+emoji, Gaussian shadows), at any device size and locale, in a fraction of
+the time a Chromium render takes.
+
+Native output is only trusted within a pixel-diff tolerance of the browser
+render; `--check` renders both and fails when they drift apart.
+
+Usage:
+    python3 scripts/native_compositor.py                     # all locales/devices
+    python3 scripts/native_compositor.py --locale en --check # diff vs Chromium
+    python3 scripts/generate_screenshots.py --native         # use it in the main run
+"""
+
+import argparse
+import asyncio
+import functools
+import io
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+import unicodedata
+from dataclasses import dataclass, replace
+
+try:
+    import numpy as np
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+except ImportError:
+    print("ERROR: Pillow and NumPy are required for native rendering.")
+    print("  pip install pillow numpy --break-system-packages")
+    sys.exit(1)
+
+import design_tokens
+import font_assets
+import frames
+import text_fit
+from generate_screenshots import (
+    CACHE_DIR, DEVICE, DEVICES, LOCALE, W,
+    add_pool_arguments, available_locales, device_profile, enable_page_features,
+    frame_content, frame_html, output_path, pool_options, tag_srgb,
+)
+
+CHECK_REPORT = os.path.join(CACHE_DIR, "native_check.json")
+DIFF_DIR = os.path.join(CACHE_DIR, "native_diff")
+
+# Per-channel difference (0–255) above which a pixel counts as "different",
+# and the limits a native render must stay within against Chromium.
+DIFF_THRESHOLD = 48
+MAX_MEAN_DIFF = 4.0
+MAX_DIFF_FRACTION = 0.02
+
+# Noto Color Emoji only ships a 109px bitmap strike; glyphs are scaled.
+EMOJI_STRIKE = 109
+
+# Colours and geometry from COMMON_CSS and FRAME_1_HOOK's CSS (CSS px).
+# Colours the CSS takes from design tokens are named here by token and
+# resolved from the token table when drawing, like the browser frames.
+BG_ANGLE = 175
+BG_STOPS = [(0.0, "vant-primary-dark"), (0.3, (0x2A, 0x1D, 0x47)), (1.0, (0x1A, 0x11, 0x28))]
+ACCENT = "vant-accent"
+TEXT = "vant-text-primary"
+
+
+@dataclass(frozen=True)
+class TextStyle:
+    size: float
+    weight: int
+    color: tuple                  # (r, g, b, a) or (token, a), a in 0–1
+    letter_spacing: float = 0.0
+    line_height: float = None     # multiple of size; None = font's "normal"
+    shadow: tuple = None          # (dx, dy, blur, colour as above)
+    selector: str = None          # element it stands for; picks the bundled face
+
+
+HOOK_EMOJI = TextStyle(160, 400, (TEXT, 1.0), shadow=(0, 8, 30, (0, 0, 0, 0.3)),
+                       selector=".hook-emoji")
+HOOK_LINE = TextStyle(96, 800, (ACCENT, 1.0), letter_spacing=-2, line_height=1.15,
+                      shadow=(0, 4, 50, (ACCENT, 0.2)), selector=".hook-line")
+HOOK_EQUALS = TextStyle(72, 300, (ACCENT, 0.45), selector=".hook-equals")
+HOOK_TAGLINE = TextStyle(38, 400, (TEXT, 0.45), letter_spacing=-0.3, selector=".hook-tagline")
+LOGO_LETTER = TextStyle(40, 800, (ACCENT, 1.0), selector=".logo-mark")
+LOGO_NAME = TextStyle(32, 700, (TEXT, 0.5), letter_spacing=4, selector=".logo-name")
+
+
+def token_rgb(var: str) -> tuple:
+    """(r, g, b) of a colour token's current value."""
+    table = design_tokens.load_table()
+    rgb = table.by_var[var].rgb or design_tokens.hex_to_rgb(table.value(var))
+    return tuple(int(c) for c in rgb.split())
+
+
+def rgb(colour) -> tuple:
+    return token_rgb(colour) if isinstance(colour, str) else colour
+
+
+def rgba(colour) -> tuple:
+    """(r, g, b, a) from (r, g, b, a) or (token, a)."""
+    return (*token_rgb(colour[0]), colour[1]) if isinstance(colour[0], str) else colour
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# FONTS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def resolve_emoji_font():
+    """The bundled emoji font when bundled fonts are on, else fontconfig's."""
+    return font_assets.emoji_file() or system_emoji_font()
+
+
+@functools.lru_cache(maxsize=None)
+def system_emoji_font():
+    try:
+        result = subprocess.run(["fc-match", "-f", "%{file}", "emoji:color=true"],
+                                capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        return None
+    return result.stdout.strip() or None
+
+
+def text_font(weight: int, px: int, selector: str = None):
+    """The font Chromium renders `selector` with (bundled face or system
+    stack), at a weight and pixel size."""
+    path = text_fit.resolve_font(weight, selector)
+    if path is None:
+        print("ERROR: no system font found (fc-match unavailable).")
+        sys.exit(1)
+    return _load_font(path, weight, px)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_font(path: str, weight: int, px: int):
+    font = ImageFont.truetype(path, size=px)
+    try:
+        axes = font.get_variation_axes()
+    except OSError:
+        return font                                  # not a variable font
+    font.set_variation_by_axes([
+        weight if axis.get("name") in (b"Weight", "Weight") else axis["default"]
+        for axis in axes
+    ])
+    return font
+
+
+def emoji_font():
+    return _emoji_font(resolve_emoji_font())
+
+
+@functools.lru_cache(maxsize=None)
+def _emoji_font(path: str):
+    return ImageFont.truetype(path, size=EMOJI_STRIKE) if path else None
+
+
+def is_emoji(ch: str, weight: int, selector: str = None) -> bool:
+    """Characters the text font cannot draw fall back to the emoji font."""
+    if ch.isspace():
+        return False
+    advances = text_fit.metrics_for(weight, selector).advances
+    return unicodedata.category(ch) == "So" or (bool(advances) and ord(ch) not in advances)
+
+
+def runs(text: str, weight: int, selector: str = None) -> list:
+    """Split a line into (is_emoji, chunk) runs."""
+    out = []
+    for ch in text:
+        if ch in "\ufe0e\ufe0f":          # variation selectors
+            continue
+        flag = is_emoji(ch, weight, selector) and emoji_font() is not None
+        if out and out[-1][0] == flag:
+            out[-1][1] += ch
+        else:
+            out.append([flag, ch])
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PRIMITIVES
+# ═══════════════════════════════════════════════════════════════════════════
+
+def interp_stops(t, stops):
+    """Sample colour stops [(pos, (r, g, b)), ...] at positions t."""
+    positions = [p for p, _ in stops]
+    return np.stack([
+        np.interp(t, positions, [c[i] for _, c in stops]) for i in range(3)
+    ], axis=-1).astype(np.float32)
+
+
+def linear_gradient(width, height, angle, stops):
+    """CSS linear-gradient(<angle>deg, …) over a width × height box."""
+    a = math.radians(angle)
+    dx, dy = math.sin(a), -math.cos(a)
+    length = abs(width * dx) + abs(height * dy)
+    xs = np.arange(width, dtype=np.float32) + 0.5 - width / 2
+    ys = np.arange(height, dtype=np.float32) + 0.5 - height / 2
+    t = (xs[None, :] * dx + ys[:, None] * dy) / length + 0.5
+    return interp_stops(t, stops)
+
+
+def blend(region, rgb, alpha):
+    """Source-over blend a flat colour with a per-pixel alpha, in place."""
+    region += (np.asarray(rgb, dtype=np.float32) - region) * alpha[..., None]
+
+
+def radial_glow(canvas, rgb, cx, cy, box_w, box_h, stops):
+    """radial-gradient(circle, …) inside a border-radius: 50% box.
+
+    `stops` are (position, alpha); the colour stays constant, which is what
+    fading to `transparent` looks like with premultiplied interpolation.
+    """
+    height, width = canvas.shape[:2]
+    x0, x1 = max(0, int(cx - box_w / 2)), min(width, math.ceil(cx + box_w / 2))
+    y0, y1 = max(0, int(cy - box_h / 2)), min(height, math.ceil(cy + box_h / 2))
+    if x0 >= x1 or y0 >= y1:
+        return
+    xs = np.arange(x0, x1, dtype=np.float32) + 0.5 - cx
+    ys = np.arange(y0, y1, dtype=np.float32) + 0.5 - cy
+    radius = math.hypot(box_w / 2, box_h / 2)         # farthest-corner
+    dist = np.hypot(xs[None, :], ys[:, None])
+    alpha = np.interp(dist / radius, [p for p, _ in stops], [a for _, a in stops])
+    inside = (xs[None, :] / (box_w / 2)) ** 2 + (ys[:, None] / (box_h / 2)) ** 2 <= 1
+    blend(canvas[y0:y1, x0:x1], rgb, (alpha * inside).astype(np.float32))
+
+
+def composite(canvas, layer, x, y, opacity=1.0):
+    """Source-over an RGBA PIL layer onto the float canvas at (x, y)."""
+    x, y = round(x), round(y)
+    height, width = canvas.shape[:2]
+    lx0, ly0 = max(0, -x), max(0, -y)
+    cx0, cy0 = max(0, x), max(0, y)
+    cx1, cy1 = min(width, x + layer.width), min(height, y + layer.height)
+    if cx0 >= cx1 or cy0 >= cy1:
+        return
+    data = np.asarray(layer, dtype=np.float32)[ly0:ly0 + cy1 - cy0, lx0:lx0 + cx1 - cx0]
+    alpha = data[..., 3] * (opacity / 255)
+    region = canvas[cy0:cy1, cx0:cx1]
+    region += (data[..., :3] - region) * alpha[..., None]
+
+
+def shadow_layer(layer, blur, colour, scale):
+    """A layer's alpha, blurred and tinted (text-shadow / drop-shadow)."""
+    r, g, b, a = rgba(colour)
+    pad = math.ceil(blur * scale * 1.5)
+    mask = Image.new("L", (layer.width + 2 * pad, layer.height + 2 * pad), 0)
+    mask.paste(layer.getchannel("A"), (pad, pad))
+    # CSS blur radius is twice the Gaussian standard deviation
+    mask = mask.filter(ImageFilter.GaussianBlur(blur * scale / 2))
+    tinted = Image.new("RGBA", mask.size, (r, g, b, 0))
+    tinted.putalpha(mask.point(lambda v: round(v * a)))
+    return tinted, pad
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TEXT
+# ═══════════════════════════════════════════════════════════════════════════
+
+@functools.lru_cache(maxsize=None)
+def _emoji_glyph(ch: str, px: float):
+    font = emoji_font()
+    ascent, descent = font.getmetrics()
+    advance = font.getlength(ch)
+    glyph = Image.new("RGBA", (math.ceil(advance), ascent + descent), (0, 0, 0, 0))
+    ImageDraw.Draw(glyph).text((0, ascent), ch, font=font, anchor="ls", embedded_color=True)
+    factor = px / EMOJI_STRIKE
+    size = (max(1, round(glyph.width * factor)), max(1, round(glyph.height * factor)))
+    return glyph.resize(size, Image.LANCZOS), advance * factor, ascent * factor, descent * factor
+
+
+def line_metrics(text: str, style: TextStyle, scale: float):
+    """(ascent, descent) in device px for the fonts a line actually uses."""
+    px = round(style.size * scale)
+    ascent, descent = text_font(style.weight, px, style.selector).getmetrics()
+    if any(flag for flag, _ in runs(text, style.weight, style.selector)):
+        e_ascent, e_descent = emoji_font().getmetrics()
+        factor = px / EMOJI_STRIKE
+        ascent, descent = max(ascent, e_ascent * factor), max(descent, e_descent * factor)
+    return ascent, descent
+
+
+def line_height(text: str, style: TextStyle, scale: float) -> float:
+    if style.line_height is not None:
+        return style.size * style.line_height * scale
+    ascent, descent = line_metrics(text, style, scale)
+    return ascent + descent
+
+
+def text_width(text: str, style: TextStyle, scale: float) -> float:
+    px = round(style.size * scale)
+    font = text_font(style.weight, px, style.selector)
+    spacing = style.letter_spacing * scale
+    width = 0.0
+    for flag, chunk in runs(text, style.weight, style.selector):
+        for ch in chunk:
+            width += (_emoji_glyph(ch, px)[1] if flag else font.getlength(ch)) + spacing
+    return width
+
+
+def draw_line(text: str, style: TextStyle, scale: float):
+    """Rasterize one line into an RGBA layer sized to its CSS line box."""
+    px = round(style.size * scale)
+    font = text_font(style.weight, px, style.selector)
+    spacing = style.letter_spacing * scale
+    box_h = line_height(text, style, scale)
+    ascent, descent = line_metrics(text, style, scale)
+    baseline = (box_h - (ascent + descent)) / 2 + ascent
+
+    width = math.ceil(text_width(text, style, scale)) + 2
+    layer = Image.new("RGBA", (width, math.ceil(box_h)), (0, 0, 0, 0))
+    glyphs = Image.new("L", layer.size, 0)
+    draw = ImageDraw.Draw(glyphs)
+    x = 0.0
+    for flag, chunk in runs(text, style.weight, style.selector):
+        for ch in chunk:
+            if flag:
+                glyph, advance, e_ascent, _ = _emoji_glyph(ch, px)
+                layer.alpha_composite(glyph, (round(x), max(0, round(baseline - e_ascent))))
+            else:
+                draw.text((x, baseline), ch, font=font, fill=255, anchor="ls")
+                advance = font.getlength(ch)
+            x += advance + spacing
+
+    r, g, b, a = rgba(style.color)
+    ink = Image.new("RGBA", layer.size, (r, g, b, 0))
+    ink.putalpha(glyphs.point(lambda v: round(v * a)))
+    layer.alpha_composite(ink)
+    return layer
+
+
+def place_line(canvas, text: str, style: TextStyle, scale: float, top: float):
+    """Draw a horizontally centred line (with its shadow) at a CSS top."""
+    layer = draw_line(text, style, scale)
+    x = (canvas.shape[1] - text_width(text, style, scale)) / 2
+    y = top * scale
+    if style.shadow:
+        dx, dy, blur, colour = style.shadow
+        shadow, pad = shadow_layer(layer, blur, colour, scale)
+        composite(canvas, shadow, x + dx * scale - pad, y + dy * scale - pad)
+    composite(canvas, layer, x, y)
+
+
+def wrap_lines(markup: str, style: TextStyle, max_width: float) -> list:
+    """Forced lines of a content string, greedily wrapped like the browser."""
+    metrics = text_fit.metrics_for(style.weight, style.selector)
+    ls_em = style.letter_spacing / style.size
+    lines = []
+    for line in text_fit.plain_lines(markup):
+        lines.extend(text_fit.wrap(metrics, line.split(), style.size, max_width, ls_em))
+    return lines
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# FRAMES
+# ═══════════════════════════════════════════════════════════════════════════
+
+def background(width: int, height: int, scale: float):
+    """body gradient plus .bg-glow / .bg-glow-bottom, in device pixels."""
+    canvas = linear_gradient(width, height, BG_ANGLE, [(p, rgb(c)) for p, c in BG_STOPS])
+    # .bg-glow: 1000×1000 at top -300, centred
+    radial_glow(canvas, token_rgb("vant-primary"), width / 2, 200 * scale, 1000 * scale, 1000 * scale,
+                [(0.0, 0.5), (0.4, 0.2), (0.7, 0.0)])
+    # .bg-glow-bottom: 1200×800 at bottom -400, centred
+    radial_glow(canvas, token_rgb("vant-secondary"), width / 2, height, 1200 * scale, 800 * scale,
+                [(0.0, 0.08), (0.6, 0.0)])
+    return canvas
+
+
+def logo_mark(scale: float):
+    """80×80 rounded square with its gradient; returns (layer, shadow, pad)."""
+    size = round(80 * scale)
+    ss = 4                                           # supersample the corners
+    mask = Image.new("L", (size * ss, size * ss), 0)
+    ImageDraw.Draw(mask).rounded_rectangle((0, 0, size * ss - 1, size * ss - 1),
+                                           radius=20 * scale * ss, fill=255)
+    mask = mask.resize((size, size), Image.LANCZOS)
+    fill = linear_gradient(size, size, 135, [(0.0, token_rgb("vant-primary")),
+                                             (1.0, token_rgb("vant-primary-light"))])
+    mark = Image.fromarray(np.round(fill).astype(np.uint8), "RGB").convert("RGBA")
+    mark.putalpha(mask)
+    shadow, pad = shadow_layer(mark, 30, ("vant-primary", 0.4), scale)
+    return mark, shadow, pad
+
+
+def render_hook(content: dict, device: str = DEVICE, sizes: dict = None) -> bytes:
+    """FRAME_1_HOOK: .hook-wrap (flex column, centred) and .logo-section."""
+    viewport, scale = device_profile(device)
+    vh = viewport["height"]
+    width, height = DEVICES[device]
+    sizes = sizes or {}
+    line_style = HOOK_LINE
+    if ".hook-line" in sizes:
+        line_style = replace(HOOK_LINE, size=sizes[".hook-line"])
+    tagline_style = HOOK_TAGLINE
+    if ".hook-tagline" in sizes:
+        tagline_style = replace(HOOK_TAGLINE, size=sizes[".hook-tagline"])
+
+    canvas = background(width, height, scale)
+
+    # Block stack in CSS px: (text, style, margin_top, margin_bottom)
+    emoji = text_fit.plain_lines(content["emoji"])[0]
+    stack = [(emoji, HOOK_EMOJI, 0, 40)]
+    for line in wrap_lines(content["line_1"], line_style, W):
+        stack.append((line, line_style, 0, 0))
+    stack.append(("=", HOOK_EQUALS, 20, 20))
+    for line in wrap_lines(content["line_2"], line_style, W):
+        stack.append((line, line_style, 0, 0))
+    for i, line in enumerate(wrap_lines(content["tagline"], tagline_style, W)):
+        stack.append((line, tagline_style, 50 if i == 0 else 0, 0))
+
+    heights = [line_height(text, style, scale) / scale for text, style, _, _ in stack]
+    total = sum(h + top + bottom for h, (_, _, top, bottom) in zip(heights, stack))
+    y = (vh - total) / 2
+    for h, (text, style, top, bottom) in zip(heights, stack):
+        y += top
+        place_line(canvas, text, style, scale, y)
+        y += h + bottom
+
+    # .logo-section: bottom 120px, mark + 12px gap + name
+    name_h = line_height("vantag", LOGO_NAME, scale) / scale
+    section_top = vh - 120 - (80 + 12 + name_h)
+    mark, shadow, pad = logo_mark(scale)
+    mark_x = (width - mark.width) / 2
+    composite(canvas, shadow, mark_x - pad, (section_top + 8) * scale - pad)
+    composite(canvas, mark, mark_x, section_top * scale)
+    letter_h = line_height("V", LOGO_LETTER, scale) / scale
+    place_line(canvas, "V", LOGO_LETTER, scale, section_top + (80 - letter_h) / 2)
+    place_line(canvas, "vantag", LOGO_NAME, scale, section_top + 80 + 12)
+
+    image = Image.fromarray(np.clip(np.round(canvas), 0, 255).astype(np.uint8), "RGB")
+    buf = io.BytesIO()
+    image.save(buf, format="PNG", compress_level=3)
+    return tag_srgb(buf.getvalue())
+
+
+# Frames that can skip the browser, by FrameSpec name.
+NATIVE_RENDERERS = {
+    "appstore_1_hook": render_hook,
+}
+
+
+def supports(spec) -> bool:
+    return spec.name in NATIVE_RENDERERS
+
+
+def render_native(spec, locale: str = LOCALE, device: str = DEVICE,
+                  overrides: dict = None, sizes: dict = None) -> bytes:
+    """PNG bytes for a frame drawn without a browser.
+
+    `sizes` optionally maps selector → font size (px), as text_fit shrinks.
+    """
+    content = frame_content(spec, overrides, locale)
+    return NATIVE_RENDERERS[spec.name](content, device, sizes)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# DIFF CHECK
+# ═══════════════════════════════════════════════════════════════════════════
+
+def compare(native_png: bytes, browser_png: bytes, diff_path: str = None) -> dict:
+    """Pixel difference between a native and a browser render."""
+    a = np.asarray(Image.open(io.BytesIO(native_png)).convert("RGB"), dtype=np.int16)
+    b = np.asarray(Image.open(io.BytesIO(browser_png)).convert("RGB"), dtype=np.int16)
+    if a.shape != b.shape:
+        return {"ok": False, "error": f"size {a.shape[1]}×{a.shape[0]} vs {b.shape[1]}×{b.shape[0]}"}
+    diff = np.abs(a - b).max(axis=-1)
+    mean = float(diff.mean())
+    fraction = float((diff > DIFF_THRESHOLD).mean())
+    if diff_path:
+        os.makedirs(os.path.dirname(diff_path), exist_ok=True)
+        Image.fromarray(np.clip(diff * 4, 0, 255).astype(np.uint8), "L").save(diff_path)
+    return {
+        "ok": mean <= MAX_MEAN_DIFF and fraction <= MAX_DIFF_FRACTION,
+        "mean_diff": round(mean, 3),
+        "max_diff": int(diff.max()),
+        "diff_fraction": round(fraction, 5),
+    }
+
+
+async def check_cells(cells, args) -> list:
+    """Render each cell in Chromium and compare with the native render."""
+    from browser_pool import BrowserPool
+    from generate_screenshots import load_backend, render_png
+
+    async_playwright = load_backend(args)
+    results = []
+
+    async def check(spec, locale, device, native_png):
+        attrs = {"frame": spec.name, "locale": locale, "device": device}
+        started = time.perf_counter()
+        browser_png = await render_png(pool, frame_html(spec, locale=locale), attrs, device)
+        browser_ms = (time.perf_counter() - started) * 1000
+        diff_path = os.path.join(DIFF_DIR, f"{spec.name}-{locale}-{device}.png")
+        result = await asyncio.to_thread(compare, native_png, browser_png, diff_path)
+        results.append({**attrs, **result, "browser_ms": round(browser_ms)})
+
+    async with async_playwright() as p:
+        async with BrowserPool(p, **pool_options(args)) as pool:
+            await asyncio.gather(*(check(*cell) for cell in cells))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render simple frames without a browser.")
+    parser.add_argument("--locale", nargs="*", help="locales (default: all)")
+    parser.add_argument("--device", nargs="*", choices=sorted(DEVICES), help="devices (default: all)")
+    parser.add_argument("--check", action="store_true",
+                        help="diff against Chromium renders; exit non-zero past tolerance")
+    parser.add_argument("--dry-run", action="store_true", help="render without writing PNGs")
+    add_pool_arguments(parser)
+    args = parser.parse_args()
+    asyncio.run(enable_page_features(args))
+
+    specs = [frames.load(name) for name in frames.select(list(NATIVE_RENDERERS))]
+    locales = args.locale or available_locales()
+    devices = args.device or list(DEVICES)
+    print("Vantag Native Compositor")
+    print(f"{'=' * 52}")
+
+    cells, timings = [], []
+    for spec in specs:
+        for locale in locales:
+            for device in devices:
+                started = time.perf_counter()
+                png = render_native(spec, locale, device)
+                timings.append((time.perf_counter() - started) * 1000)
+                cells.append((spec, locale, device, png))
+                if not args.dry_run:
+                    path = output_path(spec.name, locale, device)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "wb") as f:
+                        f.write(png)
+                print(f"  {spec.name:<18} {locale:<4} {device:<11} {timings[-1]:6.0f} ms")
+    if timings:
+        print(f"  {len(timings)} variants, {sum(timings) / len(timings):.0f} ms each on average")
+
+    if args.check:
+        results = asyncio.run(check_cells(cells, args))
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(CHECK_REPORT, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print()
+        for r in sorted(results, key=lambda r: (r["frame"], r["locale"], r["device"])):
+            mark = "✓" if r["ok"] else "✗"
+            detail = r.get("error") or (f"mean {r['mean_diff']:.2f}, "
+                                        f"{r['diff_fraction'] * 100:.2f}% px > {DIFF_THRESHOLD}")
+            print(f"  {mark} {r['frame']} {r['locale']}/{r['device']}: {detail} "
+                  f"(browser {r['browser_ms']} ms)")
+        print(f"Report → {CHECK_REPORT}, diff maps → {DIFF_DIR}/")
+        if not all(r["ok"] for r in results):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Store upload bundle packager.
+
+Builds the App Store Connect and Play Console screenshot layouts (by store
+locale and device slot) straight from the renderer's outputs — on disk or
+in memory — and streams them into a ZIP without staging copies. SHA-256
+checksums are computed while the data streams through; content hashes of
+on-disk files are cached by (size, mtime), so identical images across
+slots are detected up front, read once and written from that one buffer.
+The directory layout clones renders copy-on-write where the filesystem
+supports it (a plain copy elsewhere) — never hard links, which would let
+the next render rewrite files inside a packaged bundle — and hard-links
+duplicates within the bundle to their first copy.
+
+Layout:
+    appstore/<locale>/<slot>/<nn>_<frame>.png
+    play/<locale>/images/phoneScreenshots/<nn>_<frame>.png
+    manifest.json, checksums.sha256
+
+Usage:
+    python3 scripts/package_bundle.py                         # zip everything
+    python3 scripts/package_bundle.py --store play --dir out/play_bundle
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from generate_screenshots import (
+    BASE_DIR, CACHE_DIR, FRAMES, available_locales, output_path,
+)
+
+CHUNK = 1 << 20
+DIGEST_CACHE = os.path.join(CACHE_DIR, "digests.json")
+DEFAULT_ZIP = os.path.join(BASE_DIR, "build", "store_screenshots.zip")
+FICLONE = 0x40049409        # linux/fs.h: reflink one file onto another
+
+# Fixed timestamp keeps the ZIP byte-identical for identical inputs.
+ZIP_DATE = (2026, 1, 1, 0, 0, 0)
+
+STORE_LOCALES = {
+    "appstore": {"tr": "tr", "en": "en-US", "de": "de-DE"},
+    "play": {"tr": "tr-TR", "en": "en-US", "de": "de-DE"},
+}
+STORE_SLOTS = {
+    "appstore": {
+        "iphone_6_9": "iphone_6_9",
+        "iphone_6_5": "iphone_6_5",
+        "ipad_13": "ipad_13",
+    },
+    "play": {
+        "play_phone": "images/phoneScreenshots",
+    },
+}
+
+
+class Entry:
+    """One file in the bundle: archive path plus a path or bytes source."""
+
+    __slots__ = ("arcname", "path", "data", "digest", "size")
+
+    def __init__(self, arcname, path=None, data=None):
+        self.arcname = arcname
+        self.path = path
+        self.data = data
+        self.digest = None
+        self.size = len(data) if data is not None else os.path.getsize(path)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PLANNING
+# ═══════════════════════════════════════════════════════════════════════════
+
+def plan_entries(stores, locales, rendered=None) -> list:
+    """Bundle entries for every rendered (store, locale, slot, frame).
+
+    `rendered` optionally maps (frame, locale, device) → PNG bytes for
+    outputs still in memory; anything else is read from output_path().
+    """
+    rendered = rendered or {}
+    entries = []
+    for store in stores:
+        for locale in locales:
+            store_locale = STORE_LOCALES[store].get(locale, locale)
+            for device, slot_dir in STORE_SLOTS[store].items():
+                for index, spec in enumerate(FRAMES, 1):
+                    arcname = f"{store}/{store_locale}/{slot_dir}/{index:02d}_{spec.name}.png"
+                    key = (spec.name, locale, device)
+                    if key in rendered:
+                        entries.append(Entry(arcname, data=rendered[key]))
+                        continue
+                    path = output_path(spec.name, locale, device)
+                    if os.path.exists(path):
+                        entries.append(Entry(arcname, path=path))
+    return entries
+
+
+def _load_digest_cache() -> dict:
+    try:
+        with open(DIGEST_CACHE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _hash_file(path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def assign_digests(entries):
+    """Fill entry.digest, reusing cached hashes of unchanged files."""
+    cache = _load_digest_cache()
+    todo = []
+    for e in entries:
+        if e.data is not None:
+            e.digest = hashlib.sha256(e.data).hexdigest()
+            continue
+        st = os.stat(e.path)
+        key = f"{os.path.abspath(e.path)}|{st.st_size}|{st.st_mtime_ns}"
+        e.digest = cache.get(key)
+        if e.digest is None:
+            todo.append((e, key))
+
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+        for (e, key), digest in zip(todo, pool.map(lambda t: _hash_file(t[0].path), todo)):
+            e.digest = cache[key] = digest
+
+    if todo:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(DIGEST_CACHE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# OUTPUTS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _zip_info(arcname) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE)
+    # PNG/JPEG are already compressed; deflating them again only burns CPU.
+    info.compress_type = zipfile.ZIP_STORED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def write_zip(entries, zip_path) -> list:
+    """Stream entries into a ZIP, checksumming on the fly."""
+    remaining = Counter(e.digest for e in entries)
+    shared = {}     # digest → bytes, kept only while duplicates remain
+    records = []
+    first = {}
+
+    os.makedirs(os.path.dirname(os.path.abspath(zip_path)), exist_ok=True)
+    with zipfile.ZipFile(zip_path, "w", allowZip64=True) as zf:
+        for e in entries:
+            remaining[e.digest] -= 1
+            data = e.data if e.data is not None else shared.get(e.digest)
+            if data is not None:
+                zf.writestr(_zip_info(e.arcname), data)
+            else:
+                h = hashlib.sha256()
+                keep = [] if remaining[e.digest] > 0 else None
+                with open(e.path, "rb") as src, zf.open(_zip_info(e.arcname), "w") as out:
+                    for chunk in iter(lambda: src.read(CHUNK), b""):
+                        h.update(chunk)
+                        out.write(chunk)
+                        if keep is not None:
+                            keep.append(chunk)
+                if h.hexdigest() != e.digest:
+                    raise RuntimeError(f"{e.path} changed while packaging")
+                if keep is not None:
+                    shared[e.digest] = b"".join(keep)
+            if remaining[e.digest] == 0:
+                shared.pop(e.digest, None)
+
+            records.append({
+                "path": e.arcname,
+                "sha256": e.digest,
+                "bytes": e.size,
+                "duplicate_of": first.get(e.digest),
+            })
+            first.setdefault(e.digest, e.arcname)
+
+        manifest = json.dumps({"files": records}, ensure_ascii=False, indent=2).encode("utf-8")
+        zf.writestr(_zip_info("manifest.json"), manifest)
+        zf.writestr(_zip_info("checksums.sha256"), _checksums(records))
+    return records
+
+
+def _clone_file(source, dest):
+    """Copy-on-write clone where the filesystem supports it, else a copy."""
+    try:
+        import fcntl
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return
+    except (ImportError, OSError):
+        pass
+    shutil.copyfile(source, dest)
+
+
+def write_directory(entries, out_dir) -> list:
+    """Materialize the layout: renders are cloned (the bundle must not share
+    inodes with outputs the renderer rewrites), duplicates hard-linked to
+    their first copy in the bundle."""
+    first, records = {}, []
+    for e in entries:
+        dest = os.path.join(out_dir, e.arcname)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if os.path.lexists(dest):
+            os.remove(dest)
+        if e.digest in first:
+            try:
+                os.link(first[e.digest], dest)
+            except OSError:
+                shutil.copyfile(first[e.digest], dest)
+        elif e.path is None:
+            with open(dest, "wb") as f:
+                f.write(e.data)
+        else:
+            _clone_file(e.path, dest)
+        duplicate = e.digest in first
+        first.setdefault(e.digest, dest)
+        records.append({"path": e.arcname, "sha256": e.digest, "bytes": e.size,
+                        "duplicate_of": os.path.relpath(first[e.digest], out_dir)
+                        if duplicate else None})
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump({"files": records}, f, ensure_ascii=False, indent=2)
+    with open(os.path.join(out_dir, "checksums.sha256"), "wb") as f:
+        f.write(_checksums(records))
+    return records
+
+
+def _checksums(records) -> bytes:
+    return "".join(f"{r['sha256']}  {r['path']}\n" for r in records).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Package rendered screenshots for store upload.")
+    parser.add_argument("--store", nargs="*", choices=sorted(STORE_SLOTS),
+                        default=sorted(STORE_SLOTS))
+    parser.add_argument("--locale", nargs="*", help="locales (default: all)")
+    parser.add_argument("--zip", default=DEFAULT_ZIP, help="ZIP output path")
+    parser.add_argument("--dir", help="also/instead write a hard-linked directory layout")
+    parser.add_argument("--no-zip", action="store_true")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    entries = plan_entries(args.store, args.locale or available_locales())
+    if not entries:
+        raise SystemExit("ERROR: no rendered screenshots found; run generate_screenshots.py first")
+    assign_digests(entries)
+    unique = len({e.digest for e in entries})
+    total = sum(e.size for e in entries)
+    print(f"  {len(entries)} files, {unique} unique, {total / (1024 * 1024):.1f} MB")
+
+    if args.dir:
+        write_directory(entries, args.dir)
+        print(f"  Directory → {args.dir}")
+    if not args.no_zip:
+        write_zip(entries, args.zip)
+        print(f"  ZIP       → {args.zip}")
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Span tracing for the screenshot pipeline in Chrome trace / Perfetto format.
+
+Spans are recorded as complete ("X") events with frame, locale and device
+attributes and written to a JSON file that opens directly in
+chrome://tracing or https://ui.perfetto.dev. Concurrent asyncio tasks get
+their own track so overlapping renders stay readable.
+
+Tracing is off unless enabled with --trace PATH or VANTAG_TRACE=PATH.
+While disabled, `tracer` is a null object whose span() returns one shared
+no-op context manager, so instrumented code pays only a method call.
+
+Usage:
+    import render_trace
+
+    render_trace.enable("trace.json")      # or set VANTAG_TRACE
+    with render_trace.tracer.span("screenshot", frame=name, locale="tr"):
+        ...
+    render_trace.tracer.save()
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import threading
+import time
+
+
+class _NullSpan:
+    """Shared no-op span used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    enabled = False
+
+    def span(self, name, **args):
+        return _NULL_SPAN
+
+    def instant(self, name, **args):
+        pass
+
+    def save(self):
+        pass
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._complete(self.name, self.start, end, self.args)
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *exc):
+        return self.__exit__(*exc)
+
+    def set(self, **args):
+        """Attach attributes discovered while the span is open."""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects spans in memory and writes them as Chrome trace JSON."""
+
+    enabled = True
+
+    def __init__(self, path: str, process_name: str = "vantag-screenshots"):
+        self.path = path
+        self.pid = os.getpid()
+        self._origin = time.perf_counter_ns()
+        self._events = [{
+            "ph": "M", "name": "process_name", "pid": self.pid, "tid": 0,
+            "args": {"name": process_name},
+        }]
+        self._tracks = {}
+        self._lock = threading.Lock()
+
+    def span(self, name, **args):
+        return _Span(self, name, args)
+
+    def instant(self, name, **args):
+        ts = (time.perf_counter_ns() - self._origin) / 1000
+        self._append({"ph": "i", "s": "t", "name": name, "ts": ts, "args": args})
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            events = list(self._events)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def _track(self):
+        """Small stable track id per asyncio task (or thread)."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = id(task) if task is not None else threading.get_ident()
+        tid = self._tracks.get(key)
+        if tid is None:
+            tid = len(self._tracks) + 1
+            self._tracks[key] = tid
+            label = task.get_name() if task is not None else threading.current_thread().name
+            self._events.append({
+                "ph": "M", "name": "thread_name", "pid": self.pid, "tid": tid,
+                "args": {"name": label},
+            })
+        return tid
+
+    def _complete(self, name, start, end, args):
+        self._append({
+            "ph": "X", "name": name,
+            "ts": (start - self._origin) / 1000,
+            "dur": (end - start) / 1000,
+            "args": args,
+        })
+
+    def _append(self, event):
+        with self._lock:
+            event["pid"] = self.pid
+            event["tid"] = self._track()
+            self._events.append(event)
+
+
+tracer = NullTracer()
+
+
+def enable(path: str, process_name: str = "vantag-screenshots"):
+    """Switch the module-level tracer on; the trace is saved at exit."""
+    global tracer
+    if not tracer.enabled:
+        tracer = Tracer(path, process_name)
+        atexit.register(tracer.save)
+    return tracer
+
+
+def enable_from_env(process_name: str = "vantag-screenshots"):
+    """Enable tracing if VANTAG_TRACE names an output file."""
+    path = os.environ.get("VANTAG_TRACE")
+    if path:
+        enable(path, process_name)
+    return tracer
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Review board: paginated contact sheets plus a static HTML index.
+
+Every render and raw capture under docs/screenshots/ (frames/, previews/
+and the board itself excluded) becomes a labelled thumbnail on a fixed
+COLS × ROWS sheet, one run of sheets per locale/device group. index.html
+links each sheet and the full-size files behind its cells.
+
+Thumbnails are decoded at reduced resolution where the format allows it:
+JPEG is opened in draft mode, so libjpeg scales by 1/2–1/8 in the DCT
+domain and never produces the full 1320 × 2868 image. PNG has no such
+path (every row has to be inflated and unfiltered), so a PNG is reduced
+with an integer box filter right after decoding and is then never
+decoded again: thumbnails are cached by content hash, STATE_VERSION and
+thumbnail size, and files whose size and mtime have not changed are not
+even read. Thumbnails no longer referenced by the state are deleted.
+
+Builds are incremental. Decoding runs in a process pool and only covers
+new or changed files. Sheets keep a lossless master in the cache. When a
+sheet's cell list changes, only the cells that differ are repainted on
+that master, and sheets with no changed cells are left untouched.
+
+Usage:
+    python3 scripts/review_board.py                      # update the board
+    python3 scripts/review_board.py --per-page 12 --workers 4
+    python3 scripts/review_board.py --rebuild            # ignore cached state
+
+Output: docs/screenshots/review/index.html, <group>_<page>.jpg
+Cache:  .screenshot_cache/review_board/
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from generate_screenshots import CACHE_DIR, DEVICE, LOCALE, OUT_DIR
+
+REVIEW_DIR = os.path.join(OUT_DIR, "review")
+STATE_DIR = os.path.join(CACHE_DIR, "review_board")
+THUMBS_DIR = os.path.join(STATE_DIR, "thumbs")
+SHEETS_DIR = os.path.join(STATE_DIR, "sheets")
+STATE_PATH = os.path.join(STATE_DIR, "state.json")
+
+THUMB_W, THUMB_H = 240, 520
+LABEL_H = 28
+GAP = 16
+COLS, ROWS = 6, 4
+BACKGROUND = (24, 24, 28)
+LABEL_COLOR = (200, 200, 210)
+SHEET_QUALITY = 85
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+SKIP_DIRS = ("frames", "previews", "review")
+# Bump when thumbnail or sheet rendering changes.
+STATE_VERSION = 1
+
+
+def load_pillow():
+    try:
+        from PIL import Image
+    except ImportError:
+        print("ERROR: Pillow is required to build contact sheets.")
+        print("  pip install pillow --break-system-packages")
+        sys.exit(1)
+    return Image
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SCAN + THUMBNAILS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def scan(root: str = OUT_DIR) -> list:
+    """(relative path, size, mtime_ns) of every reviewable image."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if dirpath == root:
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(IMAGE_EXTS):
+                path = os.path.join(dirpath, name)
+                st = os.stat(path)
+                found.append((os.path.relpath(path, root), st.st_size, st.st_mtime_ns))
+    return found
+
+
+def group_of(rel: str) -> str:
+    """Sheet group: the <locale>/<device> directory, the base cell for
+    top-level renders, or "raw" for simulator captures."""
+    directory = os.path.dirname(rel)
+    if directory:
+        return directory.replace(os.sep, "/")
+    return "raw" if os.path.basename(rel).startswith("raw_") else f"{LOCALE}/{DEVICE}"
+
+
+def thumb_path(digest: str) -> str:
+    return os.path.join(THUMBS_DIR, f"{digest}-v{STATE_VERSION}-{THUMB_W}x{THUMB_H}.png")
+
+
+def make_thumbnail(job: tuple) -> dict:
+    """Worker: hash one file and, unless its thumbnail is cached, decode it
+    at reduced resolution into one."""
+    path, rel, size, mtime_ns = job
+    Image = load_pillow()
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()[:20]
+    entry = {"rel": rel, "size": size, "mtime_ns": mtime_ns, "digest": digest, "decoded": None}
+    dest = thumb_path(digest)
+    with Image.open(path) as im:
+        entry["width"], entry["height"] = im.size
+        if os.path.exists(dest):
+            return entry
+        # JPEG: DCT-domain downscale to the smallest size ≥ the thumbnail.
+        im.draft("RGB", (THUMB_W, THUMB_H))
+        entry["decoded"] = list(im.size)
+        image = im.convert("RGB")
+    factor = min(image.width // THUMB_W, image.height // THUMB_H)
+    if factor > 1:
+        image = image.reduce(factor)
+    image.thumbnail((THUMB_W, THUMB_H), Image.LANCZOS)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    image.save(tmp, "PNG")
+    os.replace(tmp, dest)
+    return entry
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# STATE
+# ═══════════════════════════════════════════════════════════════════════════
+
+def load_state() -> dict:
+    try:
+        with open(STATE_PATH, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+    if state.get("version") != STATE_VERSION:
+        state = {"version": STATE_VERSION, "images": {}, "sheets": {}}
+    return state
+
+
+def save_state(state: dict):
+    tmp = STATE_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, STATE_PATH)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SHEETS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def sheet_size(per_page: int) -> tuple:
+    rows = -(-per_page // COLS)
+    return (GAP + COLS * (THUMB_W + GAP), GAP + rows * (THUMB_H + LABEL_H + GAP))
+
+
+def sheet_id(group: str, page: int) -> str:
+    return f"{re.sub(r'[^A-Za-z0-9@]+', '_', group).strip('_')}_{page:02d}"
+
+
+def paint_cell(Image, draw, sheet, index: int, cell):
+    """Clear cell `index` and draw (rel, digest) into it, or leave it
+    empty when `cell` is None."""
+    x = GAP + (index % COLS) * (THUMB_W + GAP)
+    y = GAP + (index // COLS) * (THUMB_H + LABEL_H + GAP)
+    draw.rectangle((x, y, x + THUMB_W - 1, y + THUMB_H + LABEL_H - 1), fill=BACKGROUND)
+    if cell is None:
+        return
+    rel, digest = cell
+    with Image.open(thumb_path(digest)) as thumb:
+        sheet.paste(thumb, (x + (THUMB_W - thumb.width) // 2, y + (THUMB_H - thumb.height) // 2))
+    label = os.path.basename(rel)
+    while len(label) > 4 and draw.textlength(label) > THUMB_W:
+        label = label[:-4] + "…"
+    draw.text((x + THUMB_W / 2, y + THUMB_H + LABEL_H / 2), label, fill=LABEL_COLOR, anchor="mm")
+
+
+def build_sheet(job: tuple) -> tuple:
+    """Bring one sheet up to date; returns (id, cells repainted)."""
+    sid, cells, previous, per_page = job
+    Image = load_pillow()
+    from PIL import ImageDraw
+
+    master = os.path.join(SHEETS_DIR, f"{sid}.png")
+    published = os.path.join(REVIEW_DIR, f"{sid}.jpg")
+    cells = cells + [None] * (per_page - len(cells))
+    if previous is not None and os.path.exists(master) and os.path.exists(published):
+        previous = [tuple(c) if c else None for c in previous]
+        previous += [None] * (per_page - len(previous))
+        dirty = [i for i in range(per_page) if cells[i] != previous[i]]
+        sheet = Image.open(master).convert("RGB")
+    else:
+        dirty = list(range(per_page))
+        sheet = Image.new("RGB", sheet_size(per_page), BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+    for i in dirty:
+        paint_cell(Image, draw, sheet, i, cells[i])
+    sheet.save(master, "PNG", compress_level=1)
+    sheet.save(published, "JPEG", quality=SHEET_QUALITY, optimize=True)
+    return sid, len(dirty)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════════════════
+
+INDEX_CSS = """
+body { background: #18181c; color: #ddd; font: 14px -apple-system, system-ui, sans-serif; margin: 24px; }
+h2 { margin-top: 40px; } h3 { color: #999; font-weight: 500; }
+img.sheet { max-width: 100%; border: 1px solid #333; }
+ol { columns: 3; color: #999; } a { color: #8ab4f8; text-decoration: none; }
+"""
+
+
+def write_index(pages: dict, images: dict) -> str:
+    parts = [f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Vantag review board"
+             f"</title><style>{INDEX_CSS}</style></head><body>",
+             f"<h1>Vantag review board</h1><p>{len(images)} images · {len(pages)} sheets</p>"]
+    current = None
+    for sid, (group, page, cells) in pages.items():
+        if group != current:
+            current = group
+            parts.append(f"<h2>{html.escape(group)}</h2>")
+        parts.append(f"<h3>Page {page + 1}</h3>"
+                     f"<a href=\"{sid}.jpg\"><img class=\"sheet\" src=\"{sid}.jpg\" loading=\"lazy\"></a><ol>")
+        for rel, _ in cells:
+            image = images[rel]
+            href = html.escape(os.path.relpath(os.path.join(OUT_DIR, rel), REVIEW_DIR)
+                               .replace(os.sep, "/"))
+            parts.append(f"<li><a href=\"{href}\">{html.escape(os.path.basename(rel))}</a> "
+                         f"{image['width']} × {image['height']} · {image['size'] / 1024:.0f} KB</li>")
+        parts.append("</ol>")
+    parts.append("</body></html>\n")
+    text = "\n".join(parts)
+    path = os.path.join(REVIEW_DIR, "index.html")
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return path
+    except OSError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BUILD
+# ═══════════════════════════════════════════════════════════════════════════
+
+def build(per_page: int, workers: int, rebuild: bool) -> dict:
+    load_pillow()
+    if rebuild:
+        shutil.rmtree(THUMBS_DIR, ignore_errors=True)
+    for directory in (REVIEW_DIR, THUMBS_DIR, SHEETS_DIR):
+        os.makedirs(directory, exist_ok=True)
+    state = {"version": STATE_VERSION, "images": {}, "sheets": {}} if rebuild else load_state()
+    if state.get("per_page") != per_page:
+        state["sheets"] = {}
+    state["per_page"] = per_page
+
+    started = time.perf_counter()
+    images, jobs = {}, []
+    for rel, size, mtime_ns in scan():
+        known = state["images"].get(rel)
+        if (known and known["size"] == size and known["mtime_ns"] == mtime_ns
+                and os.path.exists(thumb_path(known["digest"]))):
+            images[rel] = known
+        else:
+            jobs.append((os.path.join(OUT_DIR, rel), rel, size, mtime_ns))
+    decoded = []
+    if jobs:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            for entry in pool.map(make_thumbnail, jobs, chunksize=4):
+                size = entry.pop("decoded")
+                images[entry["rel"]] = entry
+                if size is not None:
+                    decoded.append((entry, size))
+    thumbs_s = time.perf_counter() - started
+
+    groups = {}
+    for rel in sorted(images, key=lambda r: (group_of(r), r)):
+        groups.setdefault(group_of(rel), []).append((rel, images[rel]["digest"]))
+    pages = {}
+    for group, cells in groups.items():
+        for page, start in enumerate(range(0, len(cells), per_page)):
+            pages[sheet_id(group, page)] = (group, page, cells[start:start + per_page])
+
+    started = time.perf_counter()
+    sheet_jobs = [(sid, cells, state["sheets"].get(sid), per_page)
+                  for sid, (_, _, cells) in pages.items()
+                  if [list(c) for c in cells] != state["sheets"].get(sid)
+                  or not os.path.exists(os.path.join(REVIEW_DIR, f"{sid}.jpg"))]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        repainted = dict(pool.map(build_sheet, sheet_jobs))
+    for sid in set(state["sheets"]) - set(pages):
+        for path in (os.path.join(SHEETS_DIR, f"{sid}.png"), os.path.join(REVIEW_DIR, f"{sid}.jpg")):
+            if os.path.exists(path):
+                os.remove(path)
+    sheets_s = time.perf_counter() - started
+
+    state["images"] = images
+    live = {os.path.basename(thumb_path(entry["digest"])) for entry in images.values()}
+    for name in os.listdir(THUMBS_DIR):
+        if name not in live:
+            os.remove(os.path.join(THUMBS_DIR, name))
+    state["sheets"] = {sid: [list(c) for c in cells] for sid, (_, _, cells) in pages.items()}
+    index = write_index(pages, images)
+    save_state(state)
+    return {"images": len(images), "decoded": decoded, "thumbs_s": thumbs_s,
+            "sheets": len(pages), "repainted": repainted, "sheets_s": sheets_s, "index": index}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build contact sheets and an HTML review index.")
+    parser.add_argument("--per-page", type=int, default=COLS * ROWS, help="thumbnails per sheet")
+    parser.add_argument("--workers", type=int, default=0, help="decode processes (default: all cores)")
+    parser.add_argument("--rebuild", action="store_true", help="ignore cached thumbnails and sheets")
+    args = parser.parse_args()
+
+    print("Vantag Review Board")
+    print(f"{'=' * 52}")
+    result = build(args.per_page, args.workers or os.cpu_count() or 1, args.rebuild)
+    decoded = result["decoded"]
+    reduced = sum(1 for e, size in decoded if size != [e["width"], e["height"]])
+    print(f"  Images : {result['images']} ({len(decoded)} decoded, "
+          f"{reduced} at reduced resolution; {result['images'] - len(decoded)} cached) "
+          f"in {result['thumbs_s']:.1f}s")
+    cells = sum(result["repainted"].values())
+    print(f"  Sheets : {result['sheets']} ({len(result['repainted'])} updated, {cells} cells "
+          f"repainted) in {result['sheets_s']:.1f}s")
+    print(f"  Index  → {os.path.relpath(result['index'], OUT_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Open Graph / social preview cards for the docs site.
+
+One 1200 × 630 card per site page: every docs/*.html page and every
+docs/<page>-<locale>.md page (privacy-en.md, terms-tr.md, …) whose locale
+the renderer knows. The title comes from the page itself: the <title> of
+an HTML page without the "Vantag - " prefix, or the first line of a
+markdown page. The subtitle is the page's meta description, or else the
+locale's hook tagline. Cards use html_page(), so they get the same
+background glows, design tokens, fonts and emoji handling as the App
+Store frames, with the Vantag mark on top.
+
+Cards are the "social" target of the build graph. Each card's key is the
+hash of its HTML, so they share the content-addressed cache, the lazily
+started (optionally warm) browser pool and the parallel workers with
+the frame renders. A new page or locale is one new render.
+
+Usage:
+    python3 scripts/generate_screenshots.py --build --targets social
+    python3 scripts/social_cards.py                  # pages, titles and card paths
+
+Output: docs/og/<page>.png
+"""
+
+import html
+import os
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+
+from frame_templates import FrameSpec
+from generate_screenshots import BASE_DIR, LOCALE, W, available_locales, html_page
+
+DOCS_DIR = os.path.join(BASE_DIR, "docs")
+OG_DIR = os.path.join(DOCS_DIR, "og")
+SOCIAL_SIZE = (1200, 630)
+BRAND_PREFIX = re.compile(r"^\s*Vantag\s*[-–—|:]\s*", re.IGNORECASE)
+
+CARD = FrameSpec(
+    name="social_card",
+    css="""
+    .card {
+        position: absolute;
+        top: 0; left: 0; right: 0; bottom: 0;
+        padding: 90px 110px;
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+        z-index: 5;
+    }
+    .card-brand {
+        position: absolute;
+        top: 70px; left: 110px;
+        display: flex;
+        align-items: center;
+        gap: 22px;
+    }
+    .logo-mark {
+        width: 80px; height: 80px;
+        border-radius: 20px;
+        background: linear-gradient(135deg, var(--vant-primary), var(--vant-primary-light));
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-size: 40px;
+        font-weight: 800;
+        color: var(--vant-accent);
+        box-shadow: 0 8px 30px rgb(var(--vant-primary-rgb) / 0.4);
+    }
+    .logo-name {
+        font-size: 36px;
+        font-weight: 700;
+        color: rgb(var(--vant-text-primary-rgb) / 0.6);
+        letter-spacing: 4px;
+        text-transform: lowercase;
+    }
+    .card-title {
+        margin-top: 60px;
+        font-size: 104px;
+        font-weight: 800;
+        color: var(--vant-accent);
+        letter-spacing: -2px;
+        line-height: 1.08;
+        text-shadow: 0 4px 50px rgb(var(--vant-accent-rgb) / 0.2);
+        display: -webkit-box;
+        -webkit-line-clamp: 2;
+        -webkit-box-orient: vertical;
+        overflow: hidden;
+    }
+    .card-subtitle {
+        margin-top: 32px;
+        font-size: 42px;
+        font-weight: 400;
+        color: rgb(var(--vant-text-primary-rgb) / 0.55);
+        letter-spacing: -0.3px;
+    }
+    """,
+    layout="""
+    <div class="card">
+        <div class="card-brand">
+            <div class="logo-mark">V</div>
+            <div class="logo-name">vantag</div>
+        </div>
+        <div class="card-title">{title}</div>
+        <div class="card-subtitle">{subtitle}</div>
+    </div>
+    """,
+    content={"title": "Vantag", "subtitle": ""},
+)
+
+
+@dataclass(frozen=True)
+class Card:
+    page: str           # docs-relative source file
+    name: str           # output stem
+    locale: str
+    title: str
+    subtitle: str
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PAGES
+# ═══════════════════════════════════════════════════════════════════════════
+
+class _Head(HTMLParser):
+    """<html lang>, <title> and meta description of a page."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lang = None
+        self.title = ""
+        self.description = ""
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "html":
+            self.lang = attrs.get("lang")
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "meta" and (attrs.get("name") or attrs.get("property", "")).lower() in (
+                "description", "og:description"):
+            self.description = self.description or (attrs.get("content") or "").strip()
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+
+
+def tagline(locale: str) -> str:
+    """The hook frame's tagline in `locale`, the default card subtitle."""
+    import frames
+    from generate_screenshots import frame_content
+    if locale not in available_locales():
+        locale = LOCALE
+    return frame_content(frames.load("appstore_1_hook"), locale=locale)["tagline"]
+
+
+def _html_card(path: str) -> Card:
+    head = _Head()
+    with open(path, encoding="utf-8") as f:
+        head.feed(f.read())
+    name = os.path.splitext(os.path.basename(path))[0]
+    locale = (head.lang or LOCALE).split("-")[0].lower()
+    title = BRAND_PREFIX.sub("", " ".join(head.title.split())) or "Vantag"
+    return Card(os.path.relpath(path, DOCS_DIR), name, locale, title,
+                head.description or tagline(locale))
+
+
+def _markdown_card(path: str, locale: str) -> Card:
+    with open(path, encoding="utf-8") as f:
+        title = next((line.strip().lstrip("#").strip() for line in f if line.strip()), "")
+    name = os.path.splitext(os.path.basename(path))[0]
+    return Card(os.path.relpath(path, DOCS_DIR), name, locale, title or "Vantag",
+                tagline(locale))
+
+
+def discover() -> list:
+    """Cards for every site page in docs/, in file name order."""
+    locales = set(available_locales())
+    cards = []
+    for entry in sorted(os.listdir(DOCS_DIR)):
+        path = os.path.join(DOCS_DIR, entry)
+        stem, ext = os.path.splitext(entry)
+        if ext == ".html":
+            cards.append(_html_card(path))
+        elif ext == ".md" and "-" in stem and stem.rsplit("-", 1)[1] in locales:
+            cards.append(_markdown_card(path, stem.rsplit("-", 1)[1]))
+    return cards
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# RENDERING
+# ═══════════════════════════════════════════════════════════════════════════
+
+def card_html(card: Card) -> str:
+    body = CARD.render_body({"title": html.escape(card.title),
+                             "subtitle": html.escape(card.subtitle)})
+    return html_page(body, CARD.css, lang=card.locale)
+
+
+def card_profile():
+    """(viewport, device_scale_factor): laid out W px wide like the frames,
+    scaled to SOCIAL_SIZE."""
+    width, height = SOCIAL_SIZE
+    scale = width / W
+    return {"width": W, "height": round(height / scale)}, scale
+
+
+def card_path(card: Card) -> str:
+    return os.path.join(OG_DIR, f"{card.name}.png")
+
+
+def main():
+    print("Vantag Social Cards")
+    print(f"{'=' * 52}")
+    for card in discover():
+        print(f"  {card.page:<18} {card.locale:<3} {card.title}")
+        print(f"        {card.subtitle}")
+        print(f"        → {os.path.relpath(card_path(card), BASE_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
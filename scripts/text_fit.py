@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Headline text fitting from cached font metrics.
+
+Computes, before any render, the largest font size and the line breaks at
+which each headline string fits its box (`.headline`, `.hook-line`, …) for
+every locale. Glyph advances are read once per font file and weight (via
+fontTools, at that weight's instance of a variable font), stored in em
+units indexed by codepoint and cached on disk, so any size is a
+multiplication away. The font file is the one the page renders with: the
+bundled face for the box's selector under --bundled-fonts (with the
+bundled emoji font behind it), else fontconfig's pick for the system
+stack. Codepoints the font files cannot answer
+(emoji, fallback glyphs, or no fontTools installed) are measured in a
+single batched in-browser canvas call and merged into the same cache.
+
+Usage:
+    python3 scripts/text_fit.py                  # all locales, table report
+    python3 scripts/text_fit.py --locale en de --json fit.json
+
+Frames can apply the result through fit_css(), which emits font-size
+overrides only for boxes whose text would otherwise overflow.
+"""
+
+import argparse
+import asyncio
+import functools
+import hashlib
+import html
+import json
+import os
+import re
+import subprocess
+from dataclasses import dataclass
+
+import font_assets
+import frames
+from generate_screenshots import CACHE_DIR, W, available_locales, frame_content
+
+METRICS_DIR = os.path.join(CACHE_DIR, "font_metrics")
+# Bump when cached advances change meaning (2: variable-font instances).
+METRICS_VERSION = 2
+
+FONT_STACK = ("-apple-system", "BlinkMacSystemFont", "SF Pro Display",
+              "SF Pro Text", "system-ui", "sans-serif")
+
+FC_WEIGHTS = {100: "thin", 200: "extralight", 300: "light", 400: "regular",
+              500: "medium", 600: "semibold", 700: "bold", 800: "extrabold",
+              900: "black"}
+
+
+@dataclass(frozen=True)
+class FitBox:
+    """A text box in a frame: content field, geometry and type settings."""
+
+    selector: str
+    field: str
+    width: float
+    height: float
+    size: float
+    min_size: float
+    weight: int = 400
+    line_height: float = 1.2
+    letter_spacing: float = 0.0   # px at the design size; scaled with size
+
+
+# Boxes from COMMON_CSS / frame CSS: headline section is W wide with 60px
+# padding and sits above the phone (top 130 → 540, minus the subtitle).
+HEADLINE_BOX = FitBox(".headline", "headline", W - 120, 300, 74, 48,
+                      weight=800, line_height=1.12, letter_spacing=-1.5)
+SUBTITLE_BOX = FitBox(".subtitle", "subtitle", W - 120, 48, 36, 26,
+                      weight=400, line_height=1.2, letter_spacing=-0.3)
+HOOK_BOXES = (
+    FitBox(".hook-line", "line_1", W - 120, 96 * 1.15, 96, 56,
+           weight=800, line_height=1.15, letter_spacing=-2),
+    FitBox(".hook-line", "line_2", W - 120, 96 * 1.15, 96, 56,
+           weight=800, line_height=1.15, letter_spacing=-2),
+    FitBox(".hook-tagline", "tagline", W - 120, 38 * 1.2, 38, 28,
+           weight=400, letter_spacing=-0.3),
+)
+
+FIT_BOXES = {
+    "appstore_1_hook": HOOK_BOXES,
+}
+DEFAULT_BOXES = (HEADLINE_BOX, SUBTITLE_BOX)
+
+
+def boxes_for(frame_name: str):
+    return FIT_BOXES.get(frame_name, DEFAULT_BOXES)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# FONT METRICS CACHE
+# ═══════════════════════════════════════════════════════════════════════════
+
+def resolve_font(weight: int, selector: str = None):
+    """Font file text matching `selector` renders with at a weight: the
+    bundled face when bundled fonts are on, else fontconfig's pick."""
+    return font_assets.font_file(selector) or system_font(weight)
+
+
+@functools.lru_cache(maxsize=None)
+def system_font(weight: int):
+    """Font file fontconfig picks for the frame font stack at a weight."""
+    pattern = ",".join(FONT_STACK) + f":weight={FC_WEIGHTS.get(weight, 'regular')}"
+    try:
+        result = subprocess.run(["fc-match", "-f", "%{file}", pattern],
+                                capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        return None
+    return result.stdout.strip() or None
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+
+class FontMetrics:
+    """Glyph advances in em units for one font and weight, disk-cached.
+
+    `fallback` (the bundled emoji font's metrics) answers codepoints the
+    font lacks, as the CSS family list does; what neither has falls to
+    `stack` in the browser and is measured there.
+    """
+
+    def __init__(self, weight: int, font_path: str = None, fallback=None):
+        self.weight = weight
+        self.font_path = font_path or system_font(weight)
+        self.fallback = fallback
+        self.stack = "sans-serif" if font_path else ", ".join(
+            f"'{f}'" if " " in f else f for f in FONT_STACK)
+        key = _file_digest(self.font_path) if self.font_path else "browser"
+        self.cache_path = os.path.join(METRICS_DIR,
+                                       f"v{METRICS_VERSION}-w{weight}-{key}.json")
+        self.advances = {}
+        self._load()
+
+    def _load(self):
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.advances = {int(cp): adv for cp, adv in data["advances"].items()}
+            return
+        if self.font_path:
+            self.advances = _read_font_advances(self.font_path, self.weight)
+            self.save()
+
+    def save(self):
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "font": self.font_path,
+                "weight": self.weight,
+                "advances": {str(cp): adv for cp, adv in sorted(self.advances.items())},
+            }, f)
+
+    def advance(self, cp: int) -> float:
+        if cp in self.advances or self.fallback is None:
+            return self.advances.get(cp, 0.6)
+        return self.fallback.advances.get(cp, 0.6)
+
+    def missing(self, text: str) -> set:
+        fallback = self.fallback.advances if self.fallback else {}
+        return {ch for ch in text if ord(ch) not in self.advances and ord(ch) not in fallback}
+
+    def width(self, text: str, size: float, letter_spacing_em: float = 0.0) -> float:
+        em = sum(self.advance(ord(ch)) for ch in text)
+        return size * (em + letter_spacing_em * len(text))
+
+
+def _read_font_advances(path: str, weight: int) -> dict:
+    try:
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        return {}
+    font = TTFont(path, fontNumber=0, lazy=True)
+    wght = next((a for a in font["fvar"].axes if a.axisTag == "wght"), None) \
+        if "fvar" in font else None
+    if wght is not None:
+        # Advances of a variable font move with its weight axis.
+        from fontTools.varLib import instancer
+        font.close()
+        font = instancer.instantiateVariableFont(
+            TTFont(path, fontNumber=0),
+            {"wght": min(max(weight, wght.minValue), wght.maxValue)})
+    upem = font["head"].unitsPerEm
+    hmtx = font["hmtx"].metrics
+    advances = {
+        cp: hmtx[glyph][0] / upem
+        for cp, glyph in font.getBestCmap().items()
+        if glyph in hmtx
+    }
+    font.close()
+    return advances
+
+
+async def measure_in_browser(requests: dict, pool=None) -> dict:
+    """Measure missing glyphs for all fonts in one page.evaluate call.
+
+    `requests` maps FontMetrics → set of characters, measured in its weight
+    and fallback stack; returns FontMetrics → {cp: em}. With `pool` (a
+    BrowserPool) the call runs on one of its pages instead of a browser
+    launched for it.
+    """
+    fonts = list(requests)
+    payload = [{"font": f"{m.weight} 1000px {m.stack}", "chars": sorted(requests[m])}
+               for m in fonts]
+    script = """
+    (payload) => {
+        const ctx = document.createElement('canvas').getContext('2d');
+        return payload.map(({ font, chars }) => {
+            ctx.font = font;
+            const out = {};
+            for (const ch of chars) {
+                out[ch.codePointAt(0)] = ctx.measureText(ch).width / 1000;
+            }
+            return out;
+        });
+    }
+    """
+    arg = payload
+    if pool is not None:
+        async with pool.page() as page:
+            result = await page.evaluate(script, arg)
+    else:
+        from generate_screenshots import load_playwright
+        async with load_playwright()() as p:
+            browser = await p.chromium.launch()
+            page = await browser.new_page()
+            result = await page.evaluate(script, arg)
+            await browser.close()
+    return {m: {int(cp): adv for cp, adv in measured.items()}
+            for m, measured in zip(fonts, result)}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# FITTING
+# ═══════════════════════════════════════════════════════════════════════════
+
+_TAG = re.compile(r"<[^>]+>")
+_BR = re.compile(r"<br\s*/?>", re.I)
+
+
+def plain_lines(markup: str) -> list:
+    """Forced lines of a content string: split on <br>, strip tags."""
+    return [html.unescape(_TAG.sub("", part)).strip() for part in _BR.split(markup)]
+
+
+def wrap(metrics, words, size, max_width, ls_em) -> list:
+    """Greedy line breaking of one forced line at a size."""
+    lines, current = [], ""
+    for word in words:
+        candidate = f"{current} {word}" if current else word
+        if current and metrics.width(candidate, size, ls_em) > max_width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    lines.append(current)
+    return lines
+
+
+def layout(metrics, text_lines, box: FitBox, size: float):
+    ls_em = box.letter_spacing / box.size
+    lines = []
+    for line in text_lines:
+        lines.extend(wrap(metrics, line.split(), size, box.width, ls_em))
+    widest = max((metrics.width(l, size, ls_em) for l in lines), default=0)
+    height = len(lines) * size * box.line_height
+    return lines, widest, height
+
+
+def fit(metrics, markup: str, box: FitBox) -> dict:
+    """Largest whole-pixel size in [min_size, size] at which the text fits."""
+    text_lines = plain_lines(markup)
+
+    def fits(size):
+        lines, widest, height = layout(metrics, text_lines, box, size)
+        return widest <= box.width and height <= box.height, lines
+
+    ok, lines = fits(box.size)
+    size = box.size
+    if not ok:
+        lo, hi = int(box.min_size), int(box.size) - 1
+        size, lines = box.min_size, fits(box.min_size)[1]
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            ok_mid, lines_mid = fits(mid)
+            if ok_mid:
+                size, lines, lo = mid, lines_mid, mid + 1
+            else:
+                hi = mid - 1
+        ok = fits(size)[0]
+    return {"size": size, "lines": lines, "fits": ok, "shrunk": size < box.size}
+
+
+def collect_texts(locales, specs=None):
+    """(locale, frame, box, markup) for every fit box with content."""
+    specs = {spec.name: spec for spec in specs or frames.load_all()}
+    for locale in locales:
+        for name, spec in specs.items():
+            content = frame_content(spec, locale=locale)
+            for box in boxes_for(name):
+                markup = content.get(box.field)
+                if markup:
+                    yield locale, name, box, markup
+
+
+def metrics_for(weight: int, selector: str = None) -> FontMetrics:
+    """Metrics of the font text matching `selector` renders with."""
+    return _metrics(weight, font_assets.font_file(selector), font_assets.emoji_file())
+
+
+@functools.lru_cache(maxsize=None)
+def _metrics(weight: int, font_path: str, emoji_path: str) -> FontMetrics:
+    fallback = _metrics(400, emoji_path, None) if font_path and emoji_path else None
+    return FontMetrics(weight, font_path, fallback)
+
+
+async def fit_all_async(locales, browser_fallback: bool = True, specs=None,
+                        pool=None) -> list:
+    """Fit every headline box for the given locales (and frames) in one batch.
+
+    Glyphs missing from the metrics cache are measured on `pool`: a
+    BrowserPool, or a coroutine function returning one (so a lazily
+    started pool is only started when something is missing).
+    """
+    texts = list(collect_texts(locales, specs))
+
+    missing = {}
+    for _, _, box, markup in texts:
+        metrics = metrics_for(box.weight, box.selector)
+        chars = metrics.missing("".join(plain_lines(markup)))
+        if chars:
+            missing.setdefault(metrics, set()).update(chars)
+
+    if missing and browser_fallback:
+        if asyncio.iscoroutinefunction(pool):
+            pool = await pool()
+        measured = await measure_in_browser(missing, pool)
+        for m, advances in measured.items():
+            m.advances.update(advances)
+            m.save()
+
+    results = []
+    for locale, name, box, markup in texts:
+        result = fit(metrics_for(box.weight, box.selector), markup, box)
+        results.append({"locale": locale, "frame": name, "selector": box.selector,
+                        "field": box.field, **result})
+    return results
+
+
+def fit_all(locales, browser_fallback: bool = True, specs=None) -> list:
+    """fit_all_async() outside an event loop (the CLI and --plan)."""
+    return asyncio.run(fit_all_async(locales, browser_fallback, specs))
+
+
+def fitted_sizes(results, frame_name: str, locale: str) -> dict:
+    """selector → font size (px) for the shrunk boxes of one frame/locale.
+    Boxes sharing a selector (the two hook lines) take the smallest size,
+    so every element the selector matches fits and they stay matched."""
+    sizes = {}
+    for r in results:
+        if r["frame"] == frame_name and r["locale"] == locale and r["shrunk"]:
+            sizes[r["selector"]] = min(r["size"], sizes.get(r["selector"], r["size"]))
+    return sizes
+
+
+def fit_css(results, frame_name: str, locale: str) -> str:
+    """CSS overrides shrinking the boxes that need it for one frame/locale."""
+    return "\n".join(f"{selector} {{ font-size: {size}px; }}"
+                     for selector, size in fitted_sizes(results, frame_name, locale).items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit headline text from cached font metrics.")
+    parser.add_argument("--locale", nargs="*", help="locales to check (default: all)")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--no-browser", action="store_true",
+                        help="never fall back to in-browser measurement")
+    args = parser.parse_args()
+
+    locales = args.locale or available_locales()
+    results = fit_all(locales, browser_fallback=not args.no_browser)
+
+    print(f"{'locale':<7} {'frame':<22} {'field':<9} {'size':>5}  lines")
+    for r in results:
+        flag = "" if r["fits"] else "  ✗ OVERFLOW"
+        shrunk = "*" if r["shrunk"] else " "
+        print(f"{r['locale']:<7} {r['frame']:<22} {r['field']:<9} {r['size']:>4}{shrunk}  "
+              f"{' / '.join(r['lines'])}{flag}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if any(not r["fits"] for r in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
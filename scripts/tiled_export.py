@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Tiled high-resolution export for billboard / press-kit sizes.
+
+A 4× frame is 5280 × 11472 px — too much for one Chromium screenshot. The
+frame is instead laid out once per worker page at the target device scale
+factor and captured in full-width row bands, several pages in parallel.
+Each page's viewport is only one band tall, so Chromium rasterizes a band
+rather than the whole surface; the page's vh lengths are resolved against
+the full frame height first, keeping the layout of a full-height
+viewport, and the page is scrolled to each band. Bands are stitched in
+order by a streaming PNG writer:
+each band is Up-filtered against the previous band's last row, deflated
+into IDAT chunks and dropped, so peak memory follows the band size, not
+the output size, and browser memory follows --tile-mpx × --parallel.
+
+Usage:
+    python3 scripts/tiled_export.py                          # all frames, 3× and 4×
+    python3 scripts/tiled_export.py appstore_2_home --scale 4 --tile-mpx 4
+
+Output: docs/screenshots/<locale>/iphone_6_9@<n>x/<frame>.png
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import re
+import struct
+import sys
+import time
+import zlib
+
+import frames
+import render_trace
+from generate_screenshots import (
+    DEVICE, LOCALE,
+    add_pool_arguments, available_locales, device_profile, enable_page_features,
+    frame_html, load_backend, output_path, pool_options, settle_fonts,
+)
+
+DEFAULT_SCALES = (3, 4)
+DEFAULT_TILE_MPX = 8        # device megapixels per band
+IDAT_CHUNK = 1 << 20
+
+_VH = re.compile(r"(?<![\w.-])(\d+(?:\.\d+)?)vh\b")
+
+
+def load_pillow():
+    try:
+        from PIL import Image, ImageChops
+    except ImportError:
+        print("ERROR: Pillow is required to stitch tiles.")
+        print("  pip install pillow --break-system-packages")
+        sys.exit(1)
+    return Image, ImageChops
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# STREAMING PNG WRITER
+# ═══════════════════════════════════════════════════════════════════════════
+
+class PNGStreamWriter:
+    """Writes an 8-bit RGB PNG band by band, top to bottom."""
+
+    def __init__(self, path: str, width: int, height: int, level: int = 6):
+        self.width, self.height = width, height
+        self.rows_written = 0
+        self._tmp = f"{path}.part"
+        self._path = path
+        self._f = open(self._tmp, "wb")
+        self._z = zlib.compressobj(level)
+        self._pending = []
+        self._pending_len = 0
+        self._prev_row = None
+        self._f.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        self._chunk(b"sRGB", b"\x00")
+
+    def _chunk(self, ctype: bytes, data: bytes):
+        self._f.write(struct.pack(">I", len(data)) + ctype + data)
+        self._f.write(struct.pack(">I", zlib.crc32(ctype + data)))
+
+    def _emit(self, data: bytes, final: bool = False):
+        if data:
+            self._pending.append(data)
+            self._pending_len += len(data)
+        if self._pending_len >= IDAT_CHUNK or (final and self._pending):
+            self._chunk(b"IDAT", b"".join(self._pending))
+            self._pending, self._pending_len = [], 0
+
+    def write_band(self, band):
+        """Append a PIL RGB image whose width matches the output."""
+        Image, ImageChops = load_pillow()
+        if band.size[0] != self.width:
+            raise ValueError(f"band width {band.size[0]} != {self.width}")
+        h = band.size[1]
+        # PNG "Up" filter for the whole band in C: band minus band shifted
+        # down a row, seeded with the previous band's last row.
+        above = Image.new("RGB", band.size)
+        if self._prev_row is not None:
+            above.paste(self._prev_row, (0, 0))
+        if h > 1:
+            above.paste(band.crop((0, 0, self.width, h - 1)), (0, 1))
+        raw = ImageChops.subtract_modulo(band, above).tobytes()
+        self._prev_row = band.crop((0, h - 1, self.width, h))
+
+        stride = self.width * 3
+        for start in range(0, h, 256):
+            rows = range(start, min(h, start + 256))
+            self._emit(self._z.compress(
+                b"".join(b"\x02" + raw[r * stride:(r + 1) * stride] for r in rows)))
+        self.rows_written += h
+
+    def abort(self):
+        self._f.close()
+        os.remove(self._tmp)
+
+    def close(self):
+        if self.rows_written != self.height:
+            self.abort()
+            raise ValueError(f"wrote {self.rows_written} of {self.height} rows")
+        self._emit(self._z.flush(), final=True)
+        self._chunk(b"IEND", b"")
+        self._f.close()
+        os.replace(self._tmp, self._path)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TILES
+# ═══════════════════════════════════════════════════════════════════════════
+
+def pin_height(html: str, css_height: int) -> str:
+    """Resolve vh lengths against the full frame height, so a band-tall
+    viewport lays the page out like a full-height one."""
+    return _VH.sub(lambda m: f"{float(m.group(1)) * css_height / 100:g}px", html)
+
+
+def plan_bands(css_height: int, scale: int, out_width: int, tile_mpx: float) -> list:
+    """(y, height) bands in CSS px; integer CSS rows keep pixel edges exact."""
+    rows = max(1, int(tile_mpx * 1_000_000 // out_width))
+    band = max(1, rows // scale)
+    return [(y, min(band, css_height - y)) for y in range(0, css_height, band)]
+
+
+async def export_frame(pool, spec, locale, scale, args):
+    """Render one frame at `scale` in parallel row bands, streaming to PNG."""
+    Image, _ = load_pillow()
+    trace = render_trace.tracer
+    viewport, _ = device_profile(DEVICE)
+    out_w, out_h = viewport["width"] * scale, viewport["height"] * scale
+    bands = plan_bands(viewport["height"], scale, out_w, args.tile_mpx)
+    path = output_path(spec.name, locale, f"{DEVICE}@{scale}x")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    html = pin_height(frame_html(spec, locale=locale), viewport["height"])
+    band_viewport = {"width": viewport["width"], "height": max(h for _, h in bands)}
+    attrs = {"frame": spec.name, "locale": locale, "scale": scale}
+
+    queue = asyncio.Queue()
+    for index, band in enumerate(bands):
+        queue.put_nowait((index, band))
+    done = {}                      # index → PNG bytes, waiting for its turn
+    ready = asyncio.Condition()
+    writer = PNGStreamWriter(path, out_w, out_h)
+    writer_next = 0
+
+    async def worker():
+        async with pool.page(band_viewport, scale) as page:
+            with trace.span("tile.set_content", **attrs):
+                await page.set_content(html, wait_until="domcontentloaded")
+                await settle_fonts(page)
+            while not queue.empty():
+                index, (y, h) = queue.get_nowait()
+                # Don't run more than a few bands ahead of the writer.
+                async with ready:
+                    await ready.wait_for(lambda: index < writer_next + args.parallel * 2)
+                with trace.span("tile.screenshot", band=index, **attrs):
+                    # The last band may be shorter than the viewport, so the
+                    # scroll can stop above y; clip is viewport-relative.
+                    scrolled = await page.evaluate(
+                        "y => { window.scrollTo(0, y); return window.scrollY; }", y)
+                    png = await page.screenshot(
+                        type="png",
+                        clip={"x": 0, "y": y - scrolled, "width": viewport["width"], "height": h})
+                async with ready:
+                    done[index] = png
+                    ready.notify_all()
+
+    def decode(png):
+        return Image.open(io.BytesIO(png)).convert("RGB")
+
+    async def stitch():
+        nonlocal writer_next
+        while writer_next < len(bands):
+            async with ready:
+                await ready.wait_for(lambda: writer_next in done)
+                png = done.pop(writer_next)
+            _, h = bands[writer_next]
+            with trace.span("tile.stitch", band=writer_next, **attrs):
+                band = await asyncio.to_thread(decode, png)
+                if band.size != (out_w, h * scale):
+                    raise RuntimeError(f"tile {writer_next} is {band.size}, "
+                                       f"expected {(out_w, h * scale)}")
+                await asyncio.to_thread(writer.write_band, band)
+            async with ready:
+                writer_next += 1
+                ready.notify_all()
+
+    started = time.perf_counter()
+    workers = min(args.parallel, len(bands))
+    try:
+        await asyncio.gather(stitch(), *(worker() for _ in range(workers)))
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+    elapsed = time.perf_counter() - started
+    print(f"  {spec.name:<18} {locale:<4} {scale}×  {out_w} × {out_h}  "
+          f"{len(bands)} bands × {workers} pages  {elapsed:.1f}s  "
+          f"{os.path.getsize(path) / (1024 * 1024):.1f} MB")
+    return path
+
+
+async def export_all(specs, locales, scales, args):
+    async_playwright = load_backend(args)
+    from browser_pool import BrowserPool
+
+    async with async_playwright() as p:
+        async with BrowserPool(p, **pool_options(args)) as pool:
+            # Frames go one at a time; the parallelism is inside a frame,
+            # which is what bounds memory.
+            for scale in scales:
+                for locale in locales:
+                    for spec in specs:
+                        await export_frame(pool, spec, locale, scale, args)
+            print(f"  {pool.format_metrics()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export frames at 3×/4× in stitched tiles.")
+    parser.add_argument("frames", nargs="*", help="frame name globs (default: all)")
+    parser.add_argument("--scale", nargs="*", type=int, default=list(DEFAULT_SCALES))
+    parser.add_argument("--locale", nargs="*", default=[LOCALE],
+                        help=f"locales (default: {LOCALE}; 'all' for every locale)")
+    parser.add_argument("--tile-mpx", type=float, default=DEFAULT_TILE_MPX,
+                        help="device megapixels per band (bounds peak memory)")
+    parser.add_argument("--parallel", type=int, default=4, help="pages capturing bands at once")
+    add_pool_arguments(parser)
+    args = parser.parse_args()
+    if args.trace:
+        render_trace.enable(args.trace)
+    else:
+        render_trace.enable_from_env()
+    asyncio.run(enable_page_features(args))
+
+    specs = frames.load_all(args.frames)
+    locales = available_locales() if args.locale == ["all"] else args.locale
+    print("Vantag Tiled Export")
+    print(f"{'=' * 52}")
+    asyncio.run(export_all(specs, locales, args.scale, args))
+    if render_trace.tracer.enabled:
+        render_trace.tracer.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Header-only App Store / Play Console validator for rendered screenshots.
+
+Reads only PNG chunk tables (IHDR, sRGB, iCCP, tRNS — IDAT is skipped with
+a seek) and JPEG marker segments (SOFn, APP2 ICC), never decoding pixels.
+Each file is checked against its device slot: exact pixel size, RGB colour
+type with no alpha, an sRGB profile and the store's file size limit.
+Files are checked in parallel and the result is a machine-readable JSON
+report; the exit code gates the pipeline.
+
+Usage:
+    python3 scripts/validate_assets.py                      # renderer outputs
+    python3 scripts/validate_assets.py out/ --slot play_phone --report v.json
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from generate_screenshots import DEVICES, DEVICE, OUT_DIR
+
+MB = 1024 * 1024
+
+# Per-slot requirements. App Store slots need an exact size (either
+# orientation); Play accepts a range with at most a 2:1 aspect ratio.
+SLOT_SPECS = {
+    "iphone_6_9": {"sizes": [DEVICES["iphone_6_9"], (1290, 2796)], "max_bytes": 10 * MB},
+    "iphone_6_5": {"sizes": [DEVICES["iphone_6_5"], (1242, 2688)], "max_bytes": 10 * MB},
+    "ipad_13":    {"sizes": [DEVICES["ipad_13"], (2048, 2732)], "max_bytes": 10 * MB},
+    "play_phone": {"min_side": 320, "max_side": 3840, "max_aspect": 2.0, "max_bytes": 8 * MB},
+}
+
+DEFAULT_PATTERNS = ("appstore_*.png", "appstore_*.jpg", "appstore_*.jpeg")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_COLOR_TYPES = {0: "gray", 2: "rgb", 3: "palette", 4: "gray+alpha", 6: "rgba"}
+
+
+class HeaderError(Exception):
+    pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# HEADER READERS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def icc_description(profile: bytes) -> str:
+    """Profile description from an ICC profile's 'desc' tag (v2 or v4)."""
+    if len(profile) < 132:
+        return ""
+    (count,) = struct.unpack(">I", profile[128:132])
+    for i in range(count):
+        sig, offset, size = struct.unpack(">4sII", profile[132 + 12 * i:144 + 12 * i])
+        if sig != b"desc":
+            continue
+        tag = profile[offset:offset + size]
+        if tag[:4] == b"desc":                       # ICC v2 textDescriptionType
+            (length,) = struct.unpack(">I", tag[8:12])
+            return tag[12:12 + length].rstrip(b"\0").decode("latin-1")
+        if tag[:4] == b"mluc":                       # ICC v4 multiLocalizedUnicode
+            str_len, str_off = struct.unpack(">II", tag[20:28])     # first record
+            return tag[str_off:str_off + str_len].decode("utf-16-be", "replace")
+    return ""
+
+
+def read_png_header(f) -> dict:
+    if f.read(8) != PNG_SIGNATURE:
+        raise HeaderError("not a PNG file")
+    info = {"format": "png", "profile": None, "alpha": False}
+    while True:
+        head = f.read(8)
+        if len(head) < 8:
+            raise HeaderError("truncated PNG (no IEND)")
+        length, ctype = struct.unpack(">I4s", head)
+        if ctype == b"IHDR":
+            data = f.read(length)
+            width, height, depth, color = struct.unpack(">IIBB", data[:10])
+            info.update(width=width, height=height, bit_depth=depth,
+                        color_type=PNG_COLOR_TYPES.get(color, str(color)),
+                        alpha=color in (4, 6))
+            f.seek(4, os.SEEK_CUR)
+        elif ctype == b"sRGB":
+            info["profile"] = "sRGB"
+            f.seek(length + 4, os.SEEK_CUR)
+        elif ctype == b"iCCP":
+            data = f.read(length)
+            name, _, rest = data.partition(b"\0")
+            try:
+                desc = icc_description(zlib.decompress(rest[1:]))
+            except zlib.error:
+                desc = ""
+            info["profile"] = desc or name.decode("latin-1")
+            f.seek(4, os.SEEK_CUR)
+        elif ctype == b"tRNS":
+            info["alpha"] = True
+            f.seek(length + 4, os.SEEK_CUR)
+        elif ctype == b"IEND":
+            return info
+        else:
+            # IDAT and everything else: skip data + CRC without reading
+            f.seek(length + 4, os.SEEK_CUR)
+
+
+def read_jpeg_header(f) -> dict:
+    if f.read(2) != b"\xff\xd8":
+        raise HeaderError("not a JPEG file")
+    info = {"format": "jpeg", "profile": None, "alpha": False}
+    icc_parts = {}
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            raise HeaderError("corrupt JPEG marker stream")
+        code = marker[1]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+        (length,) = struct.unpack(">H", f.read(2))
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            depth, height, width, comps = struct.unpack(">BHHB", f.read(6))
+            info.update(width=width, height=height, bit_depth=depth,
+                        color_type={1: "gray", 3: "rgb", 4: "cmyk"}.get(comps, str(comps)))
+            f.seek(length - 8, os.SEEK_CUR)
+        elif code == 0xE2:
+            data = f.read(length - 2)
+            if data.startswith(b"ICC_PROFILE\0"):
+                icc_parts[data[12]] = data[14:]
+        elif code == 0xDA:          # start of scan: headers are done
+            break
+        else:
+            f.seek(length - 2, os.SEEK_CUR)
+    if icc_parts:
+        profile = b"".join(icc_parts[k] for k in sorted(icc_parts))
+        info["profile"] = icc_description(profile) or "icc"
+    return info
+
+
+def read_header(path: str) -> dict:
+    with open(path, "rb") as f:
+        magic = f.read(8)
+        f.seek(0)
+        if magic.startswith(PNG_SIGNATURE):
+            return read_png_header(f)
+        if magic.startswith(b"\xff\xd8"):
+            return read_jpeg_header(f)
+    raise HeaderError("unsupported format (expected PNG or JPEG)")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# VALIDATION
+# ═══════════════════════════════════════════════════════════════════════════
+
+def infer_slot(path: str, size, default: str):
+    """Slot from a device name in the path, else an exact size match."""
+    lowered = path.replace("\\", "/").lower()
+    for slot in SLOT_SPECS:
+        if slot in lowered:
+            return slot
+    for slot, spec in SLOT_SPECS.items():
+        if size in spec.get("sizes", ()) or size[::-1] in spec.get("sizes", ()):
+            return slot
+    return default
+
+
+def check_slot(info: dict, slot: str) -> list:
+    spec = SLOT_SPECS[slot]
+    errors = []
+    w, h = info["width"], info["height"]
+    if "sizes" in spec:
+        allowed = spec["sizes"] + [s[::-1] for s in spec["sizes"]]
+        if (w, h) not in allowed:
+            expected = ", ".join(f"{a}×{b}" for a, b in spec["sizes"])
+            errors.append(f"size {w}×{h} not accepted for {slot} (expected {expected})")
+    else:
+        if min(w, h) < spec["min_side"] or max(w, h) > spec["max_side"]:
+            errors.append(f"size {w}×{h} outside {spec['min_side']}–{spec['max_side']} px")
+        if max(w, h) / min(w, h) > spec["max_aspect"]:
+            errors.append(f"aspect ratio {max(w, h) / min(w, h):.2f} exceeds {spec['max_aspect']}:1")
+    if info["alpha"]:
+        errors.append(f"has alpha ({info['color_type']})")
+    if info["color_type"] not in ("rgb", "palette"):
+        if not info["alpha"]:
+            errors.append(f"colour type {info['color_type']} (expected RGB)")
+    profile = info["profile"]
+    if profile is None:
+        errors.append("no colour profile (expected sRGB)")
+    elif "srgb" not in profile.lower() and "61966" not in profile:
+        errors.append(f"colour profile '{profile}' is not sRGB")
+    if info["bytes"] > spec["max_bytes"]:
+        errors.append(f"file size {info['bytes'] / MB:.1f} MB exceeds {spec['max_bytes'] // MB} MB")
+    return errors
+
+
+def validate_file(path: str, default_slot: str) -> dict:
+    result = {"path": path, "bytes": os.path.getsize(path)}
+    try:
+        result.update(read_header(path))
+    except (HeaderError, struct.error, OSError) as e:
+        result.update(slot=None, ok=False, errors=[str(e)])
+        return result
+    slot = infer_slot(path, (result["width"], result["height"]), default_slot)
+    result["slot"] = slot
+    result["errors"] = check_slot(result, slot)
+    result["ok"] = not result["errors"]
+    return result
+
+
+def collect_files(paths, patterns) -> list:
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+        for root, _dirs, names in os.walk(path):
+            for name in sorted(names):
+                if any(fnmatch.fnmatch(name.lower(), p) for p in patterns):
+                    files.append(os.path.join(root, name))
+    return files
+
+
+def validate(paths, default_slot=DEVICE, patterns=DEFAULT_PATTERNS, workers=None) -> dict:
+    files = collect_files(paths, patterns)
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 4)) as pool:
+        results = list(pool.map(lambda p: validate_file(p, default_slot), files))
+    failed = [r for r in results if not r["ok"]]
+    return {
+        "ok": not failed,
+        "checked": len(results),
+        "failed": len(failed),
+        "files": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate store screenshot assets from headers only.")
+    parser.add_argument("paths", nargs="*", default=[OUT_DIR], help="files or directories")
+    parser.add_argument("--slot", default=DEVICE, choices=sorted(SLOT_SPECS),
+                        help="slot for files whose slot cannot be inferred")
+    parser.add_argument("--pattern", action="append",
+                        help="file name glob inside directories (default: appstore_*.png/jpg)")
+    parser.add_argument("--report", metavar="PATH", help="write the JSON report here")
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+
+    report = validate(args.paths, args.slot, tuple(args.pattern or DEFAULT_PATTERNS),
+                      args.workers or None)
+    for r in report["files"]:
+        if not r["ok"]:
+            print(f"  ✗ {r['path']}")
+            for e in r["errors"]:
+                print(f"      {e}")
+    print(f"{report['checked'] - report['failed']}/{report['checked']} assets pass")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    sys.exit(0 if report["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
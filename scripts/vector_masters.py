@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Vector master renders for resolution-independent output.
+
+Each frame is laid out in Chromium once per (locale, viewport) and printed
+to a single-page PDF — the browser's vector print path — cached by the
+SHA-256 of its HTML and viewport. Device-slot PNGs and print/marketing
+sizes are then rasterized from the cached masters in a process pool, so a
+new output size is a new row in RASTER_TARGETS, not another round of
+layout for every frame and locale.
+
+Targets that share a viewport (same CSS height) share a master; only a
+new aspect ratio needs a new master. Blurs, shadows and other filter
+effects are flattened by Chromium into the PDF, so they come out at the
+print path's resolution rather than the target's.
+
+Rasterizes with PyMuPDF when installed, else poppler's pdftoppm.
+
+Usage:
+    python3 scripts/vector_masters.py                        # all targets
+    python3 scripts/vector_masters.py --target print_3x --locale en
+    python3 scripts/vector_masters.py --list
+
+Output: device targets → generate_screenshots.output_path()
+        other targets  → docs/screenshots/<locale>/<target>/<frame>.png
+Cache:  .screenshot_cache/masters/<sha>.pdf
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import render_trace
+from generate_screenshots import (
+    CACHE_DIR, DEVICE, DEVICES, FRAMES, W,
+    add_pool_arguments, available_locales, device_profile, enable_page_features,
+    frame_html, load_playwright, output_path, pool_options, settle_fonts, tag_srgb,
+)
+
+MASTERS_DIR = os.path.join(CACHE_DIR, "masters")
+
+# Print path: no margins, screen colours and backgrounds.
+PRINT_CSS = """
+@page { margin: 0; }
+html, body { -webkit-print-color-adjust: exact; print-color-adjust: exact; }
+"""
+
+# name → (layout device, output width px). The layout device fixes the
+# viewport (and so the master); the width only scales the raster.
+RASTER_TARGETS = {
+    **{device: (device, size[0]) for device, size in DEVICES.items()},
+    "print_3x": (DEVICE, W * 3),
+    "marketing_1080": (DEVICE, 1080),
+    "thumbnail_400": (DEVICE, 400),
+}
+
+
+def target_size(target: str):
+    """(viewport, output width, output height) for a raster target."""
+    device, width = RASTER_TARGETS[target]
+    viewport, _ = device_profile(device)
+    height = round(viewport["height"] * width / viewport["width"])
+    return viewport, width, height
+
+
+def master_key(html: str, viewport: dict) -> str:
+    h = hashlib.sha256(html.encode("utf-8"))
+    h.update(f"|{viewport['width']}x{viewport['height']}".encode())
+    return h.hexdigest()
+
+
+def master_path(key: str) -> str:
+    return os.path.join(MASTERS_DIR, f"{key[:24]}.pdf")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# MASTERS (Chromium)
+# ═══════════════════════════════════════════════════════════════════════════
+
+async def render_master(pool, html, viewport, path, attrs):
+    trace = render_trace.tracer
+    async with pool.page(viewport, 1) as page:
+        await page.emulate_media(media="screen")
+        with trace.span("master.set_content", **attrs):
+            await page.set_content(html, wait_until="domcontentloaded")
+        with trace.span("page.font_settle", **attrs):
+            await settle_fonts(page)
+        with trace.span("master.pdf", **attrs) as span:
+            pdf = await page.pdf(
+                width=f"{viewport['width']}px", height=f"{viewport['height']}px",
+                print_background=True, page_ranges="1",
+                margin={"top": "0", "right": "0", "bottom": "0", "left": "0"},
+            )
+            span.set(bytes=len(pdf))
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(pdf)
+    os.replace(tmp, path)
+
+
+async def ensure_masters(jobs: dict, args) -> int:
+    """Render every master in `jobs` (key → (html, viewport, attrs)) that
+    is not cached yet. Returns how many were rendered."""
+    pending = [(key, *job) for key, job in jobs.items()
+               if args.force or not os.path.exists(master_path(key))]
+    if not pending:
+        return 0
+    async_playwright = load_playwright()
+    from browser_pool import BrowserPool
+
+    os.makedirs(MASTERS_DIR, exist_ok=True)
+    async with async_playwright() as p:
+        async with BrowserPool(p, **pool_options(args)) as pool:
+            await asyncio.gather(*(
+                render_master(pool, html, viewport, master_path(key), attrs)
+                for key, html, viewport, attrs in pending
+            ))
+            print(f"  {pool.format_metrics()}")
+    return len(pending)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# RASTERIZATION (worker pool)
+# ═══════════════════════════════════════════════════════════════════════════
+
+def rasterizer() -> str:
+    try:
+        import fitz  # noqa: F401  (PyMuPDF)
+        return "pymupdf"
+    except ImportError:
+        pass
+    if shutil.which("pdftoppm"):
+        return "pdftoppm"
+    print("ERROR: no PDF rasterizer found.")
+    print("  pip install pymupdf --break-system-packages")
+    print("  (or install poppler-utils for pdftoppm)")
+    sys.exit(1)
+
+
+def rasterize(job) -> tuple:
+    """Worker: PDF master → exact-size sRGB PNG. Returns (out path, ms)."""
+    backend, pdf_path, width, height, out_path = job
+    started = time.perf_counter()
+    if backend == "pymupdf":
+        import fitz
+        with fitz.open(pdf_path) as doc:
+            page = doc[0]
+            matrix = fitz.Matrix(width / page.rect.width, height / page.rect.height)
+            png = page.get_pixmap(matrix=matrix, alpha=False).tobytes("png")
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            stem = os.path.join(tmp, "page")
+            subprocess.run(["pdftoppm", "-png", "-singlefile", "-f", "1", "-l", "1",
+                            "-scale-to-x", str(width), "-scale-to-y", str(height),
+                            pdf_path, stem], check=True)
+            with open(f"{stem}.png", "rb") as f:
+                png = f.read()
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "wb") as f:
+        f.write(tag_srgb(png))
+    return out_path, (time.perf_counter() - started) * 1000
+
+
+def plan(locales, targets):
+    """Masters needed and raster jobs for the locale × target matrix."""
+    masters, rasters = {}, []
+    for locale in locales:
+        for spec in FRAMES:
+            html = frame_html(spec, locale=locale, extra_css=PRINT_CSS)
+            for target in targets:
+                viewport, width, height = target_size(target)
+                key = master_key(html, viewport)
+                masters.setdefault(key, (html, viewport, {
+                    "frame": spec.name, "locale": locale, "viewport": viewport["height"],
+                }))
+                rasters.append((master_path(key), width, height,
+                                output_path(spec.name, locale, target)))
+    return masters, rasters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render vector masters and rasterize targets.")
+    parser.add_argument("--locale", nargs="*", help="locales (default: all)")
+    parser.add_argument("--target", nargs="*", choices=sorted(RASTER_TARGETS),
+                        help="raster targets (default: all)")
+    parser.add_argument("--workers", type=int, default=0, help="rasterizer processes")
+    parser.add_argument("--force", action="store_true", help="re-render cached masters")
+    parser.add_argument("--list", action="store_true", help="list raster targets and exit")
+    add_pool_arguments(parser)
+    args = parser.parse_args()
+
+    if args.list:
+        for name in RASTER_TARGETS:
+            viewport, width, height = target_size(name)
+            print(f"  {name:<15} {width:>5} × {height:<5} (viewport {viewport['width']}×{viewport['height']})")
+        return
+    if args.backend == "cdp":
+        # Masters need page.pdf() and emulate_media(), which the direct CDP
+        # backend does not implement.
+        print("ERROR: vector masters need the Playwright backend (PDF printing); "
+              "drop --backend cdp.")
+        sys.exit(1)
+    if args.trace:
+        render_trace.enable(args.trace)
+    else:
+        render_trace.enable_from_env()
+    asyncio.run(enable_page_features(args))
+
+    locales = args.locale or available_locales()
+    targets = args.target or list(RASTER_TARGETS)
+    backend = rasterizer()
+    print("Vantag Vector Masters")
+    print(f"{'=' * 52}")
+
+    started = time.perf_counter()
+    masters, rasters = plan(locales, targets)
+    rendered = asyncio.run(ensure_masters(masters, args))
+    print(f"  Masters : {len(masters)} ({len(masters) - rendered} cached, {rendered} rendered)"
+          f" in {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    workers = args.workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        timings = [ms for _, ms in pool.map(rasterize, [(backend, *job) for job in rasters])]
+    elapsed = time.perf_counter() - started
+    print(f"  Rasters : {len(rasters)} PNGs via {backend} ({workers} workers) in {elapsed:.1f}s, "
+          f"{sum(timings) / max(1, len(timings)):.0f} ms each")
+    if render_trace.tracer.enabled:
+        render_trace.tracer.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Warm-start persistent browser profile.
+
+A plain chromium.launch() starts from an empty temporary profile, so every
+run re-discovers system fonts and re-parses/compiles everything from
+scratch. With --warm-profile the pool launches from a persistent profile
+under .screenshot_cache/browser_profiles/<key>/ instead, keeping Chromium's
+disk, V8 code and stylesheet caches (and a private fontconfig cache)
+between runs. CI can persist .screenshot_cache/ to carry them over.
+
+The key covers the Chromium build, the bundled fonts in scripts/fonts/,
+the system font directories and the launch flags; when any of them
+changes, the next run starts a fresh profile and the superseded one for
+the same backend/channel is deleted. Each run records its browser launch
+and first-frame times in the profile's meta.json: the first run on a new
+profile is the cold baseline, later runs are reported against it.
+
+Usage:
+    python3 scripts/generate_screenshots.py --warm-profile
+    python3 scripts/warm_profile.py                    # profiles + cold/warm times
+    python3 scripts/warm_profile.py --bench --runs 3   # fresh vs persistent, same job
+    python3 scripts/warm_profile.py --clear
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+# Bump when launch handling changes what a stored profile contains.
+PROFILE_VERSION = 1
+STALE_DAYS = 14
+KEEP_RUNS = 20
+
+SYSTEM_FONT_DIRS = ("/usr/share/fonts", "/usr/local/share/fonts", "/Library/Fonts",
+                    "~/.fonts", "~/.local/share/fonts", "~/Library/Fonts")
+
+current = None          # profile directory of this process's pools
+
+
+def profiles_dir() -> str:
+    from generate_screenshots import CACHE_DIR
+    return os.path.join(CACHE_DIR, "browser_profiles")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PROFILE KEY
+# ═══════════════════════════════════════════════════════════════════════════
+
+def chromium_build(backend: str, launch_options: dict) -> str:
+    """What identifies the Chromium binary a pool will launch."""
+    channel = launch_options.get("channel")
+    executable = launch_options.get("executable_path")
+    if backend == "cdp" or executable:
+        from cdp_backend import find_chromium
+        path = os.path.realpath(executable or find_chromium(channel))
+        st = os.stat(path)
+        return f"{path}|{st.st_size}|{st.st_mtime_ns}"
+    # Each Playwright release pins one Chromium revision per channel.
+    from launch_tuner import _playwright_version
+    return f"playwright {_playwright_version()}|{channel or 'headless-shell'}"
+
+
+def fonts_digest() -> str:
+    """Bundled font files plus the state of the system font directories."""
+    from font_assets import FONT_FILES, FONTS_DIR
+
+    h = hashlib.sha256()
+    for _, name, _ in FONT_FILES.values():
+        path = os.path.join(FONTS_DIR, name)
+        if os.path.exists(path):
+            st = os.stat(path)
+            h.update(f"{name}|{st.st_size}|{st.st_mtime_ns}\n".encode("utf-8"))
+    for directory in SYSTEM_FONT_DIRS:
+        directory = os.path.expanduser(directory)
+        if os.path.isdir(directory):
+            h.update(f"{directory}|{os.stat(directory).st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def profile_key(backend: str, launch_options: dict) -> tuple:
+    """(key, meta) for the profile matching this backend and launch."""
+    meta = {
+        "slot": f"{backend}|{launch_options.get('channel') or 'default'}",
+        "chromium": chromium_build(backend, launch_options),
+        "fonts": fonts_digest(),
+        "args": sorted(launch_options.get("args") or ()),
+    }
+    raw = json.dumps({"version": PROFILE_VERSION, **meta}, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16], meta
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# STORE
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _meta_path(path: str) -> str:
+    return os.path.join(path, "meta.json")
+
+
+def load_meta(path: str) -> dict:
+    try:
+        with open(_meta_path(path), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_meta(path: str, meta: dict):
+    tmp = _meta_path(path) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, _meta_path(path))
+
+
+def prune(keep: str, slot: str):
+    """Delete profiles superseded for `slot` and any unused for STALE_DAYS."""
+    root = profiles_dir()
+    cutoff = time.time() - STALE_DAYS * 86400
+    for key in os.listdir(root) if os.path.isdir(root) else ():
+        path = os.path.join(root, key)
+        if key == keep or not os.path.isdir(path):
+            continue
+        meta = load_meta(path)
+        if meta.get("slot") == slot or meta.get("last_used", 0) < cutoff:
+            shutil.rmtree(path, ignore_errors=True)
+            print(f"  Profile     : dropped stale {key}")
+
+
+def prepare(backend: str, launch_options: dict) -> tuple:
+    """(user_data_dir, env) of the persistent profile for this launch,
+    created if needed; the profile becomes `current` for report()."""
+    global current
+    key, meta = profile_key(backend, launch_options)
+    path = os.path.join(profiles_dir(), key)
+    os.makedirs(os.path.join(path, "chromium"), exist_ok=True)
+    os.makedirs(os.path.join(path, "xdg-cache"), exist_ok=True)
+    stored = load_meta(path)
+    if not stored:
+        stored = {**meta, "key": key, "created": time.strftime("%Y-%m-%d %H:%M"), "runs": []}
+    stored["last_used"] = time.time()
+    _save_meta(path, stored)
+    prune(key, meta["slot"])
+    current = path
+    # fontconfig keeps its cache under XDG_CACHE_HOME; Playwright replaces
+    # the browser's environment wholesale, so pass the rest along.
+    env = {**os.environ, "XDG_CACHE_HOME": os.path.join(path, "xdg-cache")}
+    return os.path.join(path, "chromium"), env
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TIMINGS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _summary(runs: list, kind: str) -> str:
+    launch = [r["launch_ms"] for r in runs if r["kind"] == kind and r["launch_ms"] is not None]
+    first = [r["first_frame_ms"] for r in runs
+             if r["kind"] == kind and r["first_frame_ms"] is not None]
+    if not launch:
+        return "n/a"
+    first_text = f"{statistics.median(first):.0f}" if first else "n/a"
+    return f"launch {statistics.median(launch):.0f} ms · first frame {first_text} ms"
+
+
+def report(pool, path: str = None):
+    """Record this pool's launch / first-frame times in the profile and print
+    them next to the cold baseline."""
+    path = path or current
+    if not path:
+        return
+    metrics = pool.metrics()
+    meta = load_meta(path)
+    runs = meta.setdefault("runs", [])
+    kind = "warm" if runs else "cold"
+    runs.append({
+        "kind": kind,
+        "at": time.strftime("%Y-%m-%d %H:%M"),
+        "launch_ms": None if metrics["launch_ms"] is None else round(metrics["launch_ms"], 1),
+        "first_frame_ms": (None if metrics["first_frame_ms"] is None
+                           else round(metrics["first_frame_ms"], 1)),
+    })
+    cold = [r for r in runs if r["kind"] == "cold"]
+    meta["runs"] = cold[:1] + [r for r in runs if r["kind"] != "cold"][-(KEEP_RUNS - 1):]
+    _save_meta(path, meta)
+    print(f"  Profile     : {kind} — {_summary(runs[-1:], kind)}"
+          + (f" (cold: {_summary(cold, 'cold')})" if kind == "warm" else ""))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════
+
+async def time_first_frame(args, user_data_dir: str, env: dict) -> dict:
+    """Launch a one-page pool on a profile and render the first frame."""
+    import frames
+    from browser_pool import BrowserPool
+    from generate_screenshots import frame_html, load_backend, pool_options, render_png
+
+    options = pool_options(args)
+    options.update(concurrency=1, user_data_dir=user_data_dir,
+                   launch_options={**options["launch_options"], "env": env})
+    spec = frames.load(frames.select(args.only)[0])
+    async with load_backend(args)() as p:
+        async with BrowserPool(p, **options) as pool:
+            await render_png(pool, frame_html(spec), {"frame": spec.name})
+            return pool.metrics()
+
+
+def bench(args) -> dict:
+    from generate_screenshots import pool_options
+
+    options = pool_options(args)
+    profile, env = prepare(args.backend, options["launch_options"])
+    asyncio.run(time_first_frame(args, profile, env))           # populate the caches
+    times = {"cold": [], "warm": []}
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory(prefix="vantag-cold-") as fresh:
+            cold_env = {**os.environ, "XDG_CACHE_HOME": os.path.join(fresh, "xdg-cache")}
+            times["cold"].append(asyncio.run(
+                time_first_frame(args, os.path.join(fresh, "chromium"), cold_env)))
+        times["warm"].append(asyncio.run(time_first_frame(args, profile, env)))
+    return times
+
+
+def main():
+    from generate_screenshots import add_pool_arguments
+
+    parser = argparse.ArgumentParser(description="Persistent browser profiles.")
+    add_pool_arguments(parser)
+    parser.add_argument("--only", nargs="+", metavar="GLOB",
+                        help="frame rendered for --bench (default: the first)")
+    parser.add_argument("--bench", action="store_true",
+                        help="time launch + first frame on a fresh vs the persistent profile")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--clear", action="store_true", help="delete every stored profile")
+    args = parser.parse_args()
+
+    print("Vantag Warm Browser Profiles")
+    print(f"{'=' * 52}")
+    root = profiles_dir()
+
+    if args.clear:
+        shutil.rmtree(root, ignore_errors=True)
+        print(f"  Removed {root}")
+        return
+
+    if args.bench:
+        from generate_screenshots import enable_page_features
+        asyncio.run(enable_page_features(args))
+        times = bench(args)
+        for kind, runs in times.items():
+            launch = statistics.median(m["launch_ms"] for m in runs)
+            first = statistics.median(m["first_frame_ms"] for m in runs)
+            print(f"  {kind:<5} launch {launch:7.0f} ms · first frame {first:7.0f} ms")
+        cold = statistics.median(m["first_frame_ms"] for m in times["cold"])
+        warm = statistics.median(m["first_frame_ms"] for m in times["warm"])
+        print(f"  Warm start: {cold / warm:.2f}× faster to the first frame")
+        return
+
+    keys = sorted(os.listdir(root)) if os.path.isdir(root) else []
+    if not keys:
+        print("  No profiles yet; run generate_screenshots.py --warm-profile")
+        return
+    for key in keys:
+        meta = load_meta(os.path.join(root, key))
+        runs = meta.get("runs", [])
+        print(f"  {key}  {meta.get('slot', '?'):<22} created {meta.get('created', '?')}, "
+              f"{len(runs)} run(s)")
+        print(f"    chromium {meta.get('chromium', '?')}")
+        print(f"    cold: {_summary(runs, 'cold')}")
+        print(f"    warm: {_summary(runs, 'warm')}")
+
+
+if __name__ == "__main__":
+    main()